@@ -0,0 +1,138 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+"""
+collective_bench, 集合通信benchmark公共驱动
+按几何级数扫描消息大小, 统计每个大小的耗时、algbw与busbw, rank 0输出json/csv结果表.
+消息大小b沿用原有定义: 每张卡的数据量为b / world_size, algbw = b / time, 与base_value可比;
+busbw按nccl-tests的定义计算: busbw = S / time * factor, S为该集合通信的标准数据量, factor见BUS_FACTOR.
+无GPU时使用gloo后端(CPU多进程)执行, gloo不支持的接口跳过
+"""
+import argparse
+import csv
+import json
+import os
+import time
+import traceback
+
+import paddle
+import paddle.distributed as dist
+
+# nccl-tests的busbw修正系数, n为卡数
+BUS_FACTOR = {
+    "all_reduce": lambda n: 2.0 * (n - 1) / n,
+    "all_gather": lambda n: (n - 1) / n,
+    "reduce_scatter": lambda n: (n - 1) / n,
+    "alltoall": lambda n: (n - 1) / n,
+    "broadcast": lambda n: 1.0,
+    "reduce": lambda n: 1.0,
+}
+
+
+def parse_args(default_case):
+    """命令行参数"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--case_name", default=default_case)
+    parser.add_argument("--begin", type=int, default=1024, help="最小消息大小(B), 默认1KB")
+    parser.add_argument("--end", type=int, default=134217728, help="最大消息大小(B), 默认128MB")
+    parser.add_argument("--factor", type=int, default=2, help="消息大小的几何级数公比")
+    parser.add_argument("--warms", type=int, default=5)
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--output", default="bench_result", help="结果表输出目录")
+    return parser.parse_args()
+
+
+def message_sizes(begin, end, factor=2):
+    """[begin, end]内按公比factor递增的消息大小"""
+    sizes = []
+    b = begin
+    while b <= end:
+        sizes.append(b)
+        b *= factor
+    return sizes
+
+
+def size_name(b):
+    """消息大小的展示名, 与base_value一致"""
+    if b < 1048576:  # 1MB
+        return str(b // 1024) + "KB"
+    return str(b // 1024 // 1024) + "MB"
+
+
+def full(shape, value):
+    """直接分配float32 buffer, 避免先构造python list"""
+    return paddle.full(shape if isinstance(shape, list) else [shape], value, "float32")
+
+
+def synchronize():
+    """等待设备上的计算完成, CPU(gloo)下collective本身是同步的"""
+    if paddle.is_compiled_with_cuda():
+        paddle.device.cuda.synchronize()
+
+
+def timeit(func, warms, epochs):
+    """单次执行的平均耗时(s)"""
+    for i in range(warms):
+        func()
+    synchronize()
+    start = time.perf_counter()
+    for i in range(epochs):
+        func()
+    synchronize()
+    return (time.perf_counter() - start) / epochs
+
+
+def run_sweep(collective, case_name, build, args):
+    """
+    扫描消息大小并计时
+    :param collective: 集合通信名称, 用于选择busbw系数
+    :param build: build(n_ele, nranks) -> (func, nbytes), func执行一次通信, nbytes为nccl-tests定义的数据量S
+    :return: {case_name: {size_name: {"time", "algbw", "busbw"}}}
+    """
+    dist.init_parallel_env()
+    nranks = dist.get_world_size()
+    time_list = {case_name: {}}
+    rows = []
+    for b in message_sizes(args.begin, args.end, args.factor):
+        n_ele = b // 4 // nranks
+        num = size_name(b)
+        try:
+            func, nbytes = build(n_ele, nranks)
+            cost = timeit(func, args.warms, args.epochs)
+        except NotImplementedError as e:
+            print("{} skipped: {}".format(case_name, str(e).split("\n")[0]))
+            break
+        except Exception:
+            # 单个消息大小失败(如显存不足)只跳过该大小, 不中断整个扫描
+            print("{} {} failed:\n{}".format(case_name, num, traceback.format_exc()))
+            continue
+        algbw = b / 1_000_000_000 / cost
+        busbw = nbytes / 1_000_000_000 / cost * BUS_FACTOR[collective](nranks)
+        time_list[case_name][num] = {"time": cost, "algbw": algbw, "busbw": busbw}
+        rows.append(
+            {
+                "collective": collective,
+                "case": case_name,
+                "size": num,
+                "bytes": b,
+                "nranks": nranks,
+                "time_us": cost * 1e6,
+                "algbw": algbw,
+                "busbw": busbw,
+            }
+        )
+    if dist.get_rank() == 0:
+        dump_table(args.output, case_name, rows)
+    return time_list
+
+
+def dump_table(output, case_name, rows):
+    """rank 0写出本次运行的结果表, 同时输出json与csv便于趋势对比"""
+    os.makedirs(output, exist_ok=True)
+    with open(os.path.join(output, case_name + ".json"), "w") as f:
+        json.dump(rows, f, indent=2)
+    with open(os.path.join(output, case_name + ".csv"), "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=["collective", "case", "size", "bytes", "nranks", "time_us", "algbw", "busbw"]
+        )
+        writer.writeheader()
+        writer.writerows(rows)
@@ -3,17 +3,14 @@
 """
 reduce_scatter
 """
-import argparse
-import time
 import yaml
 
 import paddle
 import paddle.distributed as dist
 
+from collective_bench import full, parse_args, run_sweep
 
-parser = argparse.ArgumentParser()
-parser.add_argument("--case_name", default="reduce_scatter_legacy_sync")
-args = parser.parse_args()
+args = parse_args("reduce_scatter_legacy_sync")
 case_name = args.case_name
 
 f = open("config.yaml", "rb")
@@ -27,77 +24,25 @@ def get_res(case, config):
     use_calc_stream = yaml_config[case_name]["use_calc_stream"]
     is_tensor = yaml_config[case_name]["is_tensor"]
 
-    dist.init_parallel_env()
-
-    # args
-    warms = 5
-    epochs = 20
-    devices = 8
-    byte_to_test = [134217728]  # 128MB
-    # byte_to_test = []
-    # b = 1024 # 1KB
-    # e = 134217728  # 128M
-    # while b <= e:
-    #     byte_to_test.append(b)
-    #     b *= 2
-
-    time_list = {case_name: {}}
-    for b in byte_to_test:
-        n_ele = b // 4 // devices
-
-        if dist.get_rank() == 0:
-            data = paddle.to_tensor([0] * n_ele, "float32")
-        else:
-            data = paddle.to_tensor([1] * n_ele, "float32")
-
+    def build(n_ele, devices):
+        """构建单个消息大小的buffer与通信函数, 返回(通信函数, busbw统计的数据量)"""
+        data = full(n_ele, 0 if dist.get_rank() == 0 else 1)
         if is_legacy is True:
-            tensor_list = [paddle.to_tensor([0] * n_ele, "float32") for i in range(devices)]
-            # warmup
-            for i in range(warms):
-                dist.reduce_scatter(data, tensor_list, sync_op=sync_op)
-            paddle.device.cuda.synchronize()  # 等待给定的 CUDA 设备上的计算完成
-            # stats
-            start = time.perf_counter()  # 返回当前的计算机系统时间
-            for i in range(epochs):
-                dist.reduce_scatter(data, tensor_list, sync_op=sync_op)
-            paddle.device.cuda.synchronize()
-            cost = (time.perf_counter() - start) / epochs
-        else:
-            if is_tensor is True:
-                tensor = paddle.to_tensor([0] * n_ele * devices, "float32")
-                # warmup
-                for i in range(warms):
-                    dist.stream.reduce_scatter(data, tensor, sync_op=sync_op, use_calc_stream=use_calc_stream)
-                paddle.device.cuda.synchronize()
-                # stats
-                start = time.perf_counter()
-                for i in range(epochs):
-                    dist.stream.reduce_scatter(data, tensor, sync_op=sync_op, use_calc_stream=use_calc_stream)
-                paddle.device.cuda.synchronize()
-                cost = (time.perf_counter() - start) / epochs
-            else:
-                tensor_list = [paddle.to_tensor([0] * n_ele, "float32") for i in range(devices)]
-                # warmup
-                for i in range(warms):
-                    dist.stream.reduce_scatter(data, tensor_list, sync_op=sync_op, use_calc_stream=use_calc_stream)
-                paddle.device.cuda.synchronize()
-                # stats
-                start = time.perf_counter()
-                for i in range(epochs):
-                    dist.stream.reduce_scatter(data, tensor_list, sync_op=sync_op, use_calc_stream=use_calc_stream)
-                paddle.device.cuda.synchronize()
-                cost = (time.perf_counter() - start) / epochs
-
-        # print(f'data: {b} B, time: {cost} s, algbw: {b/1_000_000_000/cost} GB/s')
-        if b < 1048576:  # 1MB
-            num = str(b // 1024) + "KB"
-        else:
-            num = str(b // 1024 // 1024) + "MB"
-        time_list[case_name][num] = {}
-        time_list[case_name][num]["time"] = cost
-        time_list[case_name][num]["algbw"] = b / 1_000_000_000 / cost
-    # print(time_list)
-    return time_list
+            tensor_list = [full(n_ele, 0) for i in range(devices)]
+            return lambda: dist.reduce_scatter(data, tensor_list, sync_op=sync_op), n_ele * 4 * devices
+        if is_tensor is True:
+            tensor = full(n_ele * devices, 0)
+            return (
+                lambda: dist.stream.reduce_scatter(data, tensor, sync_op=sync_op, use_calc_stream=use_calc_stream),
+                n_ele * 4 * devices,
+            )
+        tensor_list = [full(n_ele, 0) for i in range(devices)]
+        return (
+            lambda: dist.stream.reduce_scatter(data, tensor_list, sync_op=sync_op, use_calc_stream=use_calc_stream),
+            n_ele * 4 * devices,
+        )
+
+    return run_sweep("reduce_scatter", case_name, build, args)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 """
 run.py
 """
+import argparse
 import subprocess
 import os
 
@@ -34,18 +35,16 @@ def get_average(file_loops, case):
             for key, value in eval(line).items():
                 for num, item in value.items():
                     if num not in counters:
-                        counters[num] = {"time": 1, "algbw": 1}
-                        averages[num] = {"time": item["time"], "algbw": item["algbw"]}
-                    else:
-                        counters[num]["time"] += 1
-                        counters[num]["algbw"] += 1
-                        averages[num]["time"] += item["time"]
-                        averages[num]["algbw"] += item["algbw"]
-
-    # 计算每个数字对应的平均值
+                        counters[num] = {metric: 0 for metric in item}
+                        averages[num] = {metric: 0 for metric in item}
+                    for metric, v in item.items():
+                        counters[num][metric] += 1
+                        averages[num][metric] += v
+
+    # 计算每个数字对应的平均值, 包括time、algbw与busbw
     for key, value in counters.items():
-        averages[key]["time"] /= counters[key]["time"]
-        averages[key]["algbw"] /= counters[key]["algbw"]
+        for metric in value:
+            averages[key][metric] /= counters[key][metric]
 
     # 关闭文件
     f.close()
@@ -72,6 +71,9 @@ def compare(case, res_dict):
     diff_exp = {}
     for key, value in res_dict.items():
         for num, item in value.items():
+            # 扫描的消息大小可能多于base_value中记录的大小, 无基线的大小不做对比
+            if num not in base_dict[key]:
+                continue
             time_diff = round((item["time"] - base_dict[key][num]["time"]) / base_dict[key][num]["time"] * 100, 2)
             algbw_diff = round((item["algbw"] - base_dict[key][num]["algbw"]) / base_dict[key][num]["algbw"] * 100, 2)
             diff_dict[num] = {"time": str(time_diff) + "%", "algbw": str(algbw_diff) + "%"}
@@ -109,8 +111,8 @@ def gather_dict(case):
             if line.find("'" + case + "'") != -1:
                 all_dict[key] = eval(line.strip("\n"))[case]
                 for num, item in all_dict[key].items():
-                    all_dict[key][num]["time_" + key] = all_dict[key][num].pop("time")
-                    all_dict[key][num]["algbw_" + key] = all_dict[key][num].pop("algbw")
+                    for metric in list(item):
+                        item[metric + "_" + key] = item.pop(metric)
     f.close()
     # print(all_dict)
 
@@ -138,7 +140,16 @@ def gather_dict(case):
     return result
 
 
-def main():
+def launch_cmd(api, case, args):
+    """分布式启动命令, GPU按卡启动, CPU使用gloo后端启动nproc个进程"""
+    if args.device == "cpu":
+        launch = "python -m paddle.distributed.launch --nproc_per_node={} ".format(args.nproc)
+    else:
+        launch = "python -m paddle.distributed.launch --devices={} ".format(",".join(str(i) for i in range(args.nproc)))
+    return launch + api + ".py --case_name " + case + " " + args.bench_args
+
+
+def main(args):
     """main"""
     f = open("config.yaml", "rb")
     yaml_config = yaml.load(f, Loader=yaml.FullLoader)
@@ -146,7 +157,7 @@ def main():
     for key, value in yaml_config.items():
         if key in api_list:
             for case in value.keys():
-                cmd = "python -m paddle.distributed.launch --devices=0,1,2,3,4,5,6,7 " + key + ".py --case_name " + case
+                cmd = launch_cmd(key, case, args)
                 print(cmd)
                 for i in range(loops):
                     pro = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
@@ -163,5 +174,9 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--device", default="gpu", choices=["gpu", "cpu"])
+    parser.add_argument("--nproc", type=int, default=8, help="卡数或CPU进程数")
+    parser.add_argument("--bench_args", default="", help='透传给单个api脚本的参数, 如"--begin 1024 --end 1048576"')
     os.system("rm -rf mylog && mkdir -p mylog")
-    main()
+    main(parser.parse_args())
@@ -6,7 +6,10 @@
 """
 from inspect import isfunction
 import copy
+import atexit
 import logging
+import time
+from collections import OrderedDict, defaultdict
 import pytest
 import numpy as np
 import paddle
@@ -49,6 +52,12 @@ class APIBase(object):
         # calculate grad delta, You can rewrite these value
         self.delta = 1e-6
         self.gap = 0.001
+        # numeric grad: 是否使用中心差分, 是否尝试批量前向, 以及批量前向时单次输入的最大元素数
+        self.central_grad = False
+        self.grad_batch = True
+        self.grad_batch_numel = 2**22
+        # 相同输入签名的静态图复用program与Executor
+        self.static_cache = True
         self.rtol = 1e-7
         # choose layertypes [functional or classional]
         self._layertypes(func)
@@ -472,7 +481,6 @@ class APIBase(object):
         paddle.disable_static(self.place)
         logging.info("[grad] compute " + self.__class__.__name__ + " grad")
         self._check_params(res, data, **kwargs)
-        loss = self._numeric_grad()
         self.kwargs = copy.deepcopy(kwargs)
         numeric_grad = {}
         for k, v in self.kwargs.items():
@@ -488,67 +496,184 @@ class APIBase(object):
         if data is None:
             for k, v in self.kwargs.items():
                 if isinstance(v, paddle.Tensor) and k not in self.no_grad_var:
-                    grad = []
-                    shape = v.numpy().shape
-                    for i in range(len(v.numpy().flatten())):
-                        tmp = v.numpy().flatten()
-                        tmp[i] = tmp[i] + self.gap
-                        tmp = tmp.reshape(shape)
-                        # print(tmp)
-                        self.kwargs[k] = to_tensor(tmp.astype(self.dtype))
-                        # enable compute gradient
-                        if self.enable_backward is True:
-                            self.kwargs[k].stop_gradient = False
-                        loss_delta = self._numeric_grad()
-                        g = (loss_delta - loss) / self.gap
-                        # print("-----> {}".format(g))
-                        grad.append(g.item())
-                        # recover v to self.kwargs
-                        self.kwargs[k] = v
-                    numeric_grad[k] = np.array(grad).reshape(shape)
+                    numeric_grad[k] = self._numeric_grad_of(v.numpy(), k)
+                    # recover v to self.kwargs
+                    self.kwargs[k] = v
         else:
             # change data to correct dtype
             data = data.astype(self.dtype)
-            grad = []
-            shape = data.shape
-            for i in range(len(data.flatten())):
-                tmp = copy.deepcopy(data.flatten())
-                tmp[i] = tmp[i] + self.gap
-                tmp = tmp.reshape(shape)
-                self.data = to_tensor(tmp.astype(self.dtype))
-                # enable compute gradient
-                if self.enable_backward is True:
-                    self.data.stop_gradient = False
-                loss_delta = self._numeric_grad()
-                g = (loss_delta - loss) / self.gap
-                grad.append(g.item())
-                # recover v to self.kwargs
-                self.data = data
-            numeric_grad["data"] = np.array(grad).reshape(shape)
+            numeric_grad["data"] = self._numeric_grad_of(data)
+            self.data = data
         paddle.enable_static()
         return numeric_grad
 
-    def _numeric_grad(self):
+    def _numeric_forward(self):
         """
-        _numeric_grad
+        _numeric_forward, 多输出时取第一个输出
         Returns:
             result
         """
         if self.__layertype == "func":
             res = self.func(**self.kwargs)
-            if isinstance(res, (list, tuple)):
-                loss = paddle.mean(res[0]).numpy()
-            else:
-                loss = paddle.mean(res).numpy()
-            return loss
         elif self.__layertype == "class":
             obj = self.func(**self.kwargs)
             res = obj(self.data)
-            if isinstance(res, (list, tuple)):
-                loss = paddle.mean(res[0]).numpy()
+        if isinstance(res, (list, tuple)):
+            res = res[0]
+        return res
+
+    def _numeric_grad(self):
+        """
+        _numeric_grad
+        Returns:
+            result
+        """
+        return paddle.mean(self._numeric_forward()).numpy()
+
+    def _set_grad_input(self, value, k=None, n=None):
+        """
+        写回数值梯度的扰动输入: k为None时写回self.data, 否则写回self.kwargs[k], 列表输入写回self.kwargs[k][n]
+        """
+        value = to_tensor(value)
+        # enable compute gradient
+        if self.enable_backward is True:
+            value.stop_gradient = False
+        if k is None:
+            self.data = value
+        elif isinstance(n, int):
+            self.kwargs[k][n] = value
+        else:
+            self.kwargs[k] = value
+
+    @staticmethod
+    def _grad_batch_input(rows, mode):
+        """
+        多份扰动输入组成一次前向的输入: "stack"在第0维前新增batch维, "concat"沿第0维拼接
+        """
+        if mode == "concat":
+            return rows.reshape((rows.shape[0] * rows.shape[1],) + rows.shape[2:])
+        return rows
+
+    def _grad_batch_mode(self, base, k=None, n=None):
+        """
+        探测api能否一次前向计算多份扰动输入, 两份不同输入的批量输出与逐份输出一致才使用批量计算
+        Returns:
+            "stack", "concat" or None, 未扰动输入的前向输出, 以及单次逐份前向的耗时
+        """
+        if base.dtype not in (np.float32, np.float64) or base.size < 2:
+            return None, None, None
+        noise = np.random.RandomState(self.seed).uniform(-1, 1, base.shape) * 10 * self.gap
+        probe = np.stack([base, (base + noise).astype(base.dtype)])
+        try:
+            expect = []
+            cost = []
+            for row in probe:
+                begin = time.perf_counter()
+                self._set_grad_input(row, k, n)
+                expect.append(self._numeric_forward().numpy())
+                cost.append(time.perf_counter() - begin)
+            expect = np.stack(expect)
+        except Exception:
+            return None, None, None
+        for mode in ("stack", "concat"):
+            if mode == "concat" and base.ndim == 0:
+                continue
+            try:
+                self._set_grad_input(self._grad_batch_input(probe, mode), k, n)
+                res = self._numeric_forward().numpy()
+            except Exception:
+                continue
+            if res.size == expect.size and self._grad_batch_close(res.reshape(expect.shape), expect):
+                return mode, expect[0], min(cost)
+        return None, None, None
+
+    @staticmethod
+    def _grad_batch_close(x, y):
+        """批量前向与逐份前向的输出是否一致"""
+        tol = 1e-4 if x.dtype == np.float32 else 1e-10
+        return np.allclose(x, y, rtol=tol, atol=tol, equal_nan=True)
+
+    def _numeric_grad_batch(self, base, mode, expect, cost, k=None, n=None):
+        """
+        批量计算数值梯度, 每批第0行为未扰动的输入: 前向差分中作为基准loss, 同时用于校验批量前向与逐份前向一致.
+        校验失败(例如api沿batch维做了归约), 或首批折算到每个元素的耗时不低于逐元素前向(cost)时返回None
+        """
+        size = base.size
+        flat = base.reshape(-1)
+        pos = (flat.astype(np.float64) + self.gap).astype(base.dtype)
+        neg = (flat.astype(np.float64) - self.gap).astype(base.dtype)
+        grad = np.empty(size)
+        chunk = max(min(self.grad_batch_numel // size, size), 1)
+        buf = np.empty((2 * chunk + 1 if self.central_grad else chunk + 1, size), dtype=base.dtype)
+        buf[:] = flat
+        for start in range(0, size, chunk):
+            begin = time.perf_counter()
+            idx = np.arange(start, min(start + chunk, size))
+            rows = np.arange(1, len(idx) + 1)
+            count = 2 * len(idx) + 1 if self.central_grad else len(idx) + 1
+            buf[rows, idx] = pos[idx]
+            if self.central_grad:
+                buf[rows + len(idx), idx] = neg[idx]
+            self._set_grad_input(self._grad_batch_input(buf[:count].reshape((count,) + base.shape), mode), k, n)
+            res = self._numeric_forward()
+            if res.size != count * expect.size:
+                return None
+            res = res.numpy().reshape(count, -1)
+            if not self._grad_batch_close(res[0], expect.reshape(-1)):
+                return None
+            # 各行先与基准行逐元素作差再求均值: 各行分别归约时舍入误差互不相关, 低精度下会淹没扰动带来的变化
+            if self.central_grad:
+                grad[idx] = (res[1 : len(idx) + 1] - res[len(idx) + 1 :]).mean(axis=1, dtype=np.float64) / self.gap / 2
+            else:
+                grad[idx] = (res[1:] - res[0]).mean(axis=1, dtype=np.float64) / self.gap
+            # 还原本批扰动的元素, buffer供下一批复用
+            buf[rows, idx] = flat[idx]
+            if self.central_grad:
+                buf[rows + len(idx), idx] = flat[idx]
+            # 输入较大而api本身很轻时, 批量输入的拷贝开销超过逐元素前向的调度开销, 此时改为逐元素计算
+            if start == 0 and size > chunk and time.perf_counter() - begin >= cost * (count - 1):
+                return None
+        return grad.reshape(base.shape)
+
+    def _numeric_grad_of(self, base, k=None, n=None):
+        """
+        逐元素差分计算base的数值梯度
+        central_grad为True时使用中心差分(f(x+h)-f(x-h))/2h, 否则使用前向差分(f(x+h)-f(x))/h.
+        grad_batch为True且api支持批量前向时, 每次前向计算一批扰动输入(单次最多grad_batch_numel个元素), 否则逐元素计算; 扰动输入复用同一块buffer
+        Args:
+            base (numpy.ndarray): 输入值
+            k (str, optional): 输入在self.kwargs中的key, None表示self.data
+            n (int, optional): 列表输入的下标
+        Returns:
+            numpy.ndarray, 与base形状一致
+        """
+        mode, expect, cost = self._grad_batch_mode(base, k, n) if self.grad_batch else (None, None, None)
+        if mode is not None:
+            grad = self._numeric_grad_batch(base, mode, expect, cost, k, n)
+            if grad is not None:
+                return grad
+
+        size = base.size
+        flat = base.reshape(-1)
+        pos = (flat.astype(np.float64) + self.gap).astype(base.dtype)
+        neg = (flat.astype(np.float64) - self.gap).astype(base.dtype)
+        grad = np.empty(size)
+        buf = flat.copy()
+        if not self.central_grad:
+            self._set_grad_input(base, k, n)
+            loss = self._numeric_grad()
+        for i in range(size):
+            buf[i] = pos[i]
+            self._set_grad_input(buf.reshape(base.shape), k, n)
+            loss_pos = self._numeric_grad()
+            if self.central_grad:
+                buf[i] = neg[i]
+                self._set_grad_input(buf.reshape(base.shape), k, n)
+                grad[i] = ((loss_pos - self._numeric_grad()) / self.gap / 2).item()
             else:
-                loss = paddle.mean(res).numpy()
-            return loss
+                grad[i] = ((loss_pos - loss) / self.gap).item()
+            buf[i] = flat[i]
+        return grad.reshape(base.shape)
 
     def _dygraph_forward(self):
         """
@@ -591,7 +716,79 @@ class APIBase(object):
 
     def _static_forward(self, res, data=None, **kwargs):
         """
-        _static_forward
+        _static_forward, 输入签名相同的静态图从static_program_cache中复用
+        """
+        module = self.__class__.__module__
+        key = self._static_cache_key(data, **kwargs)
+        entry = static_program_cache.get(key)
+        if entry is not None:
+            run, cost = entry
+            start = time.perf_counter()
+            res = run(data, kwargs)
+            static_program_cache.record(module, hit=True, saved=cost - (time.perf_counter() - start))
+            return res
+        start = time.perf_counter()
+        run = self._static_build(data, **kwargs)
+        res = run(data, kwargs)
+        static_program_cache.put(key, run, time.perf_counter() - start)
+        static_program_cache.record(module, hit=False)
+        return res
+
+    def _static_cache_key(self, data=None, **kwargs):
+        """
+        静态图缓存key, 参数无法按值区分(例如repr中带内存地址)时返回None, 不缓存
+        """
+        if not self.static_cache:
+            return None
+        # class类型且未传入data时, 前向使用的是self.data中已有的值, 无法按输入签名复用
+        if self.__layertype == "class" and data is None:
+            return None
+        spec = []
+        try:
+            for k, v in list(kwargs.items()) + [("data", data)]:
+                if isinstance(v, (np.generic, np.ndarray)):
+                    # 作为static.data喂入的输入只需shape与dtype一致
+                    spec.append((k, np.shape(v), np.asarray(v).dtype.str))
+                else:
+                    spec.append((k, self._static_cache_value(v)))
+        except TypeError:
+            return None
+        return (
+            self.__class__,
+            self.func,
+            self.__layertype,
+            np.dtype(self.dtype).str,
+            str(self.place),
+            self.enable_backward,
+            tuple(self.no_grad_var or ()),
+            self.seed,
+            paddle.framework.in_pir_mode(),
+            tuple(spec),
+        )
+
+    @staticmethod
+    def _static_cache_value(v):
+        """
+        非输入参数按值生成key, 嵌套的numpy数组会作为常量写入program, 需按内容区分
+        """
+        if isinstance(v, (np.generic, np.ndarray)):
+            return (np.shape(v), np.asarray(v).dtype.str, np.asarray(v).tobytes())
+        if isinstance(v, (list, tuple)):
+            return (type(v).__name__,) + tuple(APIBase._static_cache_value(i) for i in v)
+        if isinstance(v, dict):
+            return ("dict",) + tuple((k, APIBase._static_cache_value(i)) for k, i in v.items())
+        if isinstance(v, paddle.Tensor):
+            raise TypeError("paddle.Tensor is not cacheable")
+        r = repr(v)
+        if " at 0x" in r:
+            raise TypeError("{} is not cacheable".format(r))
+        return (type(v).__name__, r)
+
+    def _static_build(self, data=None, **kwargs):
+        """
+        构建静态图program与Executor
+        Returns:
+            run(data, kwargs): 喂入输入执行program, 返回值与_static_forward一致
         """
         if self.__layertype == "func":
             paddle.seed(self.seed)
@@ -600,15 +797,7 @@ class APIBase(object):
             params = copy.deepcopy(kwargs)
             with paddle.utils.unique_name.guard():
                 with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
-                    # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
                     xyz = []
-                    for k, v in kwargs.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                kwargs[k] = v
-                            else:
-                                kwargs[k] = v.astype(self.dtype)
                     for k, v in params.items():
                         if isinstance(v, (np.generic, np.ndarray)):
                             # no_grad_Var不需要转换类型
@@ -621,32 +810,36 @@ class APIBase(object):
                             if self.enable_backward is True:
                                 params[k].stop_gradient = False
                     output = self.func(**params)
+                    fetch_list = [output]
                     if self.enable_backward:
                         loss = paddle.mean(output)
                         grad_var = {}
                         for k in xyz:
                             grad_var[k] = paddle.static.gradients(loss, params[k])
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        # print(list(grad_var.values()))
-                        # print([output] + list(grad_var.values()))
-                        res = exe.run(
-                            main_program,
-                            feed=kwargs,
-                            fetch_list=[output]
-                            + [value for (key, value) in grad_var.items() if key not in self.no_grad_var],
-                            return_numpy=True,
-                        )
-                        # combine grad
-                        grad = dict(zip(xyz, res[1:]))
-                        return res[0], grad
-                    else:
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        # print(list(grad_var.values()))
-                        # print([output] + list(grad_var.values()))
-                        res = exe.run(main_program, feed=kwargs, fetch_list=[output], return_numpy=True)
-                        return res[0]
+                        fetch_list += [value for (key, value) in grad_var.items() if key not in self.no_grad_var]
+                    exe = paddle.static.Executor(self.place)
+
+            def run(data, kwargs):
+                """
+                func: 喂入kwargs中的输入执行program
+                """
+                feed = dict(kwargs)
+                for k, v in feed.items():
+                    if isinstance(v, (np.generic, np.ndarray)):
+                        # no_grad_Var不需要转换类型
+                        if not (self.no_grad_var is not None and k in self.no_grad_var):
+                            feed[k] = v.astype(self.dtype)
+                paddle.seed(self.seed)
+                with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
+                    exe.run(startup_program)
+                    res = exe.run(main_program, feed=feed, fetch_list=fetch_list, return_numpy=True)
+                if self.enable_backward:
+                    # combine grad
+                    grad = dict(zip(xyz, res[1:]))
+                    return res[0], grad
+                return res[0]
+
+            return run
         elif self.__layertype == "class":
             main_program = paddle.static.Program()
             startup_program = paddle.static.Program()
@@ -655,14 +848,6 @@ class APIBase(object):
             params = copy.deepcopy(kwargs)
             with paddle.utils.unique_name.guard():
                 with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
-                    # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
-                    for k, v in kwargs.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                kwargs[k] = v
-                            else:
-                                kwargs[k] = v.astype(self.dtype)
                     for k, v in params.items():
                         if isinstance(v, (np.generic, np.ndarray)):
                             # no_grad_Var不需要转换类型
@@ -674,26 +859,93 @@ class APIBase(object):
                             if self.enable_backward is True:
                                 params[k].stop_gradient = False
                     if data is not None:
-                        data = data.astype(self.dtype)
                         self.data = paddle.static.data(name="data", shape=data.shape, dtype=self.dtype)
                         if self.enable_backward is True:
                             self.data.stop_gradient = False
-                    data = dict({"data": data}, **kwargs)
                     obj = self.func(**params)
                     output = obj(self.data)
+                    fetch_list = [output]
                     if self.enable_backward:
                         loss = paddle.mean(output)
-                        g = paddle.static.gradients(loss, self.data)
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        res = exe.run(main_program, feed=data, fetch_list=[output, g], return_numpy=True)
-                        grad = {"data": res[1]}
-                        return res[0], grad
-                    else:
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        res = exe.run(main_program, feed=data, fetch_list=[output], return_numpy=True)
-                        return res[0]
+                        fetch_list.append(paddle.static.gradients(loss, self.data))
+                    exe = paddle.static.Executor(self.place)
+
+            def run(data, kwargs):
+                """
+                class: 喂入data与kwargs中的输入执行program
+                """
+                feed = dict(kwargs)
+                for k, v in feed.items():
+                    if isinstance(v, (np.generic, np.ndarray)):
+                        # no_grad_Var不需要转换类型
+                        if not (self.no_grad_var is not None and k in self.no_grad_var):
+                            feed[k] = v.astype(self.dtype)
+                feed = dict({"data": data.astype(self.dtype) if data is not None else data}, **feed)
+                with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
+                    exe.run(startup_program)
+                    res = exe.run(main_program, feed=feed, fetch_list=fetch_list, return_numpy=True)
+                if self.enable_backward:
+                    grad = {"data": res[1]}
+                    return res[0], grad
+                return res[0]
+
+            return run
+
+
+class StaticProgramCache(object):
+    """
+    静态图program缓存, LRU淘汰.
+    输入shape/dtype、非输入参数、place、反向开关以及pir模式均相同时, 复用已构建的program与Executor, 只喂入新的输入
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        # 按测试模块统计: [命中次数, 未命中次数, 节省的静态图构建耗时(秒)]
+        self.stats = defaultdict(lambda: [0, 0, 0.0])
+
+    def get(self, key):
+        """
+        Returns:
+            (run, cost) or None, cost为构建并首次执行的耗时
+        """
+        if key is None or key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, run, cost):
+        """
+        写入缓存, 超出maxsize时淘汰最久未使用的program
+        """
+        if key is None:
+            return
+        self.entries[key] = (run, cost)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def record(self, module, hit, saved=0.0):
+        """
+        记录一次命中或未命中
+        """
+        stat = self.stats[module]
+        if hit:
+            stat[0] += 1
+            stat[2] += max(saved, 0.0)
+        else:
+            stat[1] += 1
+
+    def report(self):
+        """
+        按测试模块打印命中情况与节省的构建耗时
+        """
+        for module, (hits, misses, saved) in sorted(self.stats.items()):
+            print("[static program cache] {}: hits {}, misses {}, saved {:.2f}s".format(module, hits, misses, saved))
+
+
+static_program_cache = StaticProgramCache()
+atexit.register(static_program_cache.report)
 
 
 def compare_grad(result, expect, delta=1e-6, rtol=0.001, mode=None, no_grad_var=None):
@@ -100,3 +100,38 @@ def test_matmul_batched_matrix_broadcasted_matrix():
     y_data = np.random.random([1, 3, 2, 5]).astype(np.float32)
     res = np.matmul(x_data, y_data)
     obj.run(res=res, x=x_data, y=y_data)
+
+
+@pytest.mark.api_base_matmul_parameters
+def test_matmul_numeric_grad_batch():
+    """
+    numeric grad: batched forward == per-element forward == analytic grad
+    """
+    np.random.seed(0)
+    x_data = np.random.random([3, 4]).astype(np.float64)
+    y_data = np.random.random([4, 5]).astype(np.float64)
+    res = np.matmul(x_data, y_data)
+    # obj为模块内共享实例, 修改的属性在结束后恢复, 不影响其他case
+    dtype, place = obj.dtype, obj.place
+    obj.dtype = np.float64
+    obj.place = paddle.CPUPlace()
+    try:
+        batched = obj.compute_grad(res, x=x_data, y=y_data)
+        # matmul支持在第0维前新增batch维
+        paddle.disable_static(obj.place)
+        try:
+            assert obj._grad_batch_mode(x_data, "x")[0] == "stack"
+        finally:
+            paddle.enable_static()
+        obj.grad_batch = False
+        looped = obj.compute_grad(res, x=x_data, y=y_data)
+    finally:
+        obj.grad_batch = True
+        obj.dtype, obj.place = dtype, place
+    expect = {
+        "x": np.matmul(np.ones([3, 5]), y_data.T) / res.size,
+        "y": np.matmul(x_data.T, np.ones([3, 5])) / res.size,
+    }
+    for k in ("x", "y"):
+        assert np.allclose(batched[k], looped[k], rtol=1e-6, atol=1e-8)
+        assert np.allclose(batched[k], expect[k], rtol=1e-4, atol=1e-6)
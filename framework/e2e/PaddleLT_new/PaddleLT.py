@@ -27,4 +27,8 @@ def test_module_layer(title, layerfile, testing, device_place_id):
     single_test = layertest.LayerTest(
         title=title, layerfile=layerfile, testing=testing, device_place_id=device_place_id
     )
-    single_test._case_run()
+    try:
+        single_test._case_run()
+    finally:
+        if single_test.failed_engines:
+            allure.dynamic.label("failed_engine", *single_test.failed_engines)
@@ -8,14 +8,22 @@
 import os
 import ast
 import sys
+import json
 import argparse
 import subprocess
 import numpy as np
 from layertest import LayerTest
 from strategy.compare import perf_compare
+from pltools.bisect_tools import WheelCache, ResultMemo, kary_locate
 from pltools.logger import Logger
 from pltools.res_save import save_pickle
 
+WHL_URL = (
+    "https://paddle-qa.bj.bcebos.com/paddle-pipe"
+    "line/Develop-GpuSome-LinuxCentos-Gcc82-Cuda118-Cudnn86-Trt85-Py310-CINN-Compile/{}/paddle"
+    "paddle_gpu-0.0.0-cp310-cp310-linux_x86_64.whl"
+)
+
 
 def get_commits(start, end):
     """
@@ -41,7 +49,19 @@ class BinarySearch(object):
     性能/精度通用二分定位工具
     """
 
-    def __init__(self, commit_list, title, layerfile, testing, perf_decay=None, test_obj=LayerTest):
+    def __init__(
+        self,
+        commit_list,
+        title,
+        layerfile,
+        testing,
+        perf_decay=None,
+        test_obj=LayerTest,
+        wheel_cache=None,
+        memo=None,
+        workers=None,
+        probe=None,
+    ):
         """
         初始化
         commit_list: 二分定位commit的范围list[commit]
@@ -49,7 +69,10 @@ class BinarySearch(object):
         layerfile: 子图路径, 例如./layercase/sublayer1000/Det_cases/ppyolo_ppyolov2_r50vd_dcn_365e_coco/SIR_76.py
         testing: 测试yaml路径, 例如 yaml/dy^dy2stcinn_eval_benchmark.yml
         perf_decay: 仅用于性能, 某个engine名称+预期耗时+性能下降比例, 组成的list, 例如["dy2st_eval_cinn_perf", 0.0635672, -0.3]
-
+        wheel_cache: wheel缓存, 默认为PLT_BISECT_CACHE目录下的WheelCache
+        memo: 测试结果缓存, 默认为PLT_BISECT_CACHE目录下的results.json
+        workers: 每轮并行测试的commit数, 默认取PLT_BISECT_WORKERS; 未设置时精度为min(4, cpu数), 性能为1以免互相干扰
+        probe: probe(commit) -> bool, 替换默认的子进程测试, 用于测试二分逻辑
         """
         self.logger = Logger("PLT二分定位")
 
@@ -60,37 +83,19 @@ class BinarySearch(object):
         self.testing = testing
         self.perf_decay = perf_decay
         self.test_obj = test_obj
-        self.py_cmd = os.environ.get("python_ver")
+        self.py_cmd = os.environ.get("python_ver") or sys.executable
         self.testing_mode = os.environ.get("TESTING_MODE")
         self.device_place_id = 0
         self.timeout = 300
 
-    def _status_print(self, exit_code, status_str):
-        """
-        状态打印
-        """
-        if exit_code == 0:
-            self.logger.get_log().info(f"{status_str} successfully")
-        else:
-            self.logger.get_log().error(f"{status_str} failed")
-            sys.exit(-1)
-
-    def _install_paddle(self, commit_id):
-        """
-        安装 paddle
-        """
-        exit_code = os.system(f"{self.py_cmd} -m pip uninstall paddlepaddle-gpu -y")
-        self._status_print(exit_code=exit_code, status_str="uninstall paddlepaddle-gpu")
-
-        whl_link = (
-            "https://paddle-qa.bj.bcebos.com/paddle-pipe"
-            "line/Develop-GpuSome-LinuxCentos-Gcc82-Cuda118-Cudnn86-Trt85-Py310-CINN-Compile/{}/paddle"
-            "paddle_gpu-0.0.0-cp310-cp310-linux_x86_64.whl".format(commit_id)
-        )
-        exit_code = os.system(f"{self.py_cmd} -m pip install {whl_link}")
-        self._status_print(exit_code=exit_code, status_str="install paddlepaddle-gpu")
-        self.logger.get_log().info("commit {} install done".format(commit_id))
-        return 0
+        cache_dir = os.environ.get("PLT_BISECT_CACHE", "bisect_cache")
+        self.wheel_cache = wheel_cache if wheel_cache is not None else WheelCache(cache_dir, WHL_URL)
+        self.memo = memo if memo is not None else ResultMemo(os.path.join(cache_dir, "results.json"))
+        if workers is None:
+            default_workers = min(4, os.cpu_count() or 1) if self.testing_mode == "precision" else 1
+            workers = int(os.environ.get("PLT_BISECT_WORKERS", default_workers))
+        self.workers = workers
+        self.probe = probe if probe is not None else self._probe
 
     def _precision_debug(self, commit_id):
         """
@@ -102,6 +107,7 @@ class BinarySearch(object):
         # except Exception:
         #     exc += 1
 
+        # 并行测试时title带commit后缀, 各自使用独立的pytest文件
         if os.path.exists(f"{self.title}.py"):
             os.system(f"rm {self.title}.py")
         exit_code = os.system(
@@ -136,37 +142,68 @@ class BinarySearch(object):
             self.logger.get_log().info(f"{self.testing_mode}执行成功commit: {commit_id}")
             return True
 
+    def _metric(self):
+        """结果缓存中的指标: 测试模式, yaml以及性能阈值"""
+        return "{}:{}:{}".format(self.testing_mode, self.testing, json.dumps(self.perf_decay))
+
+    def _probe(self, commit):
+        """
+        在独立环境中测试单个commit: wheel解压目录加入PYTHONPATH, 子进程执行binary_search.py --probe
+        """
+        res = self.memo.get(commit, self.layerfile, self._metric())
+        if res is not None:
+            self.logger.get_log().info(f"commit {commit} 命中结果缓存: {res}")
+            return res
+        env = dict(os.environ)
+        env_dir = self.wheel_cache.env(commit)
+        env["PYTHONPATH"] = os.pathsep.join([env_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+        cmd = [
+            self.py_cmd,
+            "binary_search.py",
+            "--probe",
+            f"--commit={commit}",
+            f"--title={self.title}_{commit[:8]}",
+            f"--layerfile={self.layerfile}",
+            f"--testing={self.testing}",
+            f"--perf_decay={json.dumps(self.perf_decay)}",
+        ]
+        res = subprocess.run(cmd, env=env).returncode == 0
+        self.memo.put(commit, self.layerfile, self._metric(), res)
+        return res
+
     def _commit_locate(self, commits):
         """
         commit定位
         """
         self.logger.get_log().info("测试case名称: {}".format(self.title))
-
-        if len(commits) == 2:
-            self.logger.get_log().info(
-                "only two candidate commits left in binary_search, the final commit is {}".format(commits[0])
-            )
-            return commits[0]
-        left, right = 0, len(commits) - 1
-        if left <= right:
-            mid = left + (right - left) // 2
-            commit = commits[mid]
-
-            self._install_paddle(commit)
-
-            if eval(f"self._{self.testing_mode}_debug")(commit):
-                self.logger.get_log().info("the commit {} is success".format(commit))
-                self.logger.get_log().info("mid value:{}".format(mid))
-                selected_commits = commits[: mid + 1]
-                res = self._commit_locate(selected_commits)
-            else:
-                self.logger.get_log().info("the commit {} is failed".format(commit))
-                selected_commits = commits[mid:]
-                res = self._commit_locate(selected_commits)
-        return res
+        self.logger.get_log().info("每轮并行测试commit数: {}".format(self.workers))
+        final_commit = kary_locate(commits, self.probe, workers=self.workers, logger=self.logger)
+        self.logger.get_log().info("the final commit is {}".format(final_commit))
+        return final_commit
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    # 由BinarySearch._probe拉起, 在当前PYTHONPATH中的paddle下测试单个commit
+    parser.add_argument("--probe", action="store_true", help="单commit测试模式")
+    parser.add_argument("--commit", type=str, default=None, help="待测commit")
+    parser.add_argument("--title", type=str, default="PrecisionBS", help="日志标题")
+    parser.add_argument("--layerfile", type=str, default=None, help="子图路径")
+    parser.add_argument("--testing", type=str, default=None, help="测试yaml路径")
+    parser.add_argument("--perf_decay", type=str, default="null", help="性能阈值, json格式")
+    args = parser.parse_args()
+    if args.probe:
+        probe_bs = BinarySearch(
+            commit_list=[args.commit],
+            title=args.title,
+            layerfile=args.layerfile,
+            testing=args.testing,
+            perf_decay=json.loads(args.perf_decay),
+            test_obj=LayerTest,
+            workers=1,
+        )
+        sys.exit(0 if getattr(probe_bs, f"_{probe_bs.testing_mode}_debug")(args.commit) else 1)
+
     cur_path = os.getcwd()
     if not os.path.exists("paddle"):
         os.system("git clone -b develop http://github.com/paddlepaddle/paddle.git")
@@ -7,8 +7,10 @@ db object
 """
 
 import json
+import sqlite3
 import traceback
 from datetime import datetime
+from itertools import groupby
 import yaml
 import pymysql
 
@@ -20,11 +22,21 @@ ACCURACY = "%.6g"
 class DB(object):
     """DB class"""
 
-    def __init__(self, storage="storage.yaml"):
+    def __init__(self, storage="storage.yaml", connection=None):
+        """
+        :param storage: 数据库配置文件
+        :param connection: 已建立的DB-API连接(如sqlite3.connect(...)), 为None时按storage连接mysql
+        """
         self.storage = storage
-        host, port, user, password, database = self.load_storge()
-        self.db = pymysql.connect(host=host, port=port, user=user, password=password, database=database, charset="utf8")
+        if connection is None:
+            host, port, user, password, database = self.load_storge()
+            connection = pymysql.connect(
+                host=host, port=port, user=user, password=password, database=database, charset="utf8"
+            )
+        self.db = connection
         self.cursor = self.db.cursor()
+        # pymysql使用format风格占位符, sqlite3使用qmark风格
+        self.placeholder = "?" if isinstance(connection, sqlite3.Connection) else "%s"
         # self.now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def load_storge(self):
@@ -59,13 +71,45 @@ class DB(object):
         sql = "INSERT INTO {table}({keys}) VALUES ({values})".format(table=sql_table, keys=keys, values=values)
         try:
             self.cursor.execute(sql)
-            id = self.db.insert_id()
+            id = self.cursor.lastrowid
             self.db.commit()
         except Exception as e:
             # print(traceback.format_exc())
             print(e)
         return id
 
+    def insert_many(self, table, rows, batch_size=1000):
+        """
+        参数化批量插入, 全部数据在同一事务中提交, 返回插入行数; 失败时回滚并返回-1
+        :param rows: 待插入数据dict组成的list, 与insert相同, 值为None的字段不插入
+        :param batch_size: 单次executemany的行数
+        """
+        sql_table = "`" + table + "`"
+        try:
+            # 字段相同的相邻行合并为一次executemany, 保持插入顺序与逐行插入一致
+            rows = [[(k, data[k]) for k in data if data[k] is not None] for data in rows]
+            for keys, group in groupby(rows, key=lambda ls: tuple(i[0] for i in ls)):
+                values = [tuple(i[1] for i in ls) for ls in group]
+                sql = "INSERT INTO {table}({keys}) VALUES ({values})".format(
+                    table=sql_table,
+                    keys=",".join(("`" + k + "`") for k in keys),
+                    values=",".join([self.placeholder] * len(keys)),
+                )
+                for start in range(0, len(values), batch_size):
+                    self.cursor.executemany(sql, values[start : start + batch_size])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(traceback.format_exc())
+            print(e)
+            return -1
+        return len(rows)
+
+    def ping(self):
+        """断线重连, sqlite等本地连接不需要"""
+        if hasattr(self.db, "ping"):
+            self.db.ping(True)
+
     def update(self, table, data, data_condition):
         """按照data_condition 更新数据"""
         sql_table = "`" + table + "`"
@@ -110,7 +154,7 @@ class DB(object):
             self.cursor.execute(sql)
             res = self.cursor.fetchall()
 
-            index_list = self.show_list(table=table)
+            index_list = [column[0] for column in self.cursor.description]
             for row in res:
                 tmp = {}
                 for i, v in enumerate(row):
@@ -132,7 +176,7 @@ class DB(object):
             res = self.cursor.fetchall()
 
             tmp = {}
-            index_list = self.show_list(table=table)
+            index_list = [column[0] for column in self.cursor.description]
             for row in res:
                 for i, v in enumerate(row):
                     tmp[index_list[i]] = row[i]
@@ -201,7 +245,7 @@ class DB(object):
                 case_id = self.insert(table="layer_case", data=data)
                 if case_id == -1:
                     print("db ping again~~~")
-                    self.db.ping(True)
+                    self.ping()
                     continue
                 else:
                     break
@@ -210,6 +254,26 @@ class DB(object):
             print(traceback.format_exc())
             print(e)
 
+    def insert_cases(self, jid, cases, create_time):
+        """
+        向case表中批量录入数据, 一次事务提交, 失败时整体回滚后重试
+        :param cases: {case_name: result}
+        """
+        data = [
+            {"jid": jid, "case_name": case_name, "result": result, "create_time": create_time}
+            for case_name, result in cases.items()
+        ]
+        retry = 3
+        for i in range(retry):
+            count = self.insert_many(table="layer_case", rows=data)
+            if count == -1:
+                print("db ping again~~~")
+                self.ping()
+                continue
+            else:
+                break
+        return count
+
     def update_job(self, id, status, update_time):
         """数据录入完成后更新job表中的部分字段"""
         data = {"status": status, "update_time": update_time}
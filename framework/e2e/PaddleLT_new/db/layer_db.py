@@ -65,6 +65,17 @@ class LayerBenchmarkDB(object):
         self.logger = Logger("LayerBenchmarkDB")
         self.logger.get_log().info(f"md5_id is: {self.md5_id}")
 
+        # 数据库连接, 首次使用时建立, 之后复用
+        self.db = None
+
+    def _get_db(self):
+        """
+        获取数据库连接
+        """
+        if self.db is None:
+            self.db = DB(storage=self.storage)
+        return self.db
+
     def _frame_info(self):
         """"""
         if os.environ.get("FRAMEWORK") == "paddle":
@@ -102,7 +113,7 @@ class LayerBenchmarkDB(object):
         """
         插入最新数据
         """
-        db = DB(storage=self.storage)
+        db = self._get_db()
 
         # 插入layer_job
         latest_id = db.insert_job(
@@ -131,8 +142,8 @@ class LayerBenchmarkDB(object):
         self.logger.get_log().info("性能测试job_id: {}".format(latest_id))
 
         # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=latest_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        cases = {title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()}
+        db.insert_cases(jid=latest_id, cases=cases, create_time=self.now_time)
 
         if bool(error_list):
             db.update_job(id=latest_id, status="done", update_time=self.now_time)
@@ -146,7 +157,7 @@ class LayerBenchmarkDB(object):
         获取baseline dict
         """
         # 获取baseline用于对比
-        db = DB(storage=self.storage)
+        db = self._get_db()
         baseline_job = db.select_baseline_job(
             comment=self.baseline_comment,
             testing=self.testing,
@@ -167,7 +178,7 @@ class LayerBenchmarkDB(object):
         """
         插入最新数据
         """
-        db = DB(storage=self.storage)
+        db = self._get_db()
 
         # 插入layer_job
         basleine_id = db.insert_job(
@@ -196,8 +207,8 @@ class LayerBenchmarkDB(object):
         self.logger.get_log().info("性能测试job_id: {}".format(basleine_id))
 
         # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=basleine_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        cases = {title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()}
+        db.insert_cases(jid=basleine_id, cases=cases, create_time=self.now_time)
 
         if bool(error_list):
             db.update_job(id=basleine_id, status="done", update_time=self.now_time)
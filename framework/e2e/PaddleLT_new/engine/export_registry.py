@@ -0,0 +1,171 @@
+#!/bin/env python3
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+导出产物注册表, 同一worker进程内LayerExport与LayerInfer通过内存交接模型
+"""
+import atexit
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import paddle
+import paddle.inference as paddle_infer
+
+# jit.save可能产出的模型文件, 旧IR为.pdmodel, PIR为.json
+MODEL_SUFFIXES = (".pdmodel", ".json")
+
+
+class ExportArtifact(object):
+    """
+    单个导出产物: 模型与参数的序列化buffer, 以及它们所在的文件前缀
+    """
+
+    def __init__(self, prefix, staging=None):
+        """
+        :param prefix: 模型文件前缀, 即jit.save的path
+        :param staging: 暂存目录, 由注册表负责删除; 从jit_save_export读取时为None
+        """
+        self.prefix = prefix
+        self.staging = staging
+        self.buffers = {}
+        for suffix in MODEL_SUFFIXES + (".pdiparams",):
+            if os.path.exists(prefix + suffix):
+                with open(prefix + suffix, "rb") as f:
+                    self.buffers[suffix] = f.read()
+
+    def has_params(self):
+        """是否产出了pdiparams"""
+        return ".pdiparams" in self.buffers
+
+    def config(self, model_suffix):
+        """
+        创建预测Config, 旧IR模型直接从内存buffer加载;
+        PIR的json模型不支持set_model_buffer, 使用暂存目录(优先/dev/shm)中的文件
+        """
+        if model_suffix == ".pdmodel" and ".pdmodel" in self.buffers:
+            model, params = self.buffers[".pdmodel"], self.buffers[".pdiparams"]
+            config = paddle_infer.Config()
+            config.set_model_buffer(model, len(model), params, len(params))
+            return config
+        return paddle_infer.Config(self.prefix + model_suffix, self.prefix + ".pdiparams")
+
+    def release(self):
+        """删除暂存目录"""
+        if self.staging is not None:
+            shutil.rmtree(self.staging, ignore_errors=True)
+            self.staging = None
+
+
+class ExportRegistry(object):
+    """
+    按jit.save路径登记导出产物, 并为每个(case, 执行器, 设备)复用同一个predictor.
+    只保留最近maxsize个case的产物, 淘汰时一并释放predictor与暂存目录
+    """
+
+    def __init__(self, maxsize=4, to_disk=False):
+        """
+        :param maxsize: 保留的产物个数
+        :param to_disk: 是否仍然写入jit_save_export, 用于调试
+        """
+        self.maxsize = maxsize
+        self.to_disk = to_disk
+        self.artifacts = OrderedDict()
+        self.predictors = {}
+        self.staging_root = None
+
+    def _staging_dir(self):
+        """
+        每个产物一个暂存目录, 优先放在内存文件系统中.
+        常驻进程池通过PLT_EXPORT_STAGING_DIR为每个worker指定根目录, worker被terminate时由进程池删除;
+        否则根目录名带上当前pid, 进程异常退出后由进程池按pid清理
+        """
+        if self.staging_root is None:
+            staging_root = os.environ.get("PLT_EXPORT_STAGING_DIR")
+            if staging_root:
+                os.makedirs(staging_root, exist_ok=True)
+                self.staging_root = staging_root
+            else:
+                base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+                self.staging_root = tempfile.mkdtemp(prefix=f"plt_export_{os.getpid()}_", dir=base)
+        return tempfile.mkdtemp(dir=self.staging_root)
+
+    def save(self, layer, path, **configs):
+        """
+        代替paddle.jit.save: 默认导出到暂存目录并登记在内存中, to_disk时写入path
+        """
+        if self.to_disk:
+            paddle.jit.save(layer, path=path, **configs)
+            artifact = ExportArtifact(path)
+        else:
+            staging = self._staging_dir()
+            prefix = os.path.join(staging, os.path.basename(path))
+            paddle.jit.save(layer, path=prefix, **configs)
+            artifact = ExportArtifact(prefix, staging=staging)
+        self._put(path, artifact)
+
+    def get(self, path):
+        """
+        获取导出产物, 注册表中没有时尝试读取jit_save_export中的文件(如单独执行infer);
+        未产出pdiparams时返回None
+        """
+        if path in self.artifacts:
+            self.artifacts.move_to_end(path)
+            artifact = self.artifacts[path]
+        elif os.path.exists(path + ".pdiparams"):
+            artifact = ExportArtifact(path)
+            self._put(path, artifact)
+        else:
+            return None
+        return artifact if artifact.has_params() else None
+
+    def predictor(self, path, engine, model_suffix, set_config):
+        """
+        获取predictor, 同一产物在同一执行器和设备上只创建一次
+        :param engine: 执行器名称, 不同执行器的Config不同, 不能共用predictor
+        :param model_suffix: 模型文件后缀
+        :param set_config: 对Config做执行器相关的设置
+        """
+        artifact = self.get(path)
+        if artifact is None:
+            return None
+        key = (path, engine, model_suffix, paddle.device.get_device())
+        cached = self.predictors.get(key)
+        if cached is not None and cached[0] is artifact:
+            return cached[1]
+        config = artifact.config(model_suffix)
+        set_config(config)
+        predictor = paddle_infer.create_predictor(config)
+        self.predictors[key] = (artifact, predictor)
+        return predictor
+
+    def _put(self, path, artifact):
+        """登记产物, 覆盖或淘汰旧产物时释放对应资源"""
+        if path in self.artifacts:
+            self._evict(path)
+        self.artifacts[path] = artifact
+        while len(self.artifacts) > self.maxsize:
+            self._evict(next(iter(self.artifacts)))
+
+    def _evict(self, path):
+        """释放产物及其predictor"""
+        artifact = self.artifacts.pop(path)
+        for key in [k for k in self.predictors if k[0] == path]:
+            del self.predictors[key]
+        artifact.release()
+
+    def clear(self):
+        """释放全部产物与暂存目录"""
+        for path in list(self.artifacts):
+            self._evict(path)
+        if self.staging_root is not None:
+            shutil.rmtree(self.staging_root, ignore_errors=True)
+            self.staging_root = None
+
+
+export_registry = ExportRegistry(
+    maxsize=int(os.environ.get("PLT_EXPORT_REGISTRY_SIZE", "4")),
+    to_disk=os.environ.get("PLT_EXPORT_TO_DISK", "False") == "True",
+)
+atexit.register(export_registry.clear)
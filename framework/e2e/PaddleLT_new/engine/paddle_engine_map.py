@@ -30,6 +30,8 @@ paddle_engine_map = {
     "dy2st_eval_cinn": LayerEval,  # CINN评估
     "dy2st_eval_cinn_inputspec": LayerEval,  # CINN评估+动态inputspec
     "dy2st_eval_cinn_static_inputspec": LayerEval,  # CINN评估+静态inputspec
+    "dy2st_eval_dynamic_search": LayerEval,  # 动转静评估+剪枝搜索动态inputspec
+    "dy2st_eval_cinn_dynamic_search": LayerEval,  # CINN评估+剪枝搜索动态inputspec
     "jit_save": LayerExport,  # 动转静导出
     "jit_save_inputspec": LayerExport,  # 动转静+动态inputspec导出
     "jit_save_static_inputspec": LayerExport,  # 动转静+静态inputspec导出
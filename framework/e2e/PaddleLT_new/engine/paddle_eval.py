@@ -180,6 +180,57 @@ class LayerEval(object):
         else:
             return {"res": {"logit": logit}, "net": None}
 
+    def _dynamic_spec_search(self, testing, build_strategy=None):
+        """
+        剪枝搜索可用的动态InputSpec, 并用动态维度最多的InputSpec执行
+        """
+        data, spec_gen = self._net_input_and_multi_spec()
+        net = self._net_instant()
+        logger = Logger(testing).get_log()
+
+        def check(input_spec):
+            try:
+                st_net = paddle.jit.to_static(
+                    net, build_strategy=build_strategy, full_graph=True, input_spec=input_spec
+                )
+                st_net.eval()
+                st_net(*data)
+                return True
+            except Exception:
+                logger.info(f"动态InputSpec测试失败: {input_spec}")
+                return False
+
+        memo_path = None
+        case_name = self.layerfile.replace(".py", "").replace("/", "^").replace(".", "^")
+        if os.environ.get("PLT_SAVE_SPEC") == "True":
+            memo_path = os.path.join("inputspec_save", f"{case_name}^{testing}.search.json")
+        result = spec_gen.search(check, memo_path=memo_path)
+        logger.info(f"动态InputSpec搜索执行{result['attempts']}次, 全组合遍历需{result['exhaustive']}次")
+        for input_spec in result["failed_specs"]:
+            logger.warning(f"极小失败动态InputSpec: {input_spec}")
+        input_spec = result["input_spec"]
+        logger.info(f"待测动态InputSpec为: {input_spec}")
+        if os.environ.get("PLT_SAVE_SPEC") == "True":
+            save_tensor(data=input_spec, filename=os.path.join("inputspec_save", f"{case_name}.inputspec"))
+
+        st_net = paddle.jit.to_static(net, build_strategy=build_strategy, full_graph=True, input_spec=input_spec)
+        st_net.eval()
+        logit = st_net(*data)
+        if self.return_net_instance == "True":
+            return {"res": {"logit": logit}, "net": st_net}
+        else:
+            return {"res": {"logit": logit}, "net": None}
+
+    def dy2st_eval_dynamic_search(self):
+        """dy2st eval, 剪枝搜索动态InputSpec"""
+        return self._dynamic_spec_search("dy2st_eval_dynamic_search")
+
+    def dy2st_eval_cinn_dynamic_search(self):
+        """dy2st cinn eval, 剪枝搜索动态InputSpec"""
+        build_strategy = paddle.static.BuildStrategy()
+        build_strategy.build_cinn_pass = True
+        return self._dynamic_spec_search("dy2st_eval_cinn_dynamic_search", build_strategy=build_strategy)
+
     # def dy2st_eval_cinn_inputspec_legacy_2(self):
     #     """dy2st cinn eval with inputspec"""
     #     net = self._net_instant()
@@ -9,6 +9,7 @@ import os
 import numpy as np
 import paddle
 from engine.paddle_xtools import reset
+from engine.export_registry import export_registry
 from generator.builder_layer import BuildLayer
 from generator.builder_data import BuildData
 
@@ -81,7 +82,7 @@ class LayerExport(object):
         st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save"))
+        export_registry.save(st_net, path=os.path.join(self.path, self.layername, "jit_save"))
         return {"res": None}
 
     def jit_save_inputspec(self):
@@ -95,7 +96,7 @@ class LayerExport(object):
         # st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_inputspec"))
+        export_registry.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_inputspec"))
         return {"res": None}
 
     def jit_save_static_inputspec(self):
@@ -109,7 +110,7 @@ class LayerExport(object):
         # st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_static_inputspec"))
+        export_registry.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_static_inputspec"))
         return {"res": None}
 
     def jit_save_cinn(self):
@@ -124,7 +125,7 @@ class LayerExport(object):
         cinn_net(*data)
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn"))
+        export_registry.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn"))
         return {"res": None}
 
     def jit_save_cinn_inputspec(self):
@@ -140,7 +141,7 @@ class LayerExport(object):
         # cinn_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_inputspec"))
+        export_registry.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_inputspec"))
         return {"res": None}
 
     def jit_save_cinn_static_inputspec(self):
@@ -156,5 +157,5 @@ class LayerExport(object):
         # cinn_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
-        paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_static_inputspec"))
+        export_registry.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_static_inputspec"))
         return {"res": None}
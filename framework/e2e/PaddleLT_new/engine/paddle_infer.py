@@ -11,6 +11,7 @@ import numpy as np
 import paddle
 import paddle.inference as paddle_infer
 from engine.paddle_xtools import reset
+from engine.export_registry import export_registry
 from generator.builder_layer import BuildLayer
 from generator.builder_data import BuildData
 
@@ -42,14 +43,14 @@ class LayerInfer(object):
     def paddle_infer_gpu(self):
         """infer load (layer)"""
         reset(self.seed)
-        if not os.path.exists(self.path + ".pdiparams"):
+        if export_registry.get(self.path) is None:
             Logger("paddle_infer_gpu").get_log().info("该子图export未产出pdiparams, 所以跳过infer测试")
             return {"res": {"logit": None}}
 
-        config = paddle_infer.Config(self.path + ".pdmodel", self.path + ".pdiparams")
-        config.enable_use_gpu(1000, int(self.device_id))
+        def set_config(config):
+            config.enable_use_gpu(1000, int(self.device_id))
 
-        predictor = paddle_infer.create_predictor(config)
+        predictor = export_registry.predictor(self.path, "paddle_infer_gpu", ".pdmodel", set_config)
         input_names = predictor.get_input_names()
         for i, name in enumerate(input_names):
             input_handle = predictor.get_input_handle(name)
@@ -71,15 +72,14 @@ class LayerInfer(object):
     def paddle_infer_cpu(self):
         """infer load (layer)"""
         reset(self.seed)
-        if not os.path.exists(self.path + ".pdiparams"):
+        if export_registry.get(self.path) is None:
             Logger("paddle_infer_cpu").get_log().info("该子图export未产出pdiparams, 所以跳过infer测试")
             return {"res": {"logit": None}}
 
-        config = paddle_infer.Config(self.path + ".pdmodel", self.path + ".pdiparams")
+        def set_config(config):
+            config.disable_mkldnn()
 
-        config.disable_mkldnn()
-
-        predictor = paddle_infer.create_predictor(config)
+        predictor = export_registry.predictor(self.path, "paddle_infer_cpu", ".pdmodel", set_config)
         input_names = predictor.get_input_names()
         for i, name in enumerate(input_names):
             input_handle = predictor.get_input_handle(name)
@@ -101,17 +101,16 @@ class LayerInfer(object):
     def paddle_infer_mkldnn(self):
         """infer load (layer)"""
         reset(self.seed)
-        if not os.path.exists(self.path + ".pdiparams"):
+        if export_registry.get(self.path) is None:
             Logger("paddle_infer_mkldnn").get_log().info("该子图export未产出pdiparams, 所以跳过infer测试")
             return {"res": {"logit": None}}
 
-        config = paddle_infer.Config(self.path + ".pdmodel", self.path + ".pdiparams")
-
-        config.enable_mkldnn()
-        config.set_cpu_math_library_num_threads(1)
-        config.set_mkldnn_cache_capacity(1)
+        def set_config(config):
+            config.enable_mkldnn()
+            config.set_cpu_math_library_num_threads(1)
+            config.set_mkldnn_cache_capacity(1)
 
-        predictor = paddle_infer.create_predictor(config)
+        predictor = export_registry.predictor(self.path, "paddle_infer_mkldnn", ".pdmodel", set_config)
         input_names = predictor.get_input_names()
         for i, name in enumerate(input_names):
             input_handle = predictor.get_input_handle(name)
@@ -133,16 +132,15 @@ class LayerInfer(object):
     def paddle_infer_ort(self):
         """infer load (layer)"""
         reset(self.seed)
-        if not os.path.exists(self.path + ".pdiparams"):
+        if export_registry.get(self.path) is None:
             Logger("paddle_infer_ort").get_log().info("该子图export未产出pdiparams, 所以跳过infer测试")
             return {"res": {"logit": None}}
 
-        config = paddle_infer.Config(self.path + ".pdmodel", self.path + ".pdiparams")
+        def set_config(config):
+            config.enable_onnxruntime()
+            config.enable_ort_optimization()
 
-        config.enable_onnxruntime()
-        config.enable_ort_optimization()
-
-        predictor = paddle_infer.create_predictor(config)
+        predictor = export_registry.predictor(self.path, "paddle_infer_ort", ".pdmodel", set_config)
         input_names = predictor.get_input_names()
         for i, name in enumerate(input_names):
             input_handle = predictor.get_input_handle(name)
@@ -164,19 +162,17 @@ class LayerInfer(object):
     def paddle_infer_new_exc_pir(self):
         """infer load (layer)"""
         reset(self.seed)
-        if not os.path.exists(self.path + ".pdiparams"):
+        if export_registry.get(self.path) is None:
             Logger("paddle_infer_new_exc_pir").get_log().info("该子图export未产出pdiparams, 所以跳过infer测试")
             return {"res": {"logit": None}}
 
-        config = paddle_infer.Config(self.path + ".json", self.path + ".pdiparams")
-        # config = paddle_infer.Config(self.path, 'inference')
-
-        config.enable_use_gpu(256, 0)
-        config.switch_ir_optim(False)
-        config.enable_new_executor()
-        config.enable_new_ir()
+        def set_config(config):
+            config.enable_use_gpu(256, 0)
+            config.switch_ir_optim(False)
+            config.enable_new_executor()
+            config.enable_new_ir()
 
-        predictor = paddle_infer.create_predictor(config)
+        predictor = export_registry.predictor(self.path, "paddle_infer_new_exc_pir", ".json", set_config)
         input_names = predictor.get_input_names()
         for i, name in enumerate(input_names):
             input_handle = predictor.get_input_handle(name)
@@ -11,18 +11,13 @@ import numpy as np
 
 if os.environ.get("FRAMEWORK") == "paddle":
     import paddle
-    import diy
-    import layerApicase
-    import layercase
-
-    if os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleOCR":
-        import layerModelcase
-        import PaddleOCR
 elif os.environ.get("FRAMEWORK") == "torch":
     import torch
-    import layerTorchcase
 
 import pltools.np_tool as tool
+from generator import case_fixture
+from generator.case_loader import load_case_module
+from generator.spec_search import SpecSearch
 
 
 class BuildData(object):
@@ -31,9 +26,27 @@ class BuildData(object):
     def __init__(self, layerfile):
         """init"""
         self.layerfile = layerfile
-        self.layer_module = eval(self.layerfile)
+        self.layer_module = load_case_module(self.layerfile)
 
     def get_single_data(self):
+        """get data, 在case_fixture()内时同一case的各执行器复用首次生成的输入"""
+        fixture = case_fixture.current()
+        if fixture is None:
+            return self._build_single_data()
+        return fixture.get(
+            "data",
+            self.layerfile,
+            build=lambda: self._build_with_proto(self._build_single_data),
+            restore=case_fixture.load_inputs,
+        )
+
+    @staticmethod
+    def _build_with_proto(build):
+        """生成输入, 并保留一份独立的副本"""
+        data = build()
+        return case_fixture.dump_inputs(data), data
+
+    def _build_single_data(self):
         """get data"""
         if hasattr(self.layer_module, "create_numpy_inputs"):
             # dataname = self.layerfile + ".create_numpy_inputs()"
@@ -66,6 +79,18 @@ class BuildData(object):
         return data
 
     def get_single_numpy(self):
+        """get data"""
+        fixture = case_fixture.current()
+        if fixture is None:
+            return self._build_single_numpy()
+        return fixture.get(
+            "numpy",
+            self.layerfile,
+            build=lambda: self._build_with_proto(self._build_single_numpy),
+            restore=case_fixture.load_inputs,
+        )
+
+    def _build_single_numpy(self):
         """get data"""
         # dataname = self.layerfile + ".create_numpy_inputs()"
         data = []
@@ -104,8 +129,8 @@ class BuildData(object):
         """get single inputspec"""
         spec_list = []
         data = self.get_single_data()
-        if hasattr(eval(self.layerfile), "create_inputspec"):  # 如果子图case中包含inputspec, 则直接使用接口获取
-            spec_list = eval(self.layerfile + ".create_inputspec()")
+        if hasattr(self.layer_module, "create_inputspec"):  # 如果子图case中包含inputspec, 则直接使用接口获取
+            spec_list = self.layer_module.create_inputspec()
         else:
             for v in data:
                 if isinstance(v, paddle.Tensor):
@@ -204,6 +229,19 @@ class SpecInfoMeta:
             specs.append(self.as_spec(shape))
         return specs
 
+    def dynamic_dims(self):
+        """
+        可设为动态的维度, 通道数为3的4-D输入不将通道维设为动态
+        """
+        has_channel = len(self.shape) == 4 and self.shape[1] == 3
+        return [i for i in range(len(self.shape)) if not (has_channel and i == 1)]
+
+    def dynamic_spec(self, dims):
+        """
+        将dims中的维度设为动态(-1), 其余维度保持静态
+        """
+        return self.as_spec([-1 if i in dims else s for i, s in enumerate(self.shape)])
+
 
 class SpecStrategy:
     """
@@ -232,3 +270,37 @@ class SpecStrategy:
         for input_info in self.inputs_info:
             strategy.append(input_info.maybe_specs())
         return strategy
+
+    def dims(self):
+        """
+        所有可设为动态的维度, [(输入序号, 维度序号), ...]
+        """
+        return [(i, d) for i, input_info in enumerate(self.inputs_info) for d in input_info.dynamic_dims()]
+
+    def specs(self, dims):
+        """
+        由动态维度集合生成InputSpec列表
+        """
+        return [
+            input_info.dynamic_spec({d for j, d in dims if j == i}) for i, input_info in enumerate(self.inputs_info)
+        ]
+
+    def search(self, check, memo_path=None):
+        """
+        剪枝搜索动态InputSpec, 替代next()的全组合遍历
+        :param check: check(input_spec) -> bool, 使用该InputSpec编译执行是否通过
+        :param memo_path: 已知通过/失败集合的记录文件, 为None时不读写
+        :return: dict, input_spec为动态维度最多的通过InputSpec, failed_specs为各极小失败InputSpec
+        """
+        searcher = SpecSearch(self.dims(), lambda dims: check(self.specs(dims)))
+        if memo_path is not None:
+            searcher.load(memo_path)
+        passed = searcher.run()
+        if memo_path is not None:
+            searcher.dump(memo_path)
+        return {
+            "input_spec": self.specs(passed),
+            "failed_specs": [self.specs(dims) for dims in searcher.minimal_failures],
+            "attempts": searcher.attempts,
+            "exhaustive": int(np.prod([len(input_info.maybe_shapes()) for input_info in self.inputs_info])),
+        }
@@ -9,16 +9,11 @@ import os
 
 if os.environ.get("FRAMEWORK") == "paddle":
     import paddle
-    import diy
-    import layerApicase
-    import layercase
-
-    if os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleOCR":
-        import layerModelcase
-        import PaddleOCR
 elif os.environ.get("FRAMEWORK") == "torch":
     import torch
-    import layerTorchcase
+
+from generator import case_fixture
+from generator.case_loader import load_layer_case
 
 
 class BuildLayer(object):
@@ -26,9 +21,27 @@ class BuildLayer(object):
 
     def __init__(self, layerfile):
         """init"""
+        self.layerfile = layerfile
         self.layername = layerfile + ".LayerCase"
 
     def get_layer(self):
-        """get_layer"""
-        layer = eval(self.layername)()
+        """get_layer, 在case_fixture()内时同一case的各执行器复用首次构建的网络"""
+        fixture = case_fixture.current()
+        if fixture is None:
+            return self._build_layer()
+        return fixture.get(
+            "layer",
+            self.layername,
+            build=self._build_with_proto,
+            restore=case_fixture.copy_layer,
+        )
+
+    def _build_layer(self):
+        """构建网络"""
+        layer = load_layer_case(self.layerfile)()
         return layer
+
+    def _build_with_proto(self):
+        """构建网络, 并保留一份未被执行器修改的原型"""
+        layer = self._build_layer()
+        return case_fixture.copy_layer(layer), layer
@@ -0,0 +1,136 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+单个case内跨执行器共享的网络与输入
+"""
+
+import copy
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+if os.environ.get("FRAMEWORK") == "paddle":
+    import paddle
+
+
+class CaseFixture(object):
+    """
+    同一case的各执行器在相同的随机种子、默认dtype和设备下构建的初始网络与输入完全一致,
+    首次构建后缓存: 网络缓存原型, 每次交给执行器deepcopy; 输入缓存numpy, 每次重新生成tensor.
+    命中时恢复首次构建后的随机数状态, 保证后续随机行为与重新构建一致
+    """
+
+    def __init__(self):
+        """init"""
+        self.entries = {}
+        # 当前执行器内用于构建(或从缓存复制)网络与输入的耗时
+        self.setup_time = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(kind, layerfile):
+        """
+        缓存key: 构建类型、case、默认dtype、设备以及构建前的随机数状态
+        """
+        np_state = np.random.get_state()
+        rng = hashlib.md5(np_state[1].tobytes() + str(np_state[2]).encode()).hexdigest()
+        seeds = tuple(state.current_seed() for state in paddle.get_rng_state())
+        return (kind, layerfile, paddle.get_default_dtype(), paddle.device.get_device(), rng, seeds)
+
+    @staticmethod
+    def _rng_state():
+        """当前随机数状态"""
+        return np.random.get_state(), paddle.get_rng_state()
+
+    @staticmethod
+    def _set_rng_state(state):
+        """恢复随机数状态"""
+        np.random.set_state(state[0])
+        paddle.set_rng_state(state[1])
+
+    def get(self, kind, layerfile, build, restore):
+        """
+        :param kind: 构建类型, layer/data/numpy
+        :param layerfile: case
+        :param build: 构建函数, 返回(需要缓存的原型, 交给执行器的对象)
+        :param restore: 由缓存的原型生成交给执行器的对象
+        """
+        start = time.perf_counter()
+        key = self._key(kind, layerfile)
+        if key in self.entries:
+            proto, state = self.entries[key]
+            self.hits += 1
+            res = restore(proto)
+            self._set_rng_state(state)
+        else:
+            self.misses += 1
+            proto, res = build()
+            self.entries[key] = (proto, self._rng_state())
+        self.setup_time += time.perf_counter() - start
+        return res
+
+    def pop_setup_time(self):
+        """取出并清零当前执行器的构建耗时"""
+        setup_time = self.setup_time
+        self.setup_time = 0.0
+        return setup_time
+
+
+_current = None
+
+
+def current():
+    """当前生效的CaseFixture, 不在case_fixture()内或非paddle框架时为None"""
+    return _current
+
+
+@contextmanager
+def case_fixture():
+    """
+    在with内执行的各执行器共享同一CaseFixture
+    """
+    global _current
+    if os.environ.get("FRAMEWORK") != "paddle" or os.environ.get("PLT_CASE_FIXTURE", "True") != "True":
+        yield None
+        return
+    _current = CaseFixture()
+    try:
+        yield _current
+    finally:
+        _current = None
+
+
+def copy_layer(layer):
+    """交给执行器的网络副本"""
+    return copy.deepcopy(layer)
+
+
+def dump_inputs(data):
+    """
+    tensor输入保存一份独立的副本, 其余输入原样deepcopy保存
+    """
+    proto = []
+    for v in data:
+        if isinstance(v, paddle.Tensor):
+            proto.append((v.detach().clone(), v.stop_gradient))
+        else:
+            proto.append((copy.deepcopy(v), None))
+    return proto
+
+
+def load_inputs(proto):
+    """由dump_inputs的结果重新生成输入, tensor为新的叶子节点"""
+    data = []
+    for value, stop_gradient in proto:
+        if isinstance(value, paddle.Tensor):
+            tensor = value.clone()
+            tensor.stop_gradient = stop_gradient
+            data.append(tensor)
+        else:
+            data.append(copy.deepcopy(value))
+    return data
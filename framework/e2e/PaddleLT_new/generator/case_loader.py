@@ -0,0 +1,31 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+case loader, 按case路径只import对应的case模块, 不再整体import各case包
+"""
+
+import importlib
+import functools
+
+
+def case_module_name(layerfile):
+    """
+    case路径转为模块名
+    :param layerfile: 如layercase.sublayer1000.Clas_cases.xxx.SIR_1, 也接受layercase/sublayer1000/.../SIR_1.py
+    """
+    if layerfile.endswith(".py"):
+        layerfile = layerfile[: -len(".py")]
+    return layerfile.replace("/", ".").strip(".")
+
+
+@functools.lru_cache(maxsize=None)
+def load_case_module(layerfile):
+    """import单个case模块, 进程内缓存"""
+    return importlib.import_module(case_module_name(layerfile))
+
+
+@functools.lru_cache(maxsize=None)
+def load_layer_case(layerfile):
+    """case模块中的LayerCase类, 进程内缓存"""
+    return load_case_module(layerfile).LayerCase
@@ -0,0 +1,110 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+动态InputSpec剪枝搜索
+利用单调性: 若维度集合S设为动态后失败, 则S的任意超集失败; 若S通过, 则S的任意子集通过
+"""
+
+import os
+import json
+
+
+class SpecSearch(object):
+    """
+    在可动态化的维度集合上搜索:
+    - 极大通过集合: 贪心+二分地向已通过集合中加入维度
+    - 极小失败集合: 每个无法加入的维度, 收缩出一个包含它的极小失败集合
+    """
+
+    def __init__(self, items, check):
+        """
+        :param items: 可动态化的维度, 如[(输入序号, 维度序号), ...]
+        :param check: check(frozenset(维度)) -> bool, 将这些维度设为动态后编译执行是否通过
+        """
+        self.items = list(items)
+        self.check = check
+        self.passed = []  # 已知通过的极大集合
+        self.failed = []  # 已知失败的极小集合
+        self.attempts = 0
+        self.minimal_failures = []
+
+    def query(self, dims):
+        """查询集合是否通过, 能由已知结果推出时不执行check"""
+        dims = frozenset(dims)
+        if any(dims <= p for p in self.passed):
+            return True
+        if any(f <= dims for f in self.failed):
+            return False
+        self.attempts += 1
+        if self.check(dims):
+            self.passed = [p for p in self.passed if not p <= dims] + [dims]
+            return True
+        self.failed = [f for f in self.failed if not dims <= f] + [dims]
+        return False
+
+    def run(self):
+        """
+        :return: 极大通过集合
+        """
+        base = frozenset()
+        pending = [self.items]
+        while pending:
+            chunk = pending.pop(0)
+            if not chunk or self.query(base | frozenset(chunk)):
+                base |= frozenset(chunk)
+            elif len(chunk) > 1:
+                mid = len(chunk) // 2
+                pending[:0] = [chunk[:mid], chunk[mid:]]
+            else:
+                # base通过而base+{e}失败, 在base中收缩出与e共同导致失败的极小集合
+                item = chunk[0]
+                failure = frozenset(self._minimize(frozenset(), sorted(base), item)) | {item}
+                if failure not in self.minimal_failures:
+                    self.minimal_failures.append(failure)
+        return base
+
+    def _minimize(self, fixed, candidates, item):
+        """
+        fixed + candidates + {item}失败, 返回candidates中使其仍失败的极小子集
+        """
+        if not candidates or not self.query(fixed | {item}):
+            return []
+        if len(candidates) == 1:
+            return candidates
+        mid = len(candidates) // 2
+        left, right = candidates[:mid], candidates[mid:]
+        if not self.query(fixed | frozenset(left) | {item}):
+            return self._minimize(fixed, left, item)
+        if not self.query(fixed | frozenset(right) | {item}):
+            return self._minimize(fixed, right, item)
+        left_min = self._minimize(fixed | frozenset(right), left, item)
+        right_min = self._minimize(fixed | frozenset(left_min), right, item)
+        return left_min + right_min
+
+    def load(self, path):
+        """读入同一case已知的通过与失败集合"""
+        if not os.path.exists(path):
+            return
+        with open(path, "r") as f:
+            memo = json.load(f)
+        to_set = lambda dims: frozenset(tuple(d) for d in dims)
+        for dims in memo.get("passed", []):
+            self.passed.append(to_set(dims))
+        for dims in memo.get("failed", []):
+            self.failed.append(to_set(dims))
+
+    def dump(self, path):
+        """保存已知的通过与失败集合, 供下次搜索复用"""
+        to_list = lambda dims: sorted(list(d) for d in dims)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "passed": [to_list(p) for p in self.passed],
+                    "failed": [to_list(f) for f in self.failed],
+                    "minimal_failures": [to_list(f) for f in self.minimal_failures],
+                    "attempts": self.attempts,
+                },
+                f,
+            )
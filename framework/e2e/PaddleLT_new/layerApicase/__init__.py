@@ -1,3 +1,6 @@
-import layerApicase.perf_monitor
-import layerApicase.nn_sublayer
-import layerApicase.math_sublayer
+#!/bin/env python3
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+__init__
+"""
@@ -1 +1,6 @@
-import layerApicase.perf_monitor.manual_subgraph
+#!/bin/env python3
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+__init__
+"""
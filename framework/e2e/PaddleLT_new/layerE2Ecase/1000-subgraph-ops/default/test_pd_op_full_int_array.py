@@ -12,33578 +12,14 @@ if os.getenv('FLAGS_enable_pir_api') is None:
 if os.getenv('FLAGS_cinn_bucket_compile') is None:
     os.environ['FLAGS_cinn_bucket_compile'] = '1'
 
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_ead720a283058da12144a244b62bcc43(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_08b6032b6b2eee8eb34d9435e7ad2ee4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 21504, 1, 91]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bfb584b205ec0ada14dab759c4c87820(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08b6032b6b2eee8eb34d9435e7ad2ee4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_400ac20ea23f031a12ef077ac82ba058(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7bb36dde0245f81555efe2ca4efe84e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_400ac20ea23f031a12ef077ac82ba058
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6ed1966c0a881981521f4a5a53b7c7b7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 784, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_18d7ea7f1daed58202ef081878c8bc8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ed1966c0a881981521f4a5a53b7c7b7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6a8312208cfa96d96ac1815ec11a202b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 192, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75eeabf2c591d28c09b736fcdab2f258(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a8312208cfa96d96ac1815ec11a202b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_702ae8d3f918faae22a6720ba9466e3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 192, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4606af6656d5b2ef1d107059c2106ffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_702ae8d3f918faae22a6720ba9466e3b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c20df89ac24de022bbcea3f5b5ee1fe8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 49, 2, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_084aea685d5e0d2302f80223653d8d59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c20df89ac24de022bbcea3f5b5ee1fe8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4ae709f245734b4af82e233d7268886e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_098b803df09d090e7930a68fb7541b69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3d838b754c5f857c813c79fdcd77e40a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [300, 256, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b714021af825cb71caa929b47feef270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d838b754c5f857c813c79fdcd77e40a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_20c203f839453e6ec35e0e33e6844591(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 300, 256]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_71ed53aa781620915e7e96447ade2957(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20c203f839453e6ec35e0e33e6844591
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_79154baa38771c4bba95ef4282626426(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 8, 7, 8, 7, 96]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_44eff9d320849fdd8b26354dc131814b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79154baa38771c4bba95ef4282626426
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a6fa65556ba33070ee803cb46538ea59(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 64, 49, 3, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e2b24a0e280d44717ccb403f38c2e0b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6fa65556ba33070ee803cb46538ea59
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [3]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 3]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3287be7473b273deab12214f3ecb5edf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 3, 4, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_327d523844b0033d5c2e0bdb17c047ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3287be7473b273deab12214f3ecb5edf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bea15636a4a644d1a2436757269de5a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2b6ff0ba7e855833f5229d1726970729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bea15636a4a644d1a2436757269de5a6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_21aa6a520f221733961339e75d4d6c87(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 198, 3, 3, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_281e9923b82e81c5b532513447949737(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21aa6a520f221733961339e75d4d6c87
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8949cc56aaf2d6e2bc1899c328aa4972(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 198, 192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1a293e749e48d93e4baff408d4d0fc5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8949cc56aaf2d6e2bc1899c328aa4972
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a56f4f86f59c78b6cb485245e952ea2c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1960, 16, 2, 4, 6]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6caca02ac1e3064796ff37a8b407ba44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a56f4f86f59c78b6cb485245e952ea2c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_56ee45cd5307bd823b51d7c3e099d9ff(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1960, 16, 4, 6]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_07458a7e224aee88bb838da10577a964(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56ee45cd5307bd823b51d7c3e099d9ff
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7a3971b6fee5ed222d3fd0a33c5b86db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 784, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_022756c968ab5d1894408a588fb3d597(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3971b6fee5ed222d3fd0a33c5b86db
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7cc0898b015436904789fd060a593076(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 192, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fd14464c529b1b5856031f3597f120e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7cc0898b015436904789fd060a593076
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_56654525ee41bd501f3526cafc046432(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 192, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_37652e797fef4e32662c9b0e286a4853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56654525ee41bd501f3526cafc046432
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d08d79fa8d2498bdbefbbf2a30bca596(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 49, 2, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b26dde938c0571bde0a7f435e65ab905(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d08d79fa8d2498bdbefbbf2a30bca596
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [18, 9]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_562cf44d00bd13f86dacac82be540234(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 128, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fb5162f3cda8e960b0385b46257bfceb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 8, 7, 8, 7, 96]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_36faed679b29d554874045e7d51d70db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5162f3cda8e960b0385b46257bfceb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_540076db57e2b0ff7955528abd614497(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 64, 49, 3, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e268bdbfa4d035023b7236a2188aea22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_540076db57e2b0ff7955528abd614497
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_986d673224f1447353cc0931111ec30d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d96b6b2e62caf62737557ef48a9a3ef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_986d673224f1447353cc0931111ec30d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_45b962ff85d41648816fcefa20fd7cdc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7a9c9ad39cad667788cc3fbcd918dab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_45b962ff85d41648816fcefa20fd7cdc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fbbd36bf8f42d8b675eab4ba87c9ad0a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d8e9114eb3598a4d64ef6ba1ec4d65e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbbd36bf8f42d8b675eab4ba87c9ad0a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [5, 5]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [9, 9]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [13, 13]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_88a34db79dc9c2fa6ae55fbbc17b6715(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fb55c9844e7bfb059f134ddb1b87feb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_88a34db79dc9c2fa6ae55fbbc17b6715
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_98f506b8da9e19c7300f24e21110d031(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [100, 256, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5d82e94e02980a02b999a807c58513e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98f506b8da9e19c7300f24e21110d031
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_20784ed9689a52b5383ce3aebf86bab6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 100, 256]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7662a3c73358e3af3d758f60cbfe0438(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20784ed9689a52b5383ce3aebf86bab6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a0842b0d91631bb44247fc506b3993bd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 2, 9, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c6ae59521b0c3424609f5bd863ec45e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0842b0d91631bb44247fc506b3993bd
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e18b67ac57f9b301ef95a9688c5fc5da(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 2, 16, 9, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_622183760dff570d57cc655cbc7ba805(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e18b67ac57f9b301ef95a9688c5fc5da
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_17fe1af84260d2a34b624113478c2f3c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 32, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2423edd9559edccf4cdf3b13faa7b512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_17fe1af84260d2a34b624113478c2f3c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_46db485266745fb157ced2150c851fd5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 256, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_81400c7e0effaf6466a50e860580d1a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [80, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_69484d235b1ca459a64b7285aec61208(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2100]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a975fa13174ceea21439fb05e7a50023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69484d235b1ca459a64b7285aec61208
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b969cdf0660b8c6119f08c4520ca6172(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2100, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_295eece95007b7fea6abfd4e39190c02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b969cdf0660b8c6119f08c4520ca6172
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e55bb1c2ea854f6956985b946ce99d22(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0854950e420bfa460837f46ff7b8c5e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e55bb1c2ea854f6956985b946ce99d22
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b56fe571f3b794d3caeb399e0a9e5e4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d5d9470dd3fca90518e105edef053064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b56fe571f3b794d3caeb399e0a9e5e4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6ab266e3482efd9630b1fe0e0ff01519(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 196, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7bb9ee72c3db322101f685563c98df3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ab266e3482efd9630b1fe0e0ff01519
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ba01c2f99287fdbaa9111b0225163426(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 384, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_88c66d1aebbd728db244e6187096b695(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba01c2f99287fdbaa9111b0225163426
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_39be949e2b77795d9a7dbd1e8081767f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 384, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_490e23f6422f7fc6ee522c3465e9f9d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be949e2b77795d9a7dbd1e8081767f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_357841a461254c0ef36e001c6f699bbf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 49, 2, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_850f0d0c2d3fe367334dfff264d57e32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_357841a461254c0ef36e001c6f699bbf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c6b667294eae5202e92840a08623bb1b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return []
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9081754dabcf0797f74c139436375727(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-3, -3]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9904868deacb7b8eda13d30605927886(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [48, 48, 48]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5dab614d8d40d1ad1318e63ad730b9ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9904868deacb7b8eda13d30605927886
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_0854950e420bfa460837f46ff7b8c5e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e55bb1c2ea854f6956985b946ce99d22
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d5d9470dd3fca90518e105edef053064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b56fe571f3b794d3caeb399e0a9e5e4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_dc9dbb5e1cecdbfc1aa8d425d399d252(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 2, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ef251eaaaae80a66f584d828978cc39b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc9dbb5e1cecdbfc1aa8d425d399d252
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0aff8a85ffff63a0c289fd865157ef9c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 512, 8, 8]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_89d1f11443833ebe18f305eca59b5405(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0aff8a85ffff63a0c289fd865157ef9c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8d049308051c0e7a3aed39b7c9391848(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 4, 49, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3982aa990669b706ca739ff7c31bef5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d049308051c0e7a3aed39b7c9391848
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ea143fe534aee42ba8388811e8d7d12d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 4, 16, 49, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15d13a5d06fc39870eebf977b4e021f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea143fe534aee42ba8388811e8d7d12d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4f935bf73fa6b33a0173a56727915003(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 64, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_68cf66d2ea4a7cde0a0251697bed6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f935bf73fa6b33a0173a56727915003
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5f8d3a39dbe3bea4164c8362991c23d4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 3136, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8360b4463a8a33f5c5142e86854ed149(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5f8d3a39dbe3bea4164c8362991c23d4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2215e0d9eecbd36481c4272bdbb8caba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 96, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e018c7d0539e7c770365dfcac5d10bcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2215e0d9eecbd36481c4272bdbb8caba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4efb684e7d43812599e5fd6af169263e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 96, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6eb96a943b11cdfbdc1beb33848ed635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4efb684e7d43812599e5fd6af169263e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_48c9c1a470dcb930c35bec99fe2dee29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 49, 2, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3f67a81749a800186b582e90450577e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48c9c1a470dcb930c35bec99fe2dee29
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_327d523844b0033d5c2e0bdb17c047ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3287be7473b273deab12214f3ecb5edf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2b6ff0ba7e855833f5229d1726970729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bea15636a4a644d1a2436757269de5a6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_021403311397e477211c932caab1113f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_13b14f75561995463dd39f960e8cbb94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5160316c0187062b7fa6aab507da1da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13b14f75561995463dd39f960e8cbb94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [8, 8]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c048b083b1032ef1790b305851b311fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [16, 16]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a6ada2db19f7c1fa61d93dfc4a02d797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c048b083b1032ef1790b305851b311fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a6ada2db19f7c1fa61d93dfc4a02d797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c048b083b1032ef1790b305851b311fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5160316c0187062b7fa6aab507da1da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13b14f75561995463dd39f960e8cbb94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 512, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_96d9f068a087c8262a0710e83287a373(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 512, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0dc8eb3623861f6d13d1c5e0a2fdbc77(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 19, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fbc1dbebafd09e25ecb5e201d77ae9e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0dc8eb3623861f6d13d1c5e0a2fdbc77
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6c64e7746cc740793e8f481eb0aaa305(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 96, 96]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_506d5abdc3583c38b16b0dfb82b43b85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c64e7746cc740793e8f481eb0aaa305
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_83071207bb70c2ca0becabceb812198f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4b268f70e8b56d0f40e97046ecc414b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83071207bb70c2ca0becabceb812198f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ec6125497c371d5e6ed0236254b287b0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [40, 40]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8195288ac69651e914de1f540d99d770(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ec6125497c371d5e6ed0236254b287b0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f9ebaccabb1e6489efc196677005ca75(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [512, 1, 3, 3]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_66c2597015ba22a51dc13bce7055d812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f9ebaccabb1e6489efc196677005ca75
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fd8592a3777010f978ce09f4a5be25b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 1, 1, 0, 0]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_febd2f7129b26cf1a9dfb22620d557e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd8592a3777010f978ce09f4a5be25b1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7bb36dde0245f81555efe2ca4efe84e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_400ac20ea23f031a12ef077ac82ba058
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8cb2a53b19e1747c0a6a661fb9961f1e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 4, 7, 4, 7, 192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_53b8c357f0fb59f15f290cd26fc07293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cb2a53b19e1747c0a6a661fb9961f1e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_28aad7957de6b1d9d9186a08495a0f14(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 16, 49, 3, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e382f5b7c00c29a67f8de38f9005900b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_28aad7957de6b1d9d9186a08495a0f14
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_88fe997ed774f6d7458831e516bda778(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 21, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_66c9d360395af87e53178593e86b804f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_88fe997ed774f6d7458831e516bda778
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7f14f4099f7f704d07d74ab37e903ba1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 64, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_509a418a0147a00a29499ebc565918ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f14f4099f7f704d07d74ab37e903ba1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f934f3db74ab3e9af3e32e7114f12403(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 144, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_57b2b803bc81457e64900038436be590(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f934f3db74ab3e9af3e32e7114f12403
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a6ada2db19f7c1fa61d93dfc4a02d797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c048b083b1032ef1790b305851b311fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5160316c0187062b7fa6aab507da1da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13b14f75561995463dd39f960e8cbb94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b068ab23d78637c3c5d45b88d6195bce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [3, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13396d4120f9edf73cc395d4c38e5c2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b068ab23d78637c3c5d45b88d6195bce
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d8e9114eb3598a4d64ef6ba1ec4d65e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbbd36bf8f42d8b675eab4ba87c9ad0a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fa8048168ee774a5211b60ce796dffa3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 197, 2, 6, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_73a6a2137d9fba282d81821a4381a9b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa8048168ee774a5211b60ce796dffa3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_37132ffd5ba43c713a4190febdc32984(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 197, 6, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8b04cf4c5997a91ec43c5485f3c066ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37132ffd5ba43c713a4190febdc32984
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f35b3c1e4d2b512f3bfc903aca44bcd5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 96, 48]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_748496b0586105753ef13d03c4f7d81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35b3c1e4d2b512f3bfc903aca44bcd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ff046f475cc9fe476a3a2e80e17c095c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 4, 7, 4, 7, 192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7a57c18ce1d43d530f1c63e2639c9243(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff046f475cc9fe476a3a2e80e17c095c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9520fdd1830b0934a30aa736cc667422(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 16, 49, 3, 6, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2d37c47f4d59e3dcafc5dc82fcf2066f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9520fdd1830b0934a30aa736cc667422
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c04c52ae9a4dbfdfd6a26cfcc0daacdf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 16384, 2, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d3034f43808ea41545454753589fd3bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c04c52ae9a4dbfdfd6a26cfcc0daacdf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_15f6c8b2e6e88c378da899027449c8b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 128, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b85ab35dfb82f6ea4cd93d4362ff0740(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15f6c8b2e6e88c378da899027449c8b3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6efb62e6a5eeaf518eda1914b6d22cd6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 2, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f1fc497f9548e030ead6598e68a2593e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6efb62e6a5eeaf518eda1914b6d22cd6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0da8c60f090a15c4fafb4f198760f93f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 16384, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1ae73862abac7ba9d3ce486a0a3d39de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0da8c60f090a15c4fafb4f198760f93f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8360b4463a8a33f5c5142e86854ed149(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5f8d3a39dbe3bea4164c8362991c23d4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e018c7d0539e7c770365dfcac5d10bcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2215e0d9eecbd36481c4272bdbb8caba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6eb96a943b11cdfbdc1beb33848ed635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4efb684e7d43812599e5fd6af169263e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_3f67a81749a800186b582e90450577e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48c9c1a470dcb930c35bec99fe2dee29
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3c4de0531502fb31fac449330e3d779e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 68]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 4, 17]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2d4ea37bd3ef09a0d883128c72942b1c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 49, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_882ac8256e59ae71ca486525477fbc18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d4ea37bd3ef09a0d883128c72942b1c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fcff494b005a3ee1d4c2a869dbdef71d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 49, 2, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8045d5ace5a3590c80936dfe129c3257(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fcff494b005a3ee1d4c2a869dbdef71d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_509a418a0147a00a29499ebc565918ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f14f4099f7f704d07d74ab37e903ba1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7bb36dde0245f81555efe2ca4efe84e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_400ac20ea23f031a12ef077ac82ba058
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_47a9a858c3b4ebf79ce58ddccead3aaf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 4, 49, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c3147592ad3d1be1a7bf47e071c15fbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a9a858c3b4ebf79ce58ddccead3aaf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1583139732e821d7280376a2969ee34d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 4, 16, 49, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_02ade398e75d1688fa23a5b75235fcbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1583139732e821d7280376a2969ee34d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0fafc7895082c5fde1b1c1ef2e4f9ded(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 64, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b772f928fb9f102ec15225ff24b5280a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0fafc7895082c5fde1b1c1ef2e4f9ded
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7cc292a20c90e91d454ec277ad746130(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 96, 200, 304]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd7bcfd3b556c965450f0868bae48895(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7cc292a20c90e91d454ec277ad746130
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8cc22b65ea864d7c2c072a2edc9f9b9c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 3, 2, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e3fb4792a3d9d1721e0ca3e34bd4d42b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cc22b65ea864d7c2c072a2edc9f9b9c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a392da7b6bed7ccf10502e78110210e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7384b56cc9535a786f13a5affbead729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a392da7b6bed7ccf10502e78110210e9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_281e9923b82e81c5b532513447949737(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21aa6a520f221733961339e75d4d6c87
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1a293e749e48d93e4baff408d4d0fc5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8949cc56aaf2d6e2bc1899c328aa4972
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d0a62ed05f7f2f86948582850bac7e8a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 3136, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0c9d2e2e27a50c47bf676e5f2f787f9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0a62ed05f7f2f86948582850bac7e8a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b482bd353c039ef3b8161b56a93d937a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 96, 56, 56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cd815a2fe00bbd8c7ecfffea3f4d7bb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b482bd353c039ef3b8161b56a93d937a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d0c076223bc64effbe577ab5596cdd57(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 96, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_133dfe7be0a8dea3dc1492d857ad4cfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0c076223bc64effbe577ab5596cdd57
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_76658e827393854dc8fe9948dd55cf36(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 49, 2, 3, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_54660a78f21ede040e45032352b1f999(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76658e827393854dc8fe9948dd55cf36
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fec917fcffa0a00a2b702ff8ccbec50e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 320]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9e05517ead01da912aba663b7c3acf71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fec917fcffa0a00a2b702ff8ccbec50e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c094490656203baee91c2c2f50cf04ed(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 96, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5544f630d6b84e81dc431b8eaf5d068b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c094490656203baee91c2c2f50cf04ed
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3b241852f4df424de2f37a50d6edbe75(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 288, 192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_96657eb619403e6d3be343aea5adfb06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b241852f4df424de2f37a50d6edbe75
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a8c921bc5687b82faa7aac8d64b551a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 1, 7, 1, 7, 768]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_effe4c572a28332ecc5912a7a4b5b194(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8c921bc5687b82faa7aac8d64b551a3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6d3f12eb59747adbc0c25d8e22c3e5bb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 1, 49, 3, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_53e44eeaa6a706397ed3dba4d1b0b376(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d3f12eb59747adbc0c25d8e22c3e5bb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_980b6dcf5d1b816457a6eb83cbb5c937(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4312, 16, 2, 4, 6]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6f02e969aa765ec59d58699ee18c7aa8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_980b6dcf5d1b816457a6eb83cbb5c937
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_00cf765fae79505d68d32b0e956774fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [4312, 16, 4, 6]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5beee883307c63492079eff49c7969af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00cf765fae79505d68d32b0e956774fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_16cbdc5bd9b4960a82c7b792176db052(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [48, 48]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8811bec1e55345068c1ca00c6e2d09b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16cbdc5bd9b4960a82c7b792176db052
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [3, 3]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b6087266e72c06a1db27375be7ff5d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_36faed679b29d554874045e7d51d70db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5162f3cda8e960b0385b46257bfceb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e268bdbfa4d035023b7236a2188aea22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_540076db57e2b0ff7955528abd614497
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_53daaa1944d78fbb21a03f3ef7df6c89(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [120, 120]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_052433b9be9b92fd4583cafc4c43cc27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_53daaa1944d78fbb21a03f3ef7df6c89
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_748496b0586105753ef13d03c4f7d81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35b3c1e4d2b512f3bfc903aca44bcd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c7fd3b4b61e75ac106d191d9718dce65(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 32, 49, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a549aad4e36d2572788e1033105202ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c7fd3b4b61e75ac106d191d9718dce65
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bb1e69561612f3b5a6e6a7bcc674596c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 32, 16, 49, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0129413695fc2629267c6d9d0c2c9adf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb1e69561612f3b5a6e6a7bcc674596c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_47ce9709cbbab4e01dc7a6ceb6791811(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 512, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6fee203eede99f90679c683d2ba888b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47ce9709cbbab4e01dc7a6ceb6791811
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_052433b9be9b92fd4583cafc4c43cc27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_53daaa1944d78fbb21a03f3ef7df6c89
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_eb722481b36769008816ec513f34d59f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 144, 768]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f614b01a94d8468f76c84e96abdfdf4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eb722481b36769008816ec513f34d59f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_506d5abdc3583c38b16b0dfb82b43b85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c64e7746cc740793e8f481eb0aaa305
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_96657eb619403e6d3be343aea5adfb06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b241852f4df424de2f37a50d6edbe75
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b6087266e72c06a1db27375be7ff5d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f614b01a94d8468f76c84e96abdfdf4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eb722481b36769008816ec513f34d59f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e2e9eb9a57350fb487fbe0e76b486d6a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 196, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4a6939f17ebe1f411aa1d68dba710209(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2e9eb9a57350fb487fbe0e76b486d6a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b2a04528ca69b20309f160e4d5aa1e90(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 384, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d4a9ed8f00321967cadfbf216d343e66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2a04528ca69b20309f160e4d5aa1e90
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1d702a50944d39536a58cdbfcafe5af0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 384, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a59577c4657ce822df54973df7e37ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d702a50944d39536a58cdbfcafe5af0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5791134c77d0d5f7594b9aac113d0949(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 49, 2, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e289fa18a2b6e7a83328d78e8702817c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5791134c77d0d5f7594b9aac113d0949
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_748496b0586105753ef13d03c4f7d81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35b3c1e4d2b512f3bfc903aca44bcd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b85601cd82edd4f8c3a7bb70882c12e3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f9574d10f3f917293d47d3cb739b159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b85601cd82edd4f8c3a7bb70882c12e3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_67a96a6951a3ff3f334379d226512cfc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0b07f63c426f36eb74472628f9132343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67a96a6951a3ff3f334379d226512cfc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_327d523844b0033d5c2e0bdb17c047ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3287be7473b273deab12214f3ecb5edf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2b6ff0ba7e855833f5229d1726970729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bea15636a4a644d1a2436757269de5a6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_08ec36973b7550dc012128b8bd554e29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ccd78952dc94b5ae4d0ff7a3b1748962(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08ec36973b7550dc012128b8bd554e29
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b553d0d93841043c34b87994f7b592c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 784]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dd01cad69c76b26710947620dd166aa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b553d0d93841043c34b87994f7b592c6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_fb55c9844e7bfb059f134ddb1b87feb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_88a34db79dc9c2fa6ae55fbbc17b6715
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_139c6dda00e2df3224bdb21579b90ceb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 21]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04fdf8cdb03dc386773c8a92a6c8fb2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_139c6dda00e2df3224bdb21579b90ceb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6252114d73407656e9fee6f60f77856f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 76]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4db6268f9a5c54bd845c64129545c6fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6252114d73407656e9fee6f60f77856f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2e3dbce97d31180d43ebcab66f5fd898(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 4, 19]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0c67374d311401f080a13da2bcd98198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e3dbce97d31180d43ebcab66f5fd898
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_748496b0586105753ef13d03c4f7d81e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35b3c1e4d2b512f3bfc903aca44bcd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_deadb23566a57d100c0585f854081503(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 32, 100, 2]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_077c3da38c24c295dc856e174d5d6341(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_deadb23566a57d100c0585f854081503
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_fb55c9844e7bfb059f134ddb1b87feb8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_88a34db79dc9c2fa6ae55fbbc17b6715
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4e288d96cc7b408a95a2fe9f2432264f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 49, 8, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9771359548a3621bc8d42b1059b473b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e288d96cc7b408a95a2fe9f2432264f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_aa2143aeeb1be0f0383e20d0870d1e1f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [16, 16, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d75bbc2bfbd73c103a09922032873c30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa2143aeeb1be0f0383e20d0870d1e1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [5]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_29415fbb719df50410b6f8207cde9bca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [6]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5797119400bfb73c6f328e161113e6c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f810e52770ef852d9030763aa075eef9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_99c9aac5949beb67b2ac7f3cf5def99c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f810e52770ef852d9030763aa075eef9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1f593e8f9fd93d6fde772683e40de809(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [8]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f5cacc90efef88a6d751a7e1e184f8dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f593e8f9fd93d6fde772683e40de809
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [9]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_eb1d168608d6f66dafacbcd9e5515f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0967baa07747e7739486b03c04e59a47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4e652df4addd42a794cb371d4fbe0af9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0967baa07747e7739486b03c04e59a47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7607b0ee868936ebca2018db580bb897(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75243ef385eb705a0c2e7fef835ed1ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7607b0ee868936ebca2018db580bb897
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [12]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2ea18ad3205fa44181ceef0831333ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_367925790dc3859c96f21af261333b20(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [13]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_089de6934c95cf5bc3a14b8559193a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367925790dc3859c96f21af261333b20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ba18b6831f654e5fd792b3da68286271(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_351f25d02c7dab9c9b9c18dd3b0e4c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba18b6831f654e5fd792b3da68286271
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d17c099079290a1295bd39e972a19c60(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [15]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1a10e1a513d55765a22200aed5cc3536(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d17c099079290a1295bd39e972a19c60
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a9199396bd8c5960518fdd90a69614a0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [16]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_884a267495e79f47d6b8bed0e29912c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9199396bd8c5960518fdd90a69614a0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ca3808a55dfef2b628026b3c7577571e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [17]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4801990df0925b22b812b37f5f273110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca3808a55dfef2b628026b3c7577571e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_823d0f8044e35043a8acf536716a819c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [18]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_74f98401af65dfce27e6442e0a9569f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_823d0f8044e35043a8acf536716a819c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9fef882879548e55d9c1943c16ac807b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [19]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e0459d4d598c2c8a8cc9e81c12b95ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9fef882879548e55d9c1943c16ac807b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cc6b24b5bbbf3ff097bcd24755868265(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [20]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c08579689b0f0c987270f0680672e025(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc6b24b5bbbf3ff097bcd24755868265
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_87e0018222f64d38ecc63494a02d1eb7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [21]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1c83d9148306a76d31849725d7e0f7b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87e0018222f64d38ecc63494a02d1eb7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0a31fd70f0417f647236ee21c0383c4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_23fffb961cc474b03e6506e9faa9d70e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a31fd70f0417f647236ee21c0383c4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a2c67bef23c7ef297c126fe29bf47f8e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [23]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_001673c934126ab938f5604153bb61fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c67bef23c7ef297c126fe29bf47f8e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_dcabe545e5053c163024b21946041d54(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [24]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9085f739a7e398358b147139b177bf87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcabe545e5053c163024b21946041d54
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_688062c6e45af3d5288b3bd5573ab8fc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [25]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_46be509556dd0919abdf924d27961cd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_688062c6e45af3d5288b3bd5573ab8fc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a3e7f8bbd69907b88b79e67ad3e2b9e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [26]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f7a3aad1581148a7cd6b8d47f1a16f85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e7f8bbd69907b88b79e67ad3e2b9e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f6aacd84ab79f2507edf1475e93bb092(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [27]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4bbf877bb83e6d1a53c038caa1b9229f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f6aacd84ab79f2507edf1475e93bb092
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7c47fc7a099c0f2b12175ec2c899429b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_16e4f27f424bdf1bd0e1e736c57b459d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c47fc7a099c0f2b12175ec2c899429b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1550adb14a979279feed565493ff2ff1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [29]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1f29be30c13d879b46e4c145691c0c41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1550adb14a979279feed565493ff2ff1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_109afcb21c7acc142bfbd0ebad99fd95(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [30]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_70e078feffdea965b8adf67c941cb030(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_109afcb21c7acc142bfbd0ebad99fd95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f7069af4ee7287de477d218947ca37cb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [31]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_678b40bc84e302d2fde85cc31d9b0150(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7069af4ee7287de477d218947ca37cb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2db77e0096767510c5c8e512855a6e7a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d98265293c904acff69d37b4af790707(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2db77e0096767510c5c8e512855a6e7a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1b731676de3be9e77139508525672248(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [33]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f75158ad298add7c2907ef52ba34a887(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b731676de3be9e77139508525672248
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f57b2ee215132a79dba2fc8c9e31a1a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [34]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_65b08b18172031e43b10912665197478(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f57b2ee215132a79dba2fc8c9e31a1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3604d46745352795e4f2bf4d384db653(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [35]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_80ec9a7f3f9e234fa7ebdfceb8a87a24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3604d46745352795e4f2bf4d384db653
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_68c8893757dc8e5f5aa31fc390eeade8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [36]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_74083d4d41c1b780545f56fb5d068f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c8893757dc8e5f5aa31fc390eeade8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8c8c6dd8dd7b56f6afba7c9cbae0963c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [37]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7ddcf02e08cc76df00a43481b043af86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c8c6dd8dd7b56f6afba7c9cbae0963c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1d6c57ba7a84448ad7173766630cba95(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [38]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e2418dcd1bc2906252d855b669a8ff8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d6c57ba7a84448ad7173766630cba95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_91db64e884a150edc5736928ab02b1f3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [39]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a67c2463d94ed1cb2a5f97774189b93d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91db64e884a150edc5736928ab02b1f3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_19c042101f54bbef2eae914766827d43(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [40]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e500fb1d5bb70b99945a1315c4e502bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_19c042101f54bbef2eae914766827d43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f81fd858a5d6a0f16a3f6adfc140b928(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [41]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9656e88c194b5dcbb5287ea83ab4fc69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f81fd858a5d6a0f16a3f6adfc140b928
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f02aa7aaa8e438fc4adc8dbd05452c02(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [42]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a460023ffcb59bd51d747e51db4447ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02aa7aaa8e438fc4adc8dbd05452c02
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bd8919aed8876109d86760378408d812(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ad8aa4b62db8ceb19ee32c7c93df0acf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd8919aed8876109d86760378408d812
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e5e366b081cbb16282e173299b24fc1b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [44]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b09c630451294e8278396766df37e6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5e366b081cbb16282e173299b24fc1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3d8f16d614d7c144a0270d14ce23199d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [45]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd2c7732545483103757248571069354(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d8f16d614d7c144a0270d14ce23199d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_adbfea0a320350d90576b6c3f6a5793f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [46]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2ad58719340902d4d95aaaf1f513f53a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_adbfea0a320350d90576b6c3f6a5793f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d5785abde96aac6c65ba826ff8fda61e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [47]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3d7a9281c4230975879ca0228022c002(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5785abde96aac6c65ba826ff8fda61e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fb5208c445c54e6a2689501d862cabba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [48]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_caa3e6ef940f9893f52120679dd3ef42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5208c445c54e6a2689501d862cabba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_92ed97625bf2a619eb371fc509cd131e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_464c1b8d64c4e8a9dd767a6ac56c30a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92ed97625bf2a619eb371fc509cd131e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_efff2d8db9e402772c137cac88f8f593(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 49, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3711c745da9ffc9e66d2d72bb8c651b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efff2d8db9e402772c137cac88f8f593
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_71842514ba332dfef650dfcac9847d1f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [160, 160, 160]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_711538219e89e7c553dd9a12d2bb7fe4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71842514ba332dfef650dfcac9847d1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4d2309fe7acb41f058e664a06bdc7878(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_277650d4eb92562cca38e0bc4e2ca812(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d2309fe7acb41f058e664a06bdc7878
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d782634f6b3e9477cb472ee9761c952b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 196]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_468fa898b647615edd6365e2bd9ebd45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d782634f6b3e9477cb472ee9761c952b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b6087266e72c06a1db27375be7ff5d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_037055961a512102d00fcf24d3c8709e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 8, 49, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_35fc4adf6436b4c15746874003d9e543(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_037055961a512102d00fcf24d3c8709e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_92647b717aa1ffabd905ae5839e61126(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 8, 16, 49, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b82ac062b4b1ea9106cdd4c61bb3b76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92647b717aa1ffabd905ae5839e61126
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_606e6fcecaf08312c87151a2e78997d2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 128, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_93d67d8cf7811869f0f5e0d51d237d40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_606e6fcecaf08312c87151a2e78997d2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_fd14464c529b1b5856031f3597f120e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7cc0898b015436904789fd060a593076
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_88c66d1aebbd728db244e6187096b695(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba01c2f99287fdbaa9111b0225163426
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d96b6b2e62caf62737557ef48a9a3ef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_986d673224f1447353cc0931111ec30d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5160316c0187062b7fa6aab507da1da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13b14f75561995463dd39f960e8cbb94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a6ada2db19f7c1fa61d93dfc4a02d797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c048b083b1032ef1790b305851b311fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2049d59244dd5f67587095b8b0524626(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 3549]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7cc408aec7a69afb3929e74e5ce28b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2049d59244dd5f67587095b8b0524626
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d4564fc03040de4b856fb45d7d21ae8e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 3549, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aec6c16bb996387b763b76d520859c15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4564fc03040de4b856fb45d7d21ae8e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6d8f254f7f2fd6e1a67db7b8f3ca8a0c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 16, 49, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_791c12aceed2750801cce384698dafb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d8f254f7f2fd6e1a67db7b8f3ca8a0c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5fdff8c447a376be7df7ca94cfd77f89(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 16, 16, 49, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_24b391d953f15603dd924a6665c99537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fdff8c447a376be7df7ca94cfd77f89
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3f7a2440cd4ad91a18bed3355f0c0422(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 256, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_68e9d72c8dabf44bf3c8d44c5388cf57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f7a2440cd4ad91a18bed3355f0c0422
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7a57c18ce1d43d530f1c63e2639c9243(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff046f475cc9fe476a3a2e80e17c095c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2d37c47f4d59e3dcafc5dc82fcf2066f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9520fdd1830b0934a30aa736cc667422
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_870cfdc56ca769b4bc6ca1d30ea58675(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [512, 1, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6a0a98a554fe3a913d3386e72c06a59e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_870cfdc56ca769b4bc6ca1d30ea58675
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a7589d240789d9724f6a03fdd939401f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [3, 3, 3, 3, 0, 0]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_56a36b4a1b43e6b49448aff6fb343b61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7589d240789d9724f6a03fdd939401f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_33bf4ae3b5e76910ace1607def1e6ba4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4, -1, 13, 19]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2210d037517e08e92bf13f280b02095d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33bf4ae3b5e76910ace1607def1e6ba4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_903e9ff2a3d4c5573dd7d0b046fa4b8e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 20, 13, 19]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2abe8862a86a95f9d1297390360e70a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_903e9ff2a3d4c5573dd7d0b046fa4b8e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b1628241837d2a3a67ea27b4701ba50e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [80, 80, 80]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3654d210c1f42f01934dce4f427cd34d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1628241837d2a3a67ea27b4701ba50e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8037d9f3e19a8cf2a17d3a3c4f930d1f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 64, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_41ea1e33aa6048aa3792c8c893228ca9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8037d9f3e19a8cf2a17d3a3c4f930d1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8e66456b443ff8b3b88ea4583c401f9d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 196, 8, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_411560060238fb60855991e60a6faf2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e66456b443ff8b3b88ea4583c401f9d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b574ccd278dd35090b509727890615c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [16, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1319f6b9461046fc95863fdbcd66da09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b574ccd278dd35090b509727890615c4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_791c12aceed2750801cce384698dafb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d8f254f7f2fd6e1a67db7b8f3ca8a0c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_24b391d953f15603dd924a6665c99537(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fdff8c447a376be7df7ca94cfd77f89
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_68e9d72c8dabf44bf3c8d44c5388cf57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f7a2440cd4ad91a18bed3355f0c0422
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f3cc5c9c7d4258618b5217810f05ea14(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [512, 1, 5, 5]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_296781b87a548393f2db21719492747e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3cc5c9c7d4258618b5217810f05ea14
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_329bc31662b4d0bbfcc4e8013dbe59c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 2, 2, 2, 0, 0]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b826baac609603a109e27f140c958a71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_329bc31662b4d0bbfcc4e8013dbe59c7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b675f832190013c8bc4c775aa3551c99(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [300, 300, 300, 300]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_42c84ae1c15b25620e194c9fed6ca9de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b675f832190013c8bc4c775aa3551c99
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7b4e0db2cbc0c5ed065b17b9c06d7ae0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 49, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_69e488a5c3213b3687d904c01af084a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b4e0db2cbc0c5ed065b17b9c06d7ae0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_facd1962768a6da9be89664860bee711(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 49, 2, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4629c5bb4d1e5f2dc841f1321276c46a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_facd1962768a6da9be89664860bee711
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b6087266e72c06a1db27375be7ff5d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_576763d890dc67bd37dadf91c59cbe40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 128, 4, 80]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1248fc6f483a25ee29f4d3d3ff8b2883(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_576763d890dc67bd37dadf91c59cbe40
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cd815a2fe00bbd8c7ecfffea3f4d7bb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b482bd353c039ef3b8161b56a93d937a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_98a884cc27aa13faa019f947023bc7c2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4116]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b30452ef964fdff4a4d8d64847f3f77e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98a884cc27aa13faa019f947023bc7c2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_77c8f9b011c0be47bfbba8daf8e6676f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4116, 4]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1f4c9adbbb15c90c4c2f020ab05c3307(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77c8f9b011c0be47bfbba8daf8e6676f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fdb04890be148f362dccf19c4df64e1d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2048, 5, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c7fc9d38b4a18a2c54f757d23d54947b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fdb04890be148f362dccf19c4df64e1d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_138ed6001618aecd8322cd022d5192e2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 160, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b0b5bc02d48be135c170320bfeb8f171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_138ed6001618aecd8322cd022d5192e2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8a4d52c52d959119d3f005e6b8b052bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 5, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a1c62265eaba3187aced22fdfd3e7a17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a4d52c52d959119d3f005e6b8b052bf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a9c110624ba2b9d9eb6892c4e7ae258a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2048, 160]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f46a3d25e1df74d78a4069c255664246(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9c110624ba2b9d9eb6892c4e7ae258a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a6e6169810a3342fbe050e1dd5785664(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 64, 8, 25]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4d06231f8c537c30dce8d44e95a5712b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6e6169810a3342fbe050e1dd5785664
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_18d7ea7f1daed58202ef081878c8bc8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ed1966c0a881981521f4a5a53b7c7b7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75eeabf2c591d28c09b736fcdab2f258(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a8312208cfa96d96ac1815ec11a202b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4606af6656d5b2ef1d107059c2106ffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_702ae8d3f918faae22a6720ba9466e3b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_084aea685d5e0d2302f80223653d8d59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c20df89ac24de022bbcea3f5b5ee1fe8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_367337e41c11857d7f8b870014a0c34c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 320]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_30563dae4e33ebaaca92aa331c772f1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367337e41c11857d7f8b870014a0c34c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_35fc4adf6436b4c15746874003d9e543(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_037055961a512102d00fcf24d3c8709e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6b82ac062b4b1ea9106cdd4c61bb3b76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92647b717aa1ffabd905ae5839e61126
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_93d67d8cf7811869f0f5e0d51d237d40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_606e6fcecaf08312c87151a2e78997d2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_effe4c572a28332ecc5912a7a4b5b194(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8c921bc5687b82faa7aac8d64b551a3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_53e44eeaa6a706397ed3dba4d1b0b376(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d3f12eb59747adbc0c25d8e22c3e5bb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1ee48f0926658835b8200d959c01f519(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 197, 3, 3, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e0250645ca6d60eeb748b116a62ce968(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ee48f0926658835b8200d959c01f519
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fe3d05dba21a8a29bcd0d610c0e82b40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 197, 192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6e8460cc7f0b5fafffcbc1cc48c894c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe3d05dba21a8a29bcd0d610c0e82b40
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5b40b42d9a0b9fb3921067be5449b06f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 65536, 1, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_442639d9c449bb50fdddcab2979293c7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b40b42d9a0b9fb3921067be5449b06f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_42b3395c014615693e6ebea4fc562267(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 32, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d2a4ff1fca3ca9381198a9504e8a876e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42b3395c014615693e6ebea4fc562267
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_eec6fb38aef80e7443cd90bd31329162(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 1, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_45d6cb101445bc4ff998e6ca5ac5a4b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eec6fb38aef80e7443cd90bd31329162
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d01005ed10ac8a633fb7e0f871e266bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 65536, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1308252232bb0785ab3f68f52f3103c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d01005ed10ac8a633fb7e0f871e266bf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b714021af825cb71caa929b47feef270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d838b754c5f857c813c79fdcd77e40a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_71ed53aa781620915e7e96447ade2957(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20c203f839453e6ec35e0e33e6844591
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_40481ccfd47f450d90af8fffc0503aa3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 64, 8, 80]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1059d45c9bb21bf6cce5763a45d67094(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_40481ccfd47f450d90af8fffc0503aa3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_53b8c357f0fb59f15f290cd26fc07293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cb2a53b19e1747c0a6a661fb9961f1e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e382f5b7c00c29a67f8de38f9005900b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_28aad7957de6b1d9d9186a08495a0f14
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_900dad8638a45e0b769e709194bbe1a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [90, 90, 90, 90]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1ece7eabd30079ce9c2eae1539d09dbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_900dad8638a45e0b769e709194bbe1a1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_96657eb619403e6d3be343aea5adfb06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b241852f4df424de2f37a50d6edbe75
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_0c9d2e2e27a50c47bf676e5f2f787f9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0a62ed05f7f2f86948582850bac7e8a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cd815a2fe00bbd8c7ecfffea3f4d7bb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b482bd353c039ef3b8161b56a93d937a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_133dfe7be0a8dea3dc1492d857ad4cfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0c076223bc64effbe577ab5596cdd57
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_54660a78f21ede040e45032352b1f999(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76658e827393854dc8fe9948dd55cf36
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d4a9ed8f00321967cadfbf216d343e66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2a04528ca69b20309f160e4d5aa1e90
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89d1f11443833ebe18f305eca59b5405(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0aff8a85ffff63a0c289fd865157ef9c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_10fcd1cd112390c833c30782d72927cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [144, 144, 144, 144, 144]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_725aa46ad5e809ad0878c1ff19802c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10fcd1cd112390c833c30782d72927cd
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_327d523844b0033d5c2e0bdb17c047ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3287be7473b273deab12214f3ecb5edf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2b6ff0ba7e855833f5229d1726970729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bea15636a4a644d1a2436757269de5a6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ea87efa0d582306e1c34da588f6edb88(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [600, 600]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d6e8fd20e0d9ee32fcf43e6fdcb6c4c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea87efa0d582306e1c34da588f6edb88
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b2731dca46eb1e546835a80b41b2db5d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [6, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1fc9cd77746e758f98554b4ed0cf7b84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2731dca46eb1e546835a80b41b2db5d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d8e9114eb3598a4d64ef6ba1ec4d65e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbbd36bf8f42d8b675eab4ba87c9ad0a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_28969864e30b333a90ba711ab4c35dd7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 32768, 1, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_340bdbe683bb3079a7c832c9f103ab43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_28969864e30b333a90ba711ab4c35dd7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9f212db08291a5c63557280656f9dc42(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 64, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_45af90ec73cbf6194f2a995d5602f0b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f212db08291a5c63557280656f9dc42
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_931cbfdadc733b6c570c33cc9a41b0aa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 1, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5678cf1dc9f50cf4df2bdea84e4bea43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_931cbfdadc733b6c570c33cc9a41b0aa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_341ba70a9362b2d2a04baea152827be2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 32768, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e27e49ad0aae82136ef0ed914e99c079(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_341ba70a9362b2d2a04baea152827be2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_69e488a5c3213b3687d904c01af084a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b4e0db2cbc0c5ed065b17b9c06d7ae0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4629c5bb4d1e5f2dc841f1321276c46a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_facd1962768a6da9be89664860bee711
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e3fb4792a3d9d1721e0ca3e34bd4d42b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cc22b65ea864d7c2c072a2edc9f9b9c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7384b56cc9535a786f13a5affbead729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a392da7b6bed7ccf10502e78110210e9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2f26c70f88d34fe89252d78536946186(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 16, 16, 16]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_94409d6af5a3e53dc3e5d4f341631a21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f26c70f88d34fe89252d78536946186
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_29415fbb719df50410b6f8207cde9bca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5797119400bfb73c6f328e161113e6c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c9aac5949beb67b2ac7f3cf5def99c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f810e52770ef852d9030763aa075eef9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f5cacc90efef88a6d751a7e1e184f8dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f593e8f9fd93d6fde772683e40de809
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_eb1d168608d6f66dafacbcd9e5515f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4e652df4addd42a794cb371d4fbe0af9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0967baa07747e7739486b03c04e59a47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75243ef385eb705a0c2e7fef835ed1ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7607b0ee868936ebca2018db580bb897
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ea18ad3205fa44181ceef0831333ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_089de6934c95cf5bc3a14b8559193a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367925790dc3859c96f21af261333b20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_351f25d02c7dab9c9b9c18dd3b0e4c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba18b6831f654e5fd792b3da68286271
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1a10e1a513d55765a22200aed5cc3536(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d17c099079290a1295bd39e972a19c60
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_884a267495e79f47d6b8bed0e29912c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9199396bd8c5960518fdd90a69614a0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d37c54c4d868fda49be4219f289ba6c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 16, 49]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_62c1ceaaf42df4302c489aaca42c1e85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d37c54c4d868fda49be4219f289ba6c7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ec4430535531aa909ae448a6647e649b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 100, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4233a47ee245006ffa04e665645f6a95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ec4430535531aa909ae448a6647e649b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_69ca24a02644109a6a52d12fa728d0eb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 197, 2, 6, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a496c5bb3e9defd1782f1db50e56e833(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69ca24a02644109a6a52d12fa728d0eb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ba8ed4262984e73a194d3306cb30863a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 197, 6, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7addfacc082004f30ee5b2cfd1bc38e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba8ed4262984e73a194d3306cb30863a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_691702bb00a372f2bc3b782fa8860a39(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 128, 4, 25]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8d77c0c2eaea14ed1f9fc2a6a23c8cda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_691702bb00a372f2bc3b782fa8860a39
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9f66c23e736ec2acc4e8df30d11fcb89(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 96, 136, 160]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_565a45c99f5a0ff9ecee7b9fc1fc90b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f66c23e736ec2acc4e8df30d11fcb89
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_506d5abdc3583c38b16b0dfb82b43b85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c64e7746cc740793e8f481eb0aaa305
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f614b01a94d8468f76c84e96abdfdf4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eb722481b36769008816ec513f34d59f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b5bfd6f17c84deaeb2fab63ef35fd7ce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 32, 49, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_40373aca6a7436aa68b20d68967d4345(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5bfd6f17c84deaeb2fab63ef35fd7ce
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5b496875038582d4382038a07d269337(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 32, 16, 49, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2a46bcc68e026d8cbf63bf4c60999023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b496875038582d4382038a07d269337
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bf0a6c4c1f222ad20d9e283014bfcd02(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 512, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_000fbdf665ff14bf283411a486e64c2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf0a6c4c1f222ad20d9e283014bfcd02
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_469c446af9d36bc676d2fdbd13492423(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [512, 1, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d30e9c976abeef525d291368a491bd66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_469c446af9d36bc676d2fdbd13492423
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d4a3b7d1dc2bc7d2cc9395e7bb66d58f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 0, 0, 0, 0, 0]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0f7913e6648f321a2ee5a6ee91f144a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4a3b7d1dc2bc7d2cc9395e7bb66d58f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0afd3de95f3f7fd9eebc6c7bd9c1487c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 300, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_16df5def450025feea8c2bb32b37846f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0afd3de95f3f7fd9eebc6c7bd9c1487c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d43a480aab56735eccd422c5ae187e9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0033eafaf0246b8d1bd25d07526ac9f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_89b8047d2b06052fc3d7d6c084fdd1b7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 2, 7, 2, 7, 384]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_30213a44a3fd96080b5404e1f20a6924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89b8047d2b06052fc3d7d6c084fdd1b7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d4006ab286d0cf85fd4b60e9fb5df11f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 4, 49, 3, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_113277a049592e683efd3cac3d996a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4006ab286d0cf85fd4b60e9fb5df11f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_388856feeebd908c2dd7a7f5d81db998(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 8192, 2, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_788affba9fd9b73ca2aa8a06d8234a93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_388856feeebd908c2dd7a7f5d81db998
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b85ab35dfb82f6ea4cd93d4362ff0740(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15f6c8b2e6e88c378da899027449c8b3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f1fc497f9548e030ead6598e68a2593e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6efb62e6a5eeaf518eda1914b6d22cd6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4583f9a367d03a98c0d798527911ecd4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 8192, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fd57bdadd8d33988b9f36d9a5fcd19db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4583f9a367d03a98c0d798527911ecd4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f9574d10f3f917293d47d3cb739b159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b85601cd82edd4f8c3a7bb70882c12e3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d96b6b2e62caf62737557ef48a9a3ef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_986d673224f1447353cc0931111ec30d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a02fc0f4547dbce6f5bb14c2c9324d4a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2048, 5, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_477fe212d9f1d1eaf10b80ac01e4dff3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a02fc0f4547dbce6f5bb14c2c9324d4a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bd2cd11eb6aa1c62fbf127af1dda0c1b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 320, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f0250c413634a4c9d5c5c9b860a81fa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd2cd11eb6aa1c62fbf127af1dda0c1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_810dc949e8cb950b62dac0f4f1319011(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 5, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d5eecf0e589a93e649142c236620c219(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_810dc949e8cb950b62dac0f4f1319011
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f4a333b9ae91ca8ad0a5a3e5a5d35a4d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2048, 320]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_686de518f2ecdc8ad6133b928fc09b57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4a333b9ae91ca8ad0a5a3e5a5d35a4d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4c4e92fb0d536d86e081d53a8dac939a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [36, 36]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5ae854aecc0e7a84dcc279de28bcc998(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c4e92fb0d536d86e081d53a8dac939a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_41ea1e33aa6048aa3792c8c893228ca9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8037d9f3e19a8cf2a17d3a3c4f930d1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_48db7a952b0d8716d6154c9c6893ba2a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [-1, 128, 1, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4d0e1ebd100c20b3f053d5a2e9c55912(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48db7a952b0d8716d6154c9c6893ba2a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_57b2b803bc81457e64900038436be590(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f934f3db74ab3e9af3e32e7114f12403
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7bb36dde0245f81555efe2ca4efe84e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_400ac20ea23f031a12ef077ac82ba058
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5c2e7904092b6b166a83d2ea4ae1819b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 1, 7, 1, 7, 768]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1152c27a06adb33d2f76612d4f311d31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c2e7904092b6b166a83d2ea4ae1819b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f34812c254bbc63cbc414bee718ee7c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 1, 49, 3, 24, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab2c42ff6884bfbc13bcee418b95b780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f34812c254bbc63cbc414bee718ee7c0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ff6d1d9cedddca99aab285f20015bc70(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 768, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_887ddc2caa11a255640243c7100b4d7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff6d1d9cedddca99aab285f20015bc70
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_ccd78952dc94b5ae4d0ff7a3b1748962(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08ec36973b7550dc012128b8bd554e29
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9eff196a622204b1d5d60726cc45c557(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 784]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7fe3377b32603944df8d7a60d326cabf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9eff196a622204b1d5d60726cc45c557
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8e2b6dfa82189af3536e7694501154e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 2, 7, 2, 7, 384]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_67272950c78b8a9ae07f25cfeffe520f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e2b6dfa82189af3536e7694501154e9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d0d8162e354e96f0e21ac49fa52771f0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [11, 4, 49, 3, 12, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_25572d7fca7d93d366e0929ade81acdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0d8162e354e96f0e21ac49fa52771f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1152c27a06adb33d2f76612d4f311d31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c2e7904092b6b166a83d2ea4ae1819b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_ab2c42ff6884bfbc13bcee418b95b780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f34812c254bbc63cbc414bee718ee7c0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_96657eb619403e6d3be343aea5adfb06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b241852f4df424de2f37a50d6edbe75
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_67272950c78b8a9ae07f25cfeffe520f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e2b6dfa82189af3536e7694501154e9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_25572d7fca7d93d366e0929ade81acdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d0d8162e354e96f0e21ac49fa52771f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a6ada2db19f7c1fa61d93dfc4a02d797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c048b083b1032ef1790b305851b311fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4ba970ac246b59d7d1191fe286055020(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cff502ea0d12c2aa6d43fe4bd95581
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5160316c0187062b7fa6aab507da1da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13b14f75561995463dd39f960e8cbb94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2f419ab74cce740bde88df974bddf444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021403311397e477211c932caab1113f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fe663daf8c67dfdb3b439cd3e9cf7436(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2, 20, 128, 256]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2ca0eaa9d237b740a8b898aacc94e484(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe663daf8c67dfdb3b439cd3e9cf7436
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6333a73d5c32e9091fd872f53f20f23f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 40, 128, 256]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a0f278e3f5169e443b4e74a8675aacda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6333a73d5c32e9091fd872f53f20f23f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4388cf8bd4a2d8d921d107a8c2e17e47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2, 40, 64, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f4a681378dfe4a9495f8a81876e3be1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4388cf8bd4a2d8d921d107a8c2e17e47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8e42412df70ea032aa09178c4c752706(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 80, 64, 128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_90901b118d5dcd2cd59da99ca5f7524d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e42412df70ea032aa09178c4c752706
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_82eb10f0e34cfd4941859d7f308ba062(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2, 80, 32, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_618b8eea7fa119c2573f778fa044fa0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82eb10f0e34cfd4941859d7f308ba062
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9eb74d25aa54d922e056f62ac08441e4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 160, 32, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_64dcf55df3ec456cdfb4ed7998f5c295(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9eb74d25aa54d922e056f62ac08441e4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2efb3168472ac7ebbee2af6528e5f644(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 2, 160, 16, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3d47549581ff316862e9da11f6908d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2efb3168472ac7ebbee2af6528e5f644
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_79a7e9ac8d1fc552f5e55ea58921b90f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 320, 16, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_03ed98781a4e18b388bd27e70f0a0ff6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79a7e9ac8d1fc552f5e55ea58921b90f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5d82e94e02980a02b999a807c58513e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98f506b8da9e19c7300f24e21110d031
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7662a3c73358e3af3d758f60cbfe0438(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20784ed9689a52b5383ce3aebf86bab6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_777544d09cacaadc4434d01c33fd6d24(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 1, 512]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea1af830198b8fe431b3501cbc35e45d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_777544d09cacaadc4434d01c33fd6d24
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_44eff9d320849fdd8b26354dc131814b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79154baa38771c4bba95ef4282626426
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e2b24a0e280d44717ccb403f38c2e0b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6fa65556ba33070ee803cb46538ea59
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7c19b6cb7579d68e74acaac399c51d9b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [60, 60]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd5fc93b194526a6cadb20501b0a3668(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c19b6cb7579d68e74acaac399c51d9b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ce5dc3b0c1f9feb1ce629396f645f4ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [43, 768, 7, 7]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ca7d395a9f0bbe7d08841f05934aeeb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ce5dc3b0c1f9feb1ce629396f645f4ab
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_35631d230fcb95796bc6ea46b6deb2fc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 8, 49, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be20a07d206f107c72727cf3d8dfe009(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35631d230fcb95796bc6ea46b6deb2fc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b7722da48b1e750c821e548061a14f2d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 8, 16, 49, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f2e136272380418dbfd94043c0bf8af6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7722da48b1e750c821e548061a14f2d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f963fced37d99b3221b45e980d4e68ba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [10, 128, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1013d93c9bf0c65ed15640708761bc4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f963fced37d99b3221b45e980d4e68ba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_30213a44a3fd96080b5404e1f20a6924(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89b8047d2b06052fc3d7d6c084fdd1b7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_113277a049592e683efd3cac3d996a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4006ab286d0cf85fd4b60e9fb5df11f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5b5b5714d9efd25b620149b76aa7930d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 28, 28]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_559e0558d6ccc9d5ca1bd1ea781cff63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b5b5714d9efd25b620149b76aa7930d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d8e9114eb3598a4d64ef6ba1ec4d65e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbbd36bf8f42d8b675eab4ba87c9ad0a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_964f32be95d786b2ed0153b1842db47f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4, -1, 50, 76]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2447c2a3a4bcfa619b5422507bca3b3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_964f32be95d786b2ed0153b1842db47f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c7e3677d3394e3bc66472fb15fb4b544(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 20, 50, 76]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e23bb8c1a60fbaf3462f8f73cb09b41b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c7e3677d3394e3bc66472fb15fb4b544
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_882ac8256e59ae71ca486525477fbc18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d4ea37bd3ef09a0d883128c72942b1c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8045d5ace5a3590c80936dfe129c3257(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fcff494b005a3ee1d4c2a869dbdef71d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_951b532ab1360d3772ecee923adbe18a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [2, 1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cd9b91634d5f2787b21476ee41fd0322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_951b532ab1360d3772ecee923adbe18a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9bbdfec63bc8aec6eab7ed9ebfe435ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [15200, 3800, 950, 247, 70]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6c1c72d1d60a4925a9b42a4c263e8eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9bbdfec63bc8aec6eab7ed9ebfe435ab
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_75b5ee43cc868629180fcc0e50b644fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 16, 49, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f74594e758632771e75ee07ebc16fe89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75b5ee43cc868629180fcc0e50b644fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f8f6993ff25c58211c0e8f39bfc14dbe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 16, 16, 49, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a7e5ad88d13bd9139291c92afe04232c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f8f6993ff25c58211c0e8f39bfc14dbe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4f91a43dc8f8d35c5b01f05f3572ccb5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 256, 14, 14]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6a3495ddf7427cb01130b347b33e9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f91a43dc8f8d35c5b01f05f3572ccb5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a549aad4e36d2572788e1033105202ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c7fd3b4b61e75ac106d191d9718dce65
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_0129413695fc2629267c6d9d0c2c9adf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb1e69561612f3b5a6e6a7bcc674596c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6fee203eede99f90679c683d2ba888b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47ce9709cbbab4e01dc7a6ceb6791811
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_506d5abdc3583c38b16b0dfb82b43b85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c64e7746cc740793e8f481eb0aaa305
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7ed6408dc1f6849396d231936bd4e176(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4096, 5, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b8131bd53d52cafab41dc6d025910f25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ed6408dc1f6849396d231936bd4e176
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f0250c413634a4c9d5c5c9b860a81fa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd2cd11eb6aa1c62fbf127af1dda0c1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d5eecf0e589a93e649142c236620c219(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_810dc949e8cb950b62dac0f4f1319011
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6c8b2ed33c4d327ded5e1f1038199071(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4096, 320]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9e11d12ea90a046e470b102c089b8978(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c8b2ed33c4d327ded5e1f1038199071
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_07c764e5ffacaff7c413e583a29197b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1c95b7b909e278a8dbf483fa75b23e20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0b18bfed0f8a92bedfc87a3e782a6160(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4096, 5, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_058e4a1e99a22720abba6f80e7d44dd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b18bfed0f8a92bedfc87a3e782a6160
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b0b5bc02d48be135c170320bfeb8f171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_138ed6001618aecd8322cd022d5192e2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a1c62265eaba3187aced22fdfd3e7a17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a4d52c52d959119d3f005e6b8b052bf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cea1000c449dd4781533610d199832c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4096, 160]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3db50fd88acc7b912b5a137dab11f9c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cea1000c449dd4781533610d199832c0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9435b561df2d19fbd551b2853f4927cf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [20, 20]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b8559d24d8a24911bba0c7d2808b075f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9435b561df2d19fbd551b2853f4927cf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d96b6b2e62caf62737557ef48a9a3ef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_986d673224f1447353cc0931111ec30d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b7bb9ee72c3db322101f685563c98df3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ab266e3482efd9630b1fe0e0ff01519
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_88c66d1aebbd728db244e6187096b695(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba01c2f99287fdbaa9111b0225163426
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_490e23f6422f7fc6ee522c3465e9f9d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be949e2b77795d9a7dbd1e8081767f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_850f0d0c2d3fe367334dfff264d57e32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_357841a461254c0ef36e001c6f699bbf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_be20a07d206f107c72727cf3d8dfe009(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35631d230fcb95796bc6ea46b6deb2fc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f2e136272380418dbfd94043c0bf8af6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7722da48b1e750c821e548061a14f2d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1013d93c9bf0c65ed15640708761bc4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f963fced37d99b3221b45e980d4e68ba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8c81920dbb884b04470cdbf14db5631a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [12, 12]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7684c91590c3622650df1f458e127986(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c81920dbb884b04470cdbf14db5631a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f0093e3a3c85079f411b60800b72fa91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [180, 180]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d15a00384f76208cf40a7ee35fd7e548(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0093e3a3c85079f411b60800b72fa91
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_022756c968ab5d1894408a588fb3d597(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3971b6fee5ed222d3fd0a33c5b86db
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_fd14464c529b1b5856031f3597f120e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7cc0898b015436904789fd060a593076
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_37652e797fef4e32662c9b0e286a4853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56654525ee41bd501f3526cafc046432
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b26dde938c0571bde0a7f435e65ab905(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d08d79fa8d2498bdbefbbf2a30bca596
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4a6939f17ebe1f411aa1d68dba710209(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2e9eb9a57350fb487fbe0e76b486d6a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d4a9ed8f00321967cadfbf216d343e66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2a04528ca69b20309f160e4d5aa1e90
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a59577c4657ce822df54973df7e37ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d702a50944d39536a58cdbfcafe5af0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e289fa18a2b6e7a83328d78e8702817c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5791134c77d0d5f7594b9aac113d0949
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75eeabf2c591d28c09b736fcdab2f258(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a8312208cfa96d96ac1815ec11a202b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e0d5a8b4de575defa498f75a2d73e263(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 16384, 2, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fbd7fab0667c1f73f4d33b7c75c92bfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0d5a8b4de575defa498f75a2d73e263
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_45af90ec73cbf6194f2a995d5602f0b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f212db08291a5c63557280656f9dc42
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6c91ac9f5a15b4431dcbe37167a887b2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, -1, 2, 2, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7dbfa565a0eb799b61835314d2d664fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c91ac9f5a15b4431dcbe37167a887b2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_64511a51e0638f0ac202e8173d1d6f83(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 16384, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_30ad751964caeddca60071395134aea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64511a51e0638f0ac202e8173d1d6f83
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9805323a83d4077c5b1a126098f895c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 8192, 2, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1f36cbc20af03fbaf5d3a3e775e52017(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9805323a83d4077c5b1a126098f895c6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_45af90ec73cbf6194f2a995d5602f0b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f212db08291a5c63557280656f9dc42
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7dbfa565a0eb799b61835314d2d664fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c91ac9f5a15b4431dcbe37167a887b2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_939cd732d86147398c2cfbffcdb58802(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 8192, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d207cb94b55ffe1115ba30f19a0a1ddf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_939cd732d86147398c2cfbffcdb58802
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b6087266e72c06a1db27375be7ff5d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_975389fb2ad90d6143f43696cb8ac0fb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_0854950e420bfa460837f46ff7b8c5e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e55bb1c2ea854f6956985b946ce99d22
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d5d9470dd3fca90518e105edef053064(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b56fe571f3b794d3caeb399e0a9e5e4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e0250645ca6d60eeb748b116a62ce968(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ee48f0926658835b8200d959c01f519
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6e8460cc7f0b5fafffcbc1cc48c894c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe3d05dba21a8a29bcd0d610c0e82b40
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_48702f72c9e11a317e1efd54cd0482b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 32768, 1, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_595c95c984036d04a8687c1c93d098d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48702f72c9e11a317e1efd54cd0482b9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d2a4ff1fca3ca9381198a9504e8a876e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42b3395c014615693e6ebea4fc562267
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_45d6cb101445bc4ff998e6ca5ac5a4b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eec6fb38aef80e7443cd90bd31329162
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_315445b55deaf9a24a0578a909e4af92(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 32768, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d27d51236b8b44cedcdd1919a24a3d7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_315445b55deaf9a24a0578a909e4af92
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_78fbdc815e8345c76b50b65a9bbea4fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96d9f068a087c8262a0710e83287a373
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_ea1af830198b8fe431b3501cbc35e45d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_777544d09cacaadc4434d01c33fd6d24
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5c6630f6e237921db5aa1ae65bd8ec93(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 2, 9, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d8106c0d963d519ea7e08de57b796488(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c6630f6e237921db5aa1ae65bd8ec93
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_278c03e2314720f7b07de2bfd88ca67a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 2, 16, 9, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e8e567202c32423fe1fae7a9348354f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_278c03e2314720f7b07de2bfd88ca67a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7e958bfeffe7393531b36ce3cb4f10c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 32, 112, 112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2a974a99d377ec8236158d9b79c921eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7e958bfeffe7393531b36ce3cb4f10c6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_034ebd49986bd6639bb632df112bf36e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_562cf44d00bd13f86dacac82be540234
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_456d7d964570fd7983bb8f3cfd40291b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9081754dabcf0797f74c139436375727
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bcecad54cf24a8f6d45cb881e438460f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 196, 4, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d2ef8f15bbe9c024aaa817c8f3618c2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcecad54cf24a8f6d45cb881e438460f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d75bbc2bfbd73c103a09922032873c30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa2143aeeb1be0f0383e20d0870d1e1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_29415fbb719df50410b6f8207cde9bca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5797119400bfb73c6f328e161113e6c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c9aac5949beb67b2ac7f3cf5def99c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f810e52770ef852d9030763aa075eef9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f5cacc90efef88a6d751a7e1e184f8dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f593e8f9fd93d6fde772683e40de809
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_eb1d168608d6f66dafacbcd9e5515f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4e652df4addd42a794cb371d4fbe0af9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0967baa07747e7739486b03c04e59a47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75243ef385eb705a0c2e7fef835ed1ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7607b0ee868936ebca2018db580bb897
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ea18ad3205fa44181ceef0831333ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_089de6934c95cf5bc3a14b8559193a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367925790dc3859c96f21af261333b20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_351f25d02c7dab9c9b9c18dd3b0e4c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba18b6831f654e5fd792b3da68286271
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1a10e1a513d55765a22200aed5cc3536(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d17c099079290a1295bd39e972a19c60
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_884a267495e79f47d6b8bed0e29912c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9199396bd8c5960518fdd90a69614a0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4801990df0925b22b812b37f5f273110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca3808a55dfef2b628026b3c7577571e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_74f98401af65dfce27e6442e0a9569f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_823d0f8044e35043a8acf536716a819c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e0459d4d598c2c8a8cc9e81c12b95ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9fef882879548e55d9c1943c16ac807b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c08579689b0f0c987270f0680672e025(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc6b24b5bbbf3ff097bcd24755868265
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1c83d9148306a76d31849725d7e0f7b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87e0018222f64d38ecc63494a02d1eb7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_23fffb961cc474b03e6506e9faa9d70e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a31fd70f0417f647236ee21c0383c4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_001673c934126ab938f5604153bb61fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c67bef23c7ef297c126fe29bf47f8e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_9085f739a7e398358b147139b177bf87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcabe545e5053c163024b21946041d54
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_46be509556dd0919abdf924d27961cd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_688062c6e45af3d5288b3bd5573ab8fc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f7a3aad1581148a7cd6b8d47f1a16f85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e7f8bbd69907b88b79e67ad3e2b9e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4bbf877bb83e6d1a53c038caa1b9229f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f6aacd84ab79f2507edf1475e93bb092
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_16e4f27f424bdf1bd0e1e736c57b459d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c47fc7a099c0f2b12175ec2c899429b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1f29be30c13d879b46e4c145691c0c41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1550adb14a979279feed565493ff2ff1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_70e078feffdea965b8adf67c941cb030(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_109afcb21c7acc142bfbd0ebad99fd95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_678b40bc84e302d2fde85cc31d9b0150(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7069af4ee7287de477d218947ca37cb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d98265293c904acff69d37b4af790707(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2db77e0096767510c5c8e512855a6e7a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f75158ad298add7c2907ef52ba34a887(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b731676de3be9e77139508525672248
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_65b08b18172031e43b10912665197478(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f57b2ee215132a79dba2fc8c9e31a1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_80ec9a7f3f9e234fa7ebdfceb8a87a24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3604d46745352795e4f2bf4d384db653
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_74083d4d41c1b780545f56fb5d068f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c8893757dc8e5f5aa31fc390eeade8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7ddcf02e08cc76df00a43481b043af86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c8c6dd8dd7b56f6afba7c9cbae0963c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e2418dcd1bc2906252d855b669a8ff8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d6c57ba7a84448ad7173766630cba95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a67c2463d94ed1cb2a5f97774189b93d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91db64e884a150edc5736928ab02b1f3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e500fb1d5bb70b99945a1315c4e502bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_19c042101f54bbef2eae914766827d43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_9656e88c194b5dcbb5287ea83ab4fc69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f81fd858a5d6a0f16a3f6adfc140b928
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a460023ffcb59bd51d747e51db4447ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02aa7aaa8e438fc4adc8dbd05452c02
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_ad8aa4b62db8ceb19ee32c7c93df0acf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd8919aed8876109d86760378408d812
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6b09c630451294e8278396766df37e6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5e366b081cbb16282e173299b24fc1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd2c7732545483103757248571069354(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d8f16d614d7c144a0270d14ce23199d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ad58719340902d4d95aaaf1f513f53a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_adbfea0a320350d90576b6c3f6a5793f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_3d7a9281c4230975879ca0228022c002(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5785abde96aac6c65ba826ff8fda61e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_caa3e6ef940f9893f52120679dd3ef42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5208c445c54e6a2689501d862cabba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_464c1b8d64c4e8a9dd767a6ac56c30a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92ed97625bf2a619eb371fc509cd131e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7518cfa2fd67be8486dbaafa96b46089(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [50]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0e05143531eb038c5a75cf3f45b7aae8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7518cfa2fd67be8486dbaafa96b46089
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a1c1e91ce31f431b0646cf818c5aa1b2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [51]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6bf83b4cfa535e820c8699afedd918b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1c1e91ce31f431b0646cf818c5aa1b2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4529315e83e91522e4bb592da3e642be(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [52]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f5f3c325b81ead303792156731b2d6f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4529315e83e91522e4bb592da3e642be
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b60bb4389e28556577e9fb8917f3235f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [53]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fc3c5317b2d4df28807b33aafea9b314(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b60bb4389e28556577e9fb8917f3235f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_43d790a3091f3384bcc4fe998e320732(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [54]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1119ec8b27adaf0485611b7f8996bef3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43d790a3091f3384bcc4fe998e320732
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cc78c835e9bb910578836e93c846c53f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [55]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bcf664958dfd098c3971c6125de3cf19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc78c835e9bb910578836e93c846c53f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0ffec5beae6f9e0fc8550d09d3ebe8a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [56]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26d818760aae83ea94ff54822fc3ffee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ffec5beae6f9e0fc8550d09d3ebe8a1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8f84e23ad108d1793a268bb1b07145ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [57]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3e180e9e70955a5a817215cd747c3991(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8f84e23ad108d1793a268bb1b07145ab
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e3765ac4c05be838d25f09a265a7b4ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [58]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ec3f8e756c529635a22ccf99b117e3f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e3765ac4c05be838d25f09a265a7b4ca
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cd5e70f3d52b45e4cafe847148f36776(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [59]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fb97b0fcc69590bb5ea46ca498f71689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5e70f3d52b45e4cafe847148f36776
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2f5f4f1602f3587414312eb46f3592d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [60]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_66f6eacdeb10caec8cf6a901bf10488f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f5f4f1602f3587414312eb46f3592d1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5dfedfeb0d774123dd4f2863c25209ac(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [61]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_859fc30d9c499e3980f2c14af251516d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5dfedfeb0d774123dd4f2863c25209ac
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6bed824b66cda3f4f3bb4882617c2734(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [62]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_253428d1feb8e60978ebf7a87a4e5fe8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6bed824b66cda3f4f3bb4882617c2734
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_20317637320e64042703d136dc98e17d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [63]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_79087ba897ef76a1233f62aecaf18a31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20317637320e64042703d136dc98e17d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2175ac27fd9d22aca413b24c8e707548(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b476072a07e1c2dd9f29f9d832c7f1e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2175ac27fd9d22aca413b24c8e707548
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2e2aaf501c88ebd670e3534109a81f68(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [65]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c67dd28fd99a7d0b9fe807677e871952(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e2aaf501c88ebd670e3534109a81f68
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4da16975ad0b72a8bc74cc126bc41920(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [66]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5fdf0b2d6fe7498b6afcbc511c76eba6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4da16975ad0b72a8bc74cc126bc41920
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3d8667d0de49caa2e9ab7721c7bb91ae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [67]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8e6b8eecc72de8a7d78498955eb27ee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d8667d0de49caa2e9ab7721c7bb91ae
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_14f30ea87653265522a586a79dd3bc0c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [68]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0c5cf034d23e3574dc4912305e634f28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_14f30ea87653265522a586a79dd3bc0c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b0e84a070ac761e0887ddd0172d7845f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [69]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fe11a8ce39f8fcf898710aebcca0919e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b0e84a070ac761e0887ddd0172d7845f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e5a62d00931414ae1ac314e41efd0772(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [70]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a07274b6e4c3fb4ec5a9978d1923c22d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5a62d00931414ae1ac314e41efd0772
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cc750ed98dc0df5e550093276d75f0ec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [71]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75ad30a909deee621db7556152e4e2c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc750ed98dc0df5e550093276d75f0ec
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1a1babfc390cb716f03d595e28e487f8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [72]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3491844bb0a6b0ca64bbb932d1cc8f37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a1babfc390cb716f03d595e28e487f8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fcc24f6ea14cf876413dcdb518ce6d01(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [73]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_52e98c3ff20cce482a521ec0e8aba964(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fcc24f6ea14cf876413dcdb518ce6d01
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_79d30e1406930d7d68c905f8cd73785f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [74]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5139794b9aac9c5b302c27fedc713d7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79d30e1406930d7d68c905f8cd73785f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9a774c1685facb2414c1e9f2126c94d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [75]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0b070684fa3c9c62753cf18bda243d50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a774c1685facb2414c1e9f2126c94d1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_67507482275a953387ce8576ab5dc437(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [76]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b0d4fd183bca6419ddc2dddbf93fcc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67507482275a953387ce8576ab5dc437
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5d5497cc2842ec0ff34bc23d705e1a5d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [77]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8ac8250b0a5501d0f25adf4096585cbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5497cc2842ec0ff34bc23d705e1a5d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_140c3f3e0a954795c8c1a0f3359703d8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [78]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_586baa951b0609a31f46381bea85ce8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_140c3f3e0a954795c8c1a0f3359703d8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7c2af238e02c2fe6d2e9573b8a2d99ea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [79]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_59cce0804e5f10e6ce59907c3f981425(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c2af238e02c2fe6d2e9573b8a2d99ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1d7e15de133ad03237b420e6e61bc116(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [80]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f25aae127cc5f3c13a06ebe9ae747304(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d7e15de133ad03237b420e6e61bc116
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8071f1b2056000846328870ef5004111(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [81]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a63df23eb8ef2d291a7f0a4810c66039(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8071f1b2056000846328870ef5004111
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6983050be647d19673cb6b29a7428d6f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [82]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fd2a63ad8922ce41730bcb29888b921c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6983050be647d19673cb6b29a7428d6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0611fccd6c8d09086fb6a9fee8faa348(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [83]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_549eab119af854de4fc21b4406697dba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0611fccd6c8d09086fb6a9fee8faa348
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2b5a7423565c70eb280073af952fbb6f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [84]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_47844bf799ea619a889096cf46881ee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2b5a7423565c70eb280073af952fbb6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cc6a3a5dc098fe0385733d5612697d94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [85]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_30cb7589e07eeb984390c644ef7cbcdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc6a3a5dc098fe0385733d5612697d94
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9302b01a63a071ec8e60c33a40c474c8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [86]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ee417889b87fc9803ab498251210411e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9302b01a63a071ec8e60c33a40c474c8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_02289e6a1e17ec62345826af97e122ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [87]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_27d086449260a2ccee657dc868ed315b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02289e6a1e17ec62345826af97e122ca
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_66152acb4d2d6b085435dc181430605b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [88]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_abb6aab2a6a00bd5b8988a626556ae6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66152acb4d2d6b085435dc181430605b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c73e93997b681448a43970a7cc2f6742(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [89]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c115979082fe509b5ba0e1cac413068c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c73e93997b681448a43970a7cc2f6742
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_16356d5c8418ea4fba49a0b7e2750d4a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [90]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_124ddc23565fc9a8894de380873b522a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16356d5c8418ea4fba49a0b7e2750d4a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e522bc0686a18de0a051f1d41ace246f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [91]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5bfb6c53d34035f12a185af6ea099d94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e522bc0686a18de0a051f1d41ace246f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_981c73fc507be0b7108705f9330c1718(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [92]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_25ec3cad586694a8a51bdb46df29032e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_981c73fc507be0b7108705f9330c1718
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b2347021a8bafa7c4d96240da01d2763(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [93]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c0c63996d1eb0c5ac3d2e08264bde835(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2347021a8bafa7c4d96240da01d2763
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fd85ad3b6910500078ffe321387dc031(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [94]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3b5d5c68703a068de3497b19de18db85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd85ad3b6910500078ffe321387dc031
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_17c2bae8a3197e9fa9c959898182340e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [95]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0778e3ab5a1c8893c9a7865368b71d0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_17c2bae8a3197e9fa9c959898182340e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_927844725353a1b8d670de43f3d87baf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [96]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_719488370f366dc2336af0904b4e7b6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_927844725353a1b8d670de43f3d87baf
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_3ea9412a7af649cb867b1b1d24ae4d69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [97]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2821a8e12c9f2e7f85a6e05206096ed0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ea9412a7af649cb867b1b1d24ae4d69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e2214268e43c1130ce9d562f07a25cc8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [98]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0a7861536584e5a55024f8794ec0e48b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2214268e43c1130ce9d562f07a25cc8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2fdac5ea2905a6ae299245e464fb9ddc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [99]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9adc5624014fbfe1a0e1f9b23fb45fd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fdac5ea2905a6ae299245e464fb9ddc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d5f3a07ceeb0ae4241fed53ece5fb544(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [100]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8cf1a896dbeda1301b3a958d106a43dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5f3a07ceeb0ae4241fed53ece5fb544
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f13dde3334fe3314f968e5eb486df921(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [101]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_534442fb6842cb4e76669fb3641e4b05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f13dde3334fe3314f968e5eb486df921
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5568454b7e2bb0090d65a289f4dcb9d0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [102]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a5465beda83b221173e4f9ee6aa35ed2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5568454b7e2bb0090d65a289f4dcb9d0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_060c482eb18e378a381b184364fdc39b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [103]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_924b9689592088242ae5e217c6be5bcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_060c482eb18e378a381b184364fdc39b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f0fa65ebfec458048d9874d732bab01f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [104]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1ca3e7264960da51f420bb191d463e71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f0fa65ebfec458048d9874d732bab01f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7941fc3f27ed8c513a1176b490a56750(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [105]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e410fd7e726ae570669226dcef1556d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7941fc3f27ed8c513a1176b490a56750
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d5a4690dded8c2bd2e9cd934f8e16574(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [106]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2441d6410dd06149900784c69d9a5a46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5a4690dded8c2bd2e9cd934f8e16574
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_fbb53bc5dab5c7ad2cc6affb7e05e7fd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [107]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_78ee045e163b703b4a8a507bda5d47df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb53bc5dab5c7ad2cc6affb7e05e7fd
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e76a5427e8e1441000bdf611b7907772(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [108]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7b4758a7ce2539633363dae9aa7879ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e76a5427e8e1441000bdf611b7907772
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0895e71f68d75a7de9f8cf400f249e0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [109]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a3de5df8552402d06621b3a07c7f2698(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0895e71f68d75a7de9f8cf400f249e0b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0cfaae50c3fb3c2cfcffaa7a74e01d77(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [110]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b17f0d31d358d418babf63f589128b7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cfaae50c3fb3c2cfcffaa7a74e01d77
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_8a2dd9da024d93b45949e81c02f7e3c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [111]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8e7065c2f35946c75380124ca5d5d9da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a2dd9da024d93b45949e81c02f7e3c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7c50aeb0d27bdd72b82fedf3e6f769c3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [112]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b631f3cd8031c3eb3b945006874874db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c50aeb0d27bdd72b82fedf3e6f769c3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_638d4039ea6b0fbea914abb99b63e501(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [113]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5eeb42ce8973c5b80ac3e777dfb92ca1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_638d4039ea6b0fbea914abb99b63e501
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_01cd4242588f8f57763e7dc425c787b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [114]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7ecb8ac01968c50b1bae510f05e83f33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_01cd4242588f8f57763e7dc425c787b1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_170da125fc7800d923480f45ab1431b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [115]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8880c0a7855dd097ada372100ed11fe7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_170da125fc7800d923480f45ab1431b1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_78dd09efae8ea9ef06db39a7925ed8ea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [116]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_09f9867aae2d5ea5f1fdfc26de223ae7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78dd09efae8ea9ef06db39a7925ed8ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ead72add65824796e1e729eb082c6a55(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [117]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_35d45317c52286321bf75e305111f84f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead72add65824796e1e729eb082c6a55
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_09e3c1e84eb8c7380ed7f8da75d68ffb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [118]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_08e21cad3a786882db359d735ead7fa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09e3c1e84eb8c7380ed7f8da75d68ffb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_db8545b282374bb41c6a3e33692a1c29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [119]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be330babc62f0b5879effb486e61b321(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db8545b282374bb41c6a3e33692a1c29
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a2ff2a917c4dcc785579c5b8cab255d6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [120]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b16003722d3ee50febe05135a5e42392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2ff2a917c4dcc785579c5b8cab255d6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_de9f2d561c5dca3f2a4bc017f635bcc8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [121]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab5c57d8db2228a06b3c488a326a66eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de9f2d561c5dca3f2a4bc017f635bcc8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c91c9cbc0505aa5bc03e15ffe64b286b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [122]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_62835d84a6fb09cf096646012fb8196c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c91c9cbc0505aa5bc03e15ffe64b286b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5329fb27357eff72ebf6e30a4709e836(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [123]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f8ca832941a095b7c595a1ddd138dc2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5329fb27357eff72ebf6e30a4709e836
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_26fbb983f429c2d739c8cb44de37f5f0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [124]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e327cd9d4f9f52e331f0b3ed0e872f30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26fbb983f429c2d739c8cb44de37f5f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_12c09a14814e69e5c37dbbb1d8cb38c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [125]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_94feb406dee5744f12e923481894a2af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12c09a14814e69e5c37dbbb1d8cb38c6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1600c4d70fa744f6afac9fbf7b0b541e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [126]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7e7cdbdd3f421a9297e45ae28c59ecca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1600c4d70fa744f6afac9fbf7b0b541e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_5a9e1b9baa2a87c049dd33eecd72ba6b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [127]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2f4f974a58ed26e713cb1f3a80ba14fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a9e1b9baa2a87c049dd33eecd72ba6b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c97d0e6a666672527c802ae0b9dd5cc6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [128]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6a22e09acda8dff6f47e9030f1bfcdf4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c97d0e6a666672527c802ae0b9dd5cc6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2fe276e2e0bec3b558575c1c1b3033d8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [129]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7fbd49fcf7c139f5c3b9c38f3fb703d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe276e2e0bec3b558575c1c1b3033d8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b434a0af76dbd43195594ffb53cb7a96(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [130]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7778b997ceec534a99d83b6bbea89322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b434a0af76dbd43195594ffb53cb7a96
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_253147b25362e9a818eba8306d855e4b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [131]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4450f5707538838e5fd819597e810501(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_253147b25362e9a818eba8306d855e4b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e2f969636c160628d4c809f1c5057220(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [132]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_02de980803d62131671c72ccb8dd9b5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f969636c160628d4c809f1c5057220
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7e1f96f2bf30fbd09d6de69e016cff36(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [133]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2a8ea2c598429b5984f5e08b50c2dbc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7e1f96f2bf30fbd09d6de69e016cff36
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_eeddbb760a3e064c78aa7b93dc8ea8f3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [134]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_914cbf9bbf9ed31f8e143ea49188a35c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeddbb760a3e064c78aa7b93dc8ea8f3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_913a064c71609e973e41a996a24c2c66(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [135]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_36127808f234ed214510bdbb5c8c0bea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_913a064c71609e973e41a996a24c2c66
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_099044063abbb3724bc4c7da4da612d0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [136]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b4bd3fc7bf8db788ffd2ce9e8737d197(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_099044063abbb3724bc4c7da4da612d0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_06612f681c3094774d1565c784cb2f8b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [137]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a2e28684459f902390374e2a167d79f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06612f681c3094774d1565c784cb2f8b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1e9959dd9e923824a9fc2a8450686182(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [138]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_283f409b8fe9b748563a5a85072ea331(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e9959dd9e923824a9fc2a8450686182
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ba1fe78bef633c8be4ccaba622eb989c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [139]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_150fc3f615cb503dea535b4a1224b45a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba1fe78bef633c8be4ccaba622eb989c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9cfbeb5d3a5debec5e2edff5630192d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [140]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b49d6d80d69320d039f4e70ccadbbe3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9cfbeb5d3a5debec5e2edff5630192d1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f2e6de36dff269aab6863daf4d4f4e69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [141]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_066932f37979135593e12c5a3e9ae689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f2e6de36dff269aab6863daf4d4f4e69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1696d9fb991aea3b30dbe522ecbbfdc8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [142]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab53f719af51ee8311318cd73e841d4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1696d9fb991aea3b30dbe522ecbbfdc8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_7f169bc283a2e1c05366c04cc8d51c64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [143]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bf90f42a04ca79a4b6226100c29bdf81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f169bc283a2e1c05366c04cc8d51c64
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_78729d52cd4450aac1f6e25543192b80(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [144]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4140564e97bc38ccbb5014ec8b8590b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78729d52cd4450aac1f6e25543192b80
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1f4aadee033323c9e7d91cce0949443f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [145]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_debe10eecac43dd78b9d062a574b45b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f4aadee033323c9e7d91cce0949443f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_59722198a06e047b18f0d7ecb7fbd163(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [146]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_195e0c802ac3358cab52c0d823b249fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59722198a06e047b18f0d7ecb7fbd163
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_12816e739eb0be343b526d4b00b27deb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [147]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_17766aca3610c7a578ea7498c11c77be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12816e739eb0be343b526d4b00b27deb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a9b6ec256db9f20c129b5b01490a41de(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [148]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3a922c37fc9e3c70980e9393ca2874ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9b6ec256db9f20c129b5b01490a41de
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ff4d3fd711c2b637612641f37de250ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [149]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7895e4f01674c1f62616dfe856d9d68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff4d3fd711c2b637612641f37de250ca
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_17e6cc8b4345a214af543219b454ff17(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [150]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_19ed58347700a6249ad34aa69b1978f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_17e6cc8b4345a214af543219b454ff17
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9a1650ae49070fca6f78b4341ee35101(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [151]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_464214c0c9797dfbb712ab5bd093f488(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a1650ae49070fca6f78b4341ee35101
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d2ded1182b18a6046d6699374b475879(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [152]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_23d1800f04d2ce5c0edb80a95a4bb668(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2ded1182b18a6046d6699374b475879
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_758df27d910659ed6850b268f5106e0f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [153]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7b9f0048438bad6857b56b6eeb3bc67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_758df27d910659ed6850b268f5106e0f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_74d1f90024bc2aef90aa65e7c9652a26(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [154]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_554f7ff99ea3284db5d5ea13efb95641(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74d1f90024bc2aef90aa65e7c9652a26
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6092de70568c898f13aa224344e061fa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [155]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_de67c4a23361d2d6cfebf0980c0d2eb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6092de70568c898f13aa224344e061fa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_42ce64c863e1374900f6a2dda10d6d0f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [156]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26a0c0ac869fce57ac24ec556808f874(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42ce64c863e1374900f6a2dda10d6d0f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_13587e537c32732c37b58e7795ed085a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [157]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_edaa7c1a1acb83f960a6a24118129c64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13587e537c32732c37b58e7795ed085a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_124768e6c2cd55595a810306a5b4ceaa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [158]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_becf68464a6372920ededd7d6ca061e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_124768e6c2cd55595a810306a5b4ceaa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0c3016d50b06097bd7bd5e841b9b323a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [159]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3ebd842f9a332503e0ca5df87c3fcfa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0c3016d50b06097bd7bd5e841b9b323a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0f2240b81952b7c3ddc701bf57fe459d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [160]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fc8869708f8b33319ee5acc7ecf01d9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f2240b81952b7c3ddc701bf57fe459d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_9a772d1bf3330cae81fb675cfa865867(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [161]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1abad0b4ca76b7664eabb52372f70af3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a772d1bf3330cae81fb675cfa865867
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_202d3504d13052020970da4847b3308a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [162]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1a7d1fd67bc5ac4d2e88d79ace8f4b34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_202d3504d13052020970da4847b3308a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d497f355a63ba56837a1ba8daa7e769c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [163]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_77c0608c8a5ca201b1070dac6dbcefcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d497f355a63ba56837a1ba8daa7e769c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_eb5b41947b0d91ad26e071836b66bb97(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [164]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8225abc72da2d075173cf6a698e48bd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eb5b41947b0d91ad26e071836b66bb97
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_59d1f3af49432865bb8bcbbc40e09655(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [165]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b39af7a2a1d03e929c78d710d9c9a4de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59d1f3af49432865bb8bcbbc40e09655
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_49b87e278eb43ca98f0de87995f5f93f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [166]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5ee93d35df420c37bc920b01791415df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_49b87e278eb43ca98f0de87995f5f93f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4f48d16f95543c14887f76d2df47037c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [167]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ee7d131684320408e3492710491311b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f48d16f95543c14887f76d2df47037c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_66fec334d789811625f9ad61a3eeec0f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [168]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d72f4cbb8de4582340abdaacb0b8dc46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66fec334d789811625f9ad61a3eeec0f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_dee3da9d8dfc90f134b9aa30d8d1f421(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [169]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4d8c7037681923841fff38f5c2954d69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dee3da9d8dfc90f134b9aa30d8d1f421
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b017e811bc62c1525f01cfe89a7cad4d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [170]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b9b73b349ddaa39bf8d421df5339d63a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b017e811bc62c1525f01cfe89a7cad4d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1ebc489dae1ed5c75ab5ffc0ebdcb856(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [171]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_54355ed430e82fb8b0d7fb94f0af7fc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ebc489dae1ed5c75ab5ffc0ebdcb856
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cc39422586aae0ebe8ce2a964a6e3935(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [172]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b70de19366b65acaffc3cd28ac83fc92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc39422586aae0ebe8ce2a964a6e3935
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_816d7c1b7a8495fb4ec427afbbcec6b6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [173]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8aebbb822b0c62c87bb414aef36307da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_816d7c1b7a8495fb4ec427afbbcec6b6
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_086df5ee19babad5355d87a8f2394171(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [174]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e1a2af2f2d50881b3d5125c13ca896a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_086df5ee19babad5355d87a8f2394171
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_09745cf4cc2ca8e8a24bbc4a183c0525(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [175]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0d1f1da0ebf303f2baf8d30760d98008(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09745cf4cc2ca8e8a24bbc4a183c0525
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_1cc01ff70f9525f903b06e5c20600d21(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [176]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_787dd628c213a28048abc9cd9620b542(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1cc01ff70f9525f903b06e5c20600d21
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_bb9a6b73e3e966b0a39ddc714b7a1d06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [177]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3fb5e4e433ff896e09d53a3d6da51bf1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bb9a6b73e3e966b0a39ddc714b7a1d06
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_60f7d92ee32124e7552757ec5523cd7a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [178]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_adcdaacfd742cc8338063b0b2d39cd06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60f7d92ee32124e7552757ec5523cd7a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_86751321ce667e90df3689b7ab6de580(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [179]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8cb9be77d7d8d54fc3ead9a300e4be11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86751321ce667e90df3689b7ab6de580
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_dee695b16d9de485b753e5543a04ce91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [180]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a41460f94f6be2796713a09793fb46d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dee695b16d9de485b753e5543a04ce91
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b453f6cc6f4d002de8b1ba199d713d04(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [181]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6e2204f63aacc0b9e49230a985934592(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b453f6cc6f4d002de8b1ba199d713d04
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c30c4d289e1ed093c6d3beacc21edca3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [182]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_19b844474973b3ecdebc97e14e9eab78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c30c4d289e1ed093c6d3beacc21edca3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b36992bf0ffa4f766b95bad53c880398(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [183]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5ea4b8a0d7c8be7a4ca80c06bc7c5e26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b36992bf0ffa4f766b95bad53c880398
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a40d713f5e8ca67e0b70b9dd44478b0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [184]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ca22d42b902e4b5af940ddf6fa03fd0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a40d713f5e8ca67e0b70b9dd44478b0b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_4ea59446a6f3d9d053ceb9b8d8019471(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [185]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e39111b26f27a7ea6710416af729a834(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ea59446a6f3d9d053ceb9b8d8019471
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f48f9c5fdefc9bb99487e4663d884782(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [186]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_db98fab62930363074014304b8ec2b1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f48f9c5fdefc9bb99487e4663d884782
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_b938a853a4befb6b0715f7dc3434774d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [187]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_54211bed798a1fc55374f915e5c7c3b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b938a853a4befb6b0715f7dc3434774d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_62f66184423db62bc44169f3a4bc6355(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [188]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_50b48c336f27c4dd3af0e942a050ee61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62f66184423db62bc44169f3a4bc6355
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_649f1ef790c788fc52aa9c556c6b37c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [189]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_20873e5620779e40b8147f8cec6fe5a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649f1ef790c788fc52aa9c556c6b37c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f2a3cdb94053d71c70b55df2a419b205(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [190]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a77b8f2ed15bd3b28b4f949c8ee12c46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f2a3cdb94053d71c70b55df2a419b205
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_a89caf754a87ef396c31bca95bea85fa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [191]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26e8c1b4a29924747d5b024d1f12e666(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a89caf754a87ef396c31bca95bea85fa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_2adeb538612ab8a873bd865d9c79027d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [192]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_38a1b4a1f16f6ef9b72a97a5441a4962(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2adeb538612ab8a873bd865d9c79027d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_d4557c0a3f1bf2cf7edd80d186cdb7a5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [193]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_557b47457c83386d872970b67d4fc3e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4557c0a3f1bf2cf7edd80d186cdb7a5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f688f65e22080911dd8bbbe1e67948d4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [194]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e4356430e17048a20d69c64148f15b5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f688f65e22080911dd8bbbe1e67948d4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_e53d09290de8b7fdbd600f7dfc74e783(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [195]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_779b5054a148b3d788fd5ab02e5f0253(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e53d09290de8b7fdbd600f7dfc74e783
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_07bf458646b186a2899b2fd81cb1497f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [196]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dbe9edb808771f5a7e059f117ced1d8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07bf458646b186a2899b2fd81cb1497f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_48e943332bf903762885b21e6149accb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 196, 196]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8bb586da0d01d5fdcbdd80249d3aa378(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48e943332bf903762885b21e6149accb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13d2fc59d03a0582b28cec9ca50b6392(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_60b17c250cb42a9343a652cc15a1d1a4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_dc444356313b1e98cbb8c6c90a908339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_098b803df09d090e7930a68fb7541b69
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_89ae178ca12d05906e0401c89380b078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_392899bef2aedd89795b20d8a6ac2dd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_f070cd178e079bfc0bd61fe49c8632c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [240, 240]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_77dcae4d0d275e9011222d760a873e7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f070cd178e079bfc0bd61fe49c8632c4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_26eba4478e1e2c3364186b4dd05e91ac(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 3, 8, 32]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e28d627b2b3db6139a2bc83a83e6b81b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26eba4478e1e2c3364186b4dd05e91ac
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_58adb831d7ba5d3bf1a71097cb1c2814(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, -1, 256]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_00c42e9cb093af38d61d5180c2ecd951(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_58adb831d7ba5d3bf1a71097cb1c2814
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_ed516a2fe4e20fe962f3c0a0274e594c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 49, 8, 16]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_612953f7bb86ba6655e21bd8169dd822(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ed516a2fe4e20fe962f3c0a0274e594c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_29415fbb719df50410b6f8207cde9bca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5797119400bfb73c6f328e161113e6c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c9aac5949beb67b2ac7f3cf5def99c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f810e52770ef852d9030763aa075eef9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f5cacc90efef88a6d751a7e1e184f8dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f593e8f9fd93d6fde772683e40de809
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_eb1d168608d6f66dafacbcd9e5515f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4e652df4addd42a794cb371d4fbe0af9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0967baa07747e7739486b03c04e59a47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75243ef385eb705a0c2e7fef835ed1ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7607b0ee868936ebca2018db580bb897
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ea18ad3205fa44181ceef0831333ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_089de6934c95cf5bc3a14b8559193a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367925790dc3859c96f21af261333b20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_351f25d02c7dab9c9b9c18dd3b0e4c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba18b6831f654e5fd792b3da68286271
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1a10e1a513d55765a22200aed5cc3536(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d17c099079290a1295bd39e972a19c60
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_884a267495e79f47d6b8bed0e29912c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9199396bd8c5960518fdd90a69614a0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4801990df0925b22b812b37f5f273110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca3808a55dfef2b628026b3c7577571e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_74f98401af65dfce27e6442e0a9569f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_823d0f8044e35043a8acf536716a819c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e0459d4d598c2c8a8cc9e81c12b95ec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9fef882879548e55d9c1943c16ac807b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c08579689b0f0c987270f0680672e025(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc6b24b5bbbf3ff097bcd24755868265
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1c83d9148306a76d31849725d7e0f7b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87e0018222f64d38ecc63494a02d1eb7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_23fffb961cc474b03e6506e9faa9d70e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a31fd70f0417f647236ee21c0383c4c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_001673c934126ab938f5604153bb61fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c67bef23c7ef297c126fe29bf47f8e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_9085f739a7e398358b147139b177bf87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dcabe545e5053c163024b21946041d54
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_46be509556dd0919abdf924d27961cd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_688062c6e45af3d5288b3bd5573ab8fc
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f7a3aad1581148a7cd6b8d47f1a16f85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e7f8bbd69907b88b79e67ad3e2b9e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4bbf877bb83e6d1a53c038caa1b9229f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f6aacd84ab79f2507edf1475e93bb092
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_16e4f27f424bdf1bd0e1e736c57b459d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7c47fc7a099c0f2b12175ec2c899429b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1f29be30c13d879b46e4c145691c0c41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1550adb14a979279feed565493ff2ff1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_70e078feffdea965b8adf67c941cb030(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_109afcb21c7acc142bfbd0ebad99fd95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_678b40bc84e302d2fde85cc31d9b0150(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7069af4ee7287de477d218947ca37cb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d98265293c904acff69d37b4af790707(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2db77e0096767510c5c8e512855a6e7a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f75158ad298add7c2907ef52ba34a887(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b731676de3be9e77139508525672248
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_65b08b18172031e43b10912665197478(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f57b2ee215132a79dba2fc8c9e31a1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_80ec9a7f3f9e234fa7ebdfceb8a87a24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3604d46745352795e4f2bf4d384db653
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_74083d4d41c1b780545f56fb5d068f5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c8893757dc8e5f5aa31fc390eeade8
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_7ddcf02e08cc76df00a43481b043af86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c8c6dd8dd7b56f6afba7c9cbae0963c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e2418dcd1bc2906252d855b669a8ff8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d6c57ba7a84448ad7173766630cba95
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a67c2463d94ed1cb2a5f97774189b93d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91db64e884a150edc5736928ab02b1f3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e500fb1d5bb70b99945a1315c4e502bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_19c042101f54bbef2eae914766827d43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_9656e88c194b5dcbb5287ea83ab4fc69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f81fd858a5d6a0f16a3f6adfc140b928
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a460023ffcb59bd51d747e51db4447ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f02aa7aaa8e438fc4adc8dbd05452c02
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_ad8aa4b62db8ceb19ee32c7c93df0acf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd8919aed8876109d86760378408d812
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6b09c630451294e8278396766df37e6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5e366b081cbb16282e173299b24fc1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd2c7732545483103757248571069354(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d8f16d614d7c144a0270d14ce23199d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ad58719340902d4d95aaaf1f513f53a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_adbfea0a320350d90576b6c3f6a5793f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_3d7a9281c4230975879ca0228022c002(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5785abde96aac6c65ba826ff8fda61e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_caa3e6ef940f9893f52120679dd3ef42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5208c445c54e6a2689501d862cabba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_464c1b8d64c4e8a9dd767a6ac56c30a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92ed97625bf2a619eb371fc509cd131e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_cd21c1cbc7a043f5f2d502c7a5bb1575(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 49, 196]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_746b18d794f16d77217ddbaf9584a34d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd21c1cbc7a043f5f2d502c7a5bb1575
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_66adbfaa24a92e771004dcc720ee3069(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 16, 12, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_201bd13be39083cd2032384359780712(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66adbfaa24a92e771004dcc720ee3069
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d75bbc2bfbd73c103a09922032873c30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa2143aeeb1be0f0383e20d0870d1e1f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_29415fbb719df50410b6f8207cde9bca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_553197b58cd2f929f4d003b5e2a752ad
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5797119400bfb73c6f328e161113e6c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b4189fef9f0f6a5378db960a3d6308f0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c9aac5949beb67b2ac7f3cf5def99c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f810e52770ef852d9030763aa075eef9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f5cacc90efef88a6d751a7e1e184f8dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1f593e8f9fd93d6fde772683e40de809
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_eb1d168608d6f66dafacbcd9e5515f89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b303005e4201ca79c35cc1f0ad9d35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_4e652df4addd42a794cb371d4fbe0af9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0967baa07747e7739486b03c04e59a47
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_75243ef385eb705a0c2e7fef835ed1ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7607b0ee868936ebca2018db580bb897
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2ea18ad3205fa44181ceef0831333ab2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d9227c4e516b7fbb93cccbd0c6b5c9
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_089de6934c95cf5bc3a14b8559193a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_367925790dc3859c96f21af261333b20
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_351f25d02c7dab9c9b9c18dd3b0e4c3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba18b6831f654e5fd792b3da68286271
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1a10e1a513d55765a22200aed5cc3536(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d17c099079290a1295bd39e972a19c60
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_884a267495e79f47d6b8bed0e29912c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9199396bd8c5960518fdd90a69614a0
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_76b74f5ae6f4c6d864e0a5ce1822deac(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [0, 16, 16]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15feddd9b3a24f982224658c56ef9e6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76b74f5ae6f4c6d864e0a5ce1822deac
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_40373aca6a7436aa68b20d68967d4345(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5bfd6f17c84deaeb2fab63ef35fd7ce
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2a46bcc68e026d8cbf63bf4c60999023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5b496875038582d4382038a07d269337
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_000fbdf665ff14bf283411a486e64c2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf0a6c4c1f222ad20d9e283014bfcd02
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_37beee1af80c5f4a58142be329c67aaa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4, -1, 25, 38]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cf2fab1c53e905192db0eb8271fbedca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37beee1af80c5f4a58142be329c67aaa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6da903f174df8989b314a7f9672b35c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 20, 25, 38]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_670f3769333e17d6d0e8b2e9085199dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6da903f174df8989b314a7f9672b35c4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2523331015a82329e5afa8656fee4319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_81400c7e0effaf6466a50e860580d1a7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_6aeab3a932cfedc5c69a6bc9e62c0a79(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4, -1, 7, 10]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_00e21eeda702be1af4defdb976b1096d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6aeab3a932cfedc5c69a6bc9e62c0a79
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_0a380311a3d1be77ce331cdc48dab6cb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 20, 7, 10]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_86449220e9390d8aa40db0ecac8edb7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a380311a3d1be77ce331cdc48dab6cb
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_441104792df165d94f667e256719bfad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b928b4d9e1a3bd2240af9c1b8a0f0e6e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_bd8aace0c5d7bab2703122f177e7a2f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82efbac3a166d5e8b676e4b78f23a981
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f9574d10f3f917293d47d3cb739b159a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b85601cd82edd4f8c3a7bb70882c12e3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c053bcd7337d9875761840e19c51cbcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a6413844c5f5fb3e4c598e280d1f757
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_59bf069691b7fd4b7a8f66ca279fe4e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ae709f245734b4af82e233d7268886e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_de5421b6e0f1fe48864cf887dd453c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3c4de0531502fb31fac449330e3d779e
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_511fe09d71aa42c9df6a715f6d7188b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b326f91fbc8fef9c6d37a1dbcc4b36b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_96e057ef7b59dfbafd015e01e6936689(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 65536, 1, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_33313a78d158717d2e483500bcbb4169(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96e057ef7b59dfbafd015e01e6936689
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_45af90ec73cbf6194f2a995d5602f0b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f212db08291a5c63557280656f9dc42
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_5678cf1dc9f50cf4df2bdea84e4bea43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_931cbfdadc733b6c570c33cc9a41b0aa
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_47b3784b156765fd5332d23ec3b4c8a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 65536, 64]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2fc562c6415349e4e2e6bfd2e74810b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47b3784b156765fd5332d23ec3b4c8a1
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_209d54a9a5425113517d8a2ed3da6cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc6b6d6f2794530e536f70e07b78066c
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_d96b6b2e62caf62737557ef48a9a3ef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_986d673224f1447353cc0931111ec30d
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_73bb955561c7e891c39e5a948eb77e4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cdfddf4d1c3c00d7f040fd09bf70d8e7
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b9b8cbddf055da8580a057af3c480beb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e7b1fc2064307c35976a8c9f61004f6f
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_914c10eaf30a9fcd30a6ee443888001e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_496e0ebd95cf1f0e28731744a0b3ca5b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_05eb676daf1d5263cec2e8cd2840fc35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 4, -1, 100, 152]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aa84d88a08a178b8538080c03578e10d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_05eb676daf1d5263cec2e8cd2840fc35
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_c9c09ac1424c4d42a2036d08e42e2fc2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [1, 20, 100, 152]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5c74fcb1a313443799581b6d221ee855(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c9c09ac1424c4d42a2036d08e42e2fc2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_c24dfff4d1635447daab88c9dc326f61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94d02bab8e6b3465c8082e75d218b56a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e28d627b2b3db6139a2bc83a83e6b81b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26eba4478e1e2c3364186b4dd05e91ac
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_b29d7525d29fe6619e71fd471933a419(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d57894125cbfd2b2971374d2d8e105ea
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_8c0493d353a529377efbc4c54668e993(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3cc24fc6e1994c748b32b5fac8bcf62
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_00c42e9cb093af38d61d5180c2ecd951(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_58adb831d7ba5d3bf1a71097cb1c2814
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_99c71f6f83fa3d3bbdf6b83d421ebb6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c6b667294eae5202e92840a08623bb1b
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f74594e758632771e75ee07ebc16fe89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75b5ee43cc868629180fcc0e50b644fe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_2c9709e8297fea4532548d20adef8995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2fbb34092597f0d8233ce5ef85ffb18
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_a7e5ad88d13bd9139291c92afe04232c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f8f6993ff25c58211c0e8f39bfc14dbe
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_f54344a2f15303056e84538b6b2c2580(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6d6b0c0141d68e3504dd7506a224fc3
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_6a3495ddf7427cb01130b347b33e9439(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f91a43dc8f8d35c5b01f05f3572ccb5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_e018c7d0539e7c770365dfcac5d10bcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2215e0d9eecbd36481c4272bdbb8caba
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cd9b91634d5f2787b21476ee41fd0322(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_951b532ab1360d3772ecee923adbe18a
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_633f7eed0703979f56a28585193b756f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_46db485266745fb157ced2150c851fd5
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_cbff32ddd5a9b38642cdff6994593c07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca814cabcf53f3b23b27e5eef8f0c250
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class PrimitiveOp_dddda149faf86b795172e4338f1566f2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, ):
-        return [22, 49, 16, -1]
-
-    def get_input_spec(self):
-        return [
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e61353daade8a5cb954d3bb65dde2649(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dddda149faf86b795172e4338f1566f2
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1319f6b9461046fc95863fdbcd66da09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b574ccd278dd35090b509727890615c4
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_13ada259d82c0b2a4ac1aef32a66b2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ead720a283058da12144a244b62bcc43
-    def get_inputs(self):
-        return [
-        ]
-
-
-class TestPrimitiveOp_1038b3d63d08c01315b6f9ca3ba0b9cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e24015cc6e7b8d5ec97dbd63b86cc41f
-    def get_inputs(self):
-        return [
-        ]
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+import cinn_case_runtime
 
+cinn_case_runtime.load_cases(globals(), __file__)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -12,5722 +12,14 @@ if os.getenv('FLAGS_enable_pir_api') is None:
 if os.getenv('FLAGS_cinn_bucket_compile') is None:
     os.environ['FLAGS_cinn_bucket_compile'] = '1'
 
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_d8f923d5381a4012543a6930d89cecec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fb98eda284e61fda4ae0886187574f95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8f923d5381a4012543a6930d89cecec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_755ff01e8efbe9e58dd299788351fb09(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c6d79bb2ff32651d0e914ec17ee38975(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8d4589bd857723065f97cdec048b6543(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_89df97b4455ab829301d927c82963040(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b61685d34870d608b2df570667e0cf16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3add5609c4d9772bbd5c4d428b448b89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0a56f6cd0b05aceadbab4441123f7b94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4165d73bddc59d8e1ce8224d78b64f77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2a717316d4b40f41b3a5fbf87754cbac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_213dfd38ffa7f748b94e701aa9549cbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04329c58c4ccfadaa9388287c956f67f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5b2d174546aeae8c3bbce0e87a64f21f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [5, 5]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [2, 2], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7ebe6ea591592246b15c3fbd3a793b86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_9f5739470eacddaf63045687ef819728(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [9, 9]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [4, 4], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4140ff68b73b21d6359cfc1806152549(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [13, 13]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [6, 6], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e2ac82280719bc55d64ba720bb6425bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_aaeaad1fb9f19a0eb38eb530347d1af7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_48bdd52c3aa34280ab05cc3fcab81ea1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f153fdf3436100777330276b53fdbe70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48bdd52c3aa34280ab05cc3fcab81ea1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_98e8f7eb53df4a2c806819c643796318(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9857d4b73bb0253a360d70c3b990aef4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98e8f7eb53df4a2c806819c643796318
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea8f9f3e1330cc3f6b590965783877a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_09e0a6bd842cfa68bfc9b888ee3ca1f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cffb3266cc6ea8aadc1a06ada1dac54b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ce48fcd253ca61c590305a42d857f3d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_08df5ee906c4c2e96cdc44b87c847ff8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_62637d20457a08466cdb1d0c7029d87d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9533eb54d34f9e0e7db3f335e0a4c8a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_93957cfcba8bd8f5bf239c0425191b60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_6f3f8fc8e2613ac8db9b22467afaa6ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1152, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5da34d05ad4b77543c44a4f760da42e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6f3f8fc8e2613ac8db9b22467afaa6ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bd8aebd7102527af4050d1e9f9c76cfe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6253a78d04896d1b2f2bb62f7a66219c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e599e312f090c610a379d65b99e7262c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_0e3752d224453039a182306c2f5023c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_af225a81015a4b564a6c976b1e8ae5ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f894d6c0eb290aa07ddec5a05a69785d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2a09e8239b6b423d1a288bd06bd55756(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c98f46aa96d968ebe07d5231bc500e93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a22d985500431a0aef3bebfef01d26f9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3f3653e720c57ce75a96ec33bb3611f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a22d985500431a0aef3bebfef01d26f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e587f16c16aafda399c56c8b50d9203b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a29d30c618b8d80eb5100912bf8493fa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 44, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_40ef28229bf417c6c4f2628354581ebc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a29d30c618b8d80eb5100912bf8493fa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4b12dffc9259e6e1b8665ec64083c374(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_dbe93a7850b2c0bf2c8a60851fc7f9f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_b2115e8367fecdc65144c83d33a96a2f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e308867eab2035e002f0e7a455afd121(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2115e8367fecdc65144c83d33a96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cef4f39e6a4e0f23e2bacf8119f906c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_82eab7375e50b0386831a9f9b9260890(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5c978c4e73b86e3b54a49b55d13c2aed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5e2ab47e614a22e1dc66a9d75c06102e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_02e9c47943d3f85ccc27391e19e27888(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fd8151e5679afb16f66f77e9418c8677(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_0972980d79dc13d692af142ec4a74ddd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e97d4a202cb7a258991b53d046a6905a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0972980d79dc13d692af142ec4a74ddd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_bc7e6b133a60a122179634a3c04880b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [4, 4]
-        return paddle._C_ops.pool2d(input_0, input_1, [4, 4], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_776c0f3c5b2ac57a0d99730ad97dead8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc7e6b133a60a122179634a3c04880b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([4, 4], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_1a3258f499544a7e98bb45466f015fe6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [8, 8]
-        return paddle._C_ops.pool2d(input_0, input_1, [8, 8], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_12932ea4300c6c4c533636a3424a12b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a3258f499544a7e98bb45466f015fe6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8, 8], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_aa97303670b134b9d366bf2453969c23(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [16, 16]
-        return paddle._C_ops.pool2d(input_0, input_1, [16, 16], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9be6745cf95b5dafac9efa7066fb8383(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa97303670b134b9d366bf2453969c23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16, 16], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_53c400fbc6d626344821103570d58930(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b4e88bef68e48bfc85de61d44544fbe4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a4161ca77cb82be08bfb11d82400bc1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2ca40b8ab576b1dde2f89517d943b67d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_65b680c9248548445e868d2e39436e7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9751e1dc77fd3a7ba6b33171b6fc8ea8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_65b680c9248548445e868d2e39436e7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_4915a9c9442bb98f8ce22e8c51b31a29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [16, 16]
-        return paddle._C_ops.pool2d(input_0, input_1, [16, 16], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83679be33d72455827e85499c45d3303(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4915a9c9442bb98f8ce22e8c51b31a29
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16, 16], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_9d9c7aec903b3c34dcbb006818c3c244(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [8, 8]
-        return paddle._C_ops.pool2d(input_0, input_1, [8, 8], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_832169566f3ad2d1c2501072bb41f214(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d9c7aec903b3c34dcbb006818c3c244
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8, 8], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_5aa604531f92c133c21ac9d612094009(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [4, 4]
-        return paddle._C_ops.pool2d(input_0, input_1, [4, 4], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a9205a2aba7a1284147d804f721ba4c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5aa604531f92c133c21ac9d612094009
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([4, 4], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_25cdfca4e50b2c28704b0e6c91751dcd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_77bc1e4a2609a32563ab4894890d1721(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25cdfca4e50b2c28704b0e6c91751dcd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ac21b32956ef147c954dc8e2f7520870(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4915a9c9442bb98f8ce22e8c51b31a29
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16, 16], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2f711eebfe16fa833d92fb3b845d374b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d9c7aec903b3c34dcbb006818c3c244
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8, 8], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_90772f2bb952f78bafaee7ed3ea7fccf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5aa604531f92c133c21ac9d612094009
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([4, 4], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_33012c23a4e311380cf9d09f6af3154b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25cdfca4e50b2c28704b0e6c91751dcd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1cae7c85a47befb01e7908548a4c30b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4f3882a3f84487f0cccc2d43272ea47f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4165d73bddc59d8e1ce8224d78b64f77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_aab05d437720fd12f17fd220be092515(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_caa4a2e9087c72d38c13270db6135cc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aab05d437720fd12f17fd220be092515
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_20c486de4ec5eb07c40ddb6beb8ddabb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9ad6c0704f182ea75a7d3c6d0cc00530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aa9fd1247856cb0cb1ac9f9c7480f517(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3bf46490b73122a7dec1680f779fcbc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a69954c11c20092d7b5094aaa600be5e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_472e40939371ed52b4da78886e3d4025(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a69954c11c20092d7b5094aaa600be5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_744551201c726d49898baa8ad95bdc8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f448be29b881ec73e037eb0624f0f856(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5f6aa49797d771698728f6acf899fd5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_65a4cf5adb47393d6bb90ffce136d9ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9bc9f319f473cc14d85f5d445afd7f0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_8b99fc409f9a6d753f5f34608ac8baca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75845f5c5e22d62121983243a339295b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b99fc409f9a6d753f5f34608ac8baca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4a2f33573587bc9be8e2d5f4a73372cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_86ceb07893fefd55e19748d0dd239800(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_021b633310bf19f32ad67d638a4e049b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f8254f56ebb366079d63d2c4b1790de1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_aada38a67ef532804099df6231091601(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_78f126f70f76858bb9a3fa4d2a3d86c1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, 1, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_302426c95a6fe0ef910e5bf942ffddc3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78f126f70f76858bb9a3fa4d2a3d86c1
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1, 49], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bfb05f283a3ed0954f6d4b1fa311961d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d9ed948c828c98462f7c035b992dd3e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fd28692dcf24033201544c07fb2f0c81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_003b120e636d7051ef5d7b725c8121d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f048e68ab0d82cee78babaab03786141(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7a48832591fc7d9030a812c9818c5eb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_65e772df08dca4ea274fb745c7c6fd5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f425bd938994e8470513a03bdec73867(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8f923d5381a4012543a6930d89cecec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_97b19b5a468129680e308838654d87d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ea0f239e9269da7ee6740eca05ee6d7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a993350f00bd220299096b39c620da72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_14b5865c86cc7fcc1baac1c7fd88b9d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ebdfe69bbcdb082beb3a4d0d560c574a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 320, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_25f238ab342c1133f0d9da586ec9fd12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_3b30dd4c67cde875d5e07238a4808c22(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83c4502f29fec1af66a5e02ce555b3ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b30dd4c67cde875d5e07238a4808c22
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 109, 109], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_790e5dcad4762f3e44964e64f6a99378(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_18caf04f808b6d58fb60b6c01db58aef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_790e5dcad4762f3e44964e64f6a99378
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 256, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a1f103235fb30e77085091349d6c594d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15b026c2ca998070b40acb70cb2e8628(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1f103235fb30e77085091349d6c594d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 512, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_b83d789827294342d0e039a0869dbf2a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f2584828f1b162f409c573a552875b14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b83d789827294342d0e039a0869dbf2a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4808beeb27da5a14037172666e46a905(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1aac3649373088ede1e22ea05f5b1163(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cc2418359c23f78b20f04782f239017a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fef9d60b3829456085458d5972a58a99(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cfdf2bad072a069b17d0d67051432df1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f14b95a974229cfcb29103e5274e5348(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0455f61bb6d4065648431649f916c6ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14b95a974229cfcb29103e5274e5348
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9356bd72b8ab1eaa7398181879284726(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f4d97c2a9f77b5d61c9c39c77aafe79e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c9e44e2bf1d62aff38e3e8c43ab496ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_061deb396825f42f4abdb78a1b7bb6cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14b95a974229cfcb29103e5274e5348
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e2fdd0c30bf95dcc96d8150a3df2a1ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_93957cfcba8bd8f5bf239c0425191b60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6a712d5788ff281688065182a09fb67e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_422fd533d9284285bf82bea57e7800e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b30dd4c67cde875d5e07238a4808c22
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 96, 109, 109], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bf84a6b636c6a91b1ad614d634fd0ed7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_790e5dcad4762f3e44964e64f6a99378
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b08253d6edf8ee1ddb8ab8abaddc5a74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1f103235fb30e77085091349d6c594d
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b5d458d7c7db315be3a6dfd07c04945f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b83d789827294342d0e039a0869dbf2a
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0b8f53b5f8eacf04a35ee1d68b41a282(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f58bea38bf581a5c7dea412f3be32b9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6ea88c395afa2fc6ff2b7d2d1956dd45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ef51487305bb4be0f67824b9ae5fe452(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [7, 7]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9de27cf554b90e937a869a96490c1634(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9de27cf554b90e937a869a96490c1634(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e2a9ab4f8e6f4b4b35de4859b9d73870(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e2a9ab4f8e6f4b4b35de4859b9d73870(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bc294e6720db41d02642ace2d2f9d38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bc294e6720db41d02642ace2d2f9d38d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ef82f38c783707b7d9a7d2996377b0ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ef82f38c783707b7d9a7d2996377b0ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cafaf60d2c826f3b7bbe4922dbc9b092
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b296ab338d17262ce2b24c08caa8b946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [28, 28]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab41bb8faa1621383ea957031d2ead42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ab41bb8faa1621383ea957031d2ead42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9090a42f6e71ee59a9a836c41fb44054(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9090a42f6e71ee59a9a836c41fb44054(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1101d5100ab9d8feace2f4fb95c9dc61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1101d5100ab9d8feace2f4fb95c9dc61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_94adae64fa0a30d0d108bac7609ba0a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_94adae64fa0a30d0d108bac7609ba0a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_93aee139f84dc097af225cc04080241f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_61f2615e213f7fdeb0aa3a1e128f1bf6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aab05d437720fd12f17fd220be092515
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_97b19b5a468129680e308838654d87d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e747ff59e8501d4a51dd109d43e739af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_905792279d6b28e11d27fede7f2e5c83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6f3f8fc8e2613ac8db9b22467afaa6ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_e145f000c7ef880f5664e18e3b87dfb0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1f1b3e1b483426d8a6150f0981d22a55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e145f000c7ef880f5664e18e3b87dfb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2cf5e3f09cfa9791e5a7ca1a8fd144f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bbf967fdb2ff26165bd6a41160634a6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1455e10dfaf533d801e6b7456c2f27a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_56637c31b42cbbbab92a2502a082cd09(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [14, 14]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c279bdc7e703a3d3c6d5dd7d5024cb31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c279bdc7e703a3d3c6d5dd7d5024cb31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_56fd999c19bb967c5ff5c53fdf22d3c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_56fd999c19bb967c5ff5c53fdf22d3c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7fd5dd40154bf282a1017285cfce5511(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7fd5dd40154bf282a1017285cfce5511(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f6cabaebfec786c12c4b8c7b3176f58e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f6cabaebfec786c12c4b8c7b3176f58e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56637c31b42cbbbab92a2502a082cd09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([14, 14], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a3b1536e5e29d9bd170d14bfad42643d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2bc1d647d8e039f1e84a8385b38435fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3b1536e5e29d9bd170d14bfad42643d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 300, 300], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_ddd2e6e7ce2ec99c58516dfffe1f8041(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_006ff42f131d0007a4c5320ba443c20d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddd2e6e7ce2ec99c58516dfffe1f8041
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 150, 150], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_235d4321544583b3957260cc405c8195(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bb2b8f60296fd53506c003cf3f7c04cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_235d4321544583b3957260cc405c8195
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 75, 75], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_69d9ca706cebcbf1a85e98bba13c9998(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 2]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fd5e653008b1e090e4effb7c57c426d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_69d9ca706cebcbf1a85e98bba13c9998
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_e41342696b400c6fb7ddb538dc9bcf2c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [3, 3]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [1, 1], True, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c4f5d61024da9a682e9beef3a6269b94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e41342696b400c6fb7ddb538dc9bcf2c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_26938adda1b9be8ba8cf67afe7bf037a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4be7d0ed7d216e04a26cd96035365ba5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5a5260672b6f45be29be1662efa4d7e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_836bd744f45d84d9db0262b8175aa86b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0972980d79dc13d692af142ec4a74ddd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_051bfc0570121fe03aa820bd4913bb02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc7e6b133a60a122179634a3c04880b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([4, 4], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3c36e63cf41b206c4954ff499179cb03(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a3258f499544a7e98bb45466f015fe6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8, 8], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cb12018fbda5c770312f651173703f5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa97303670b134b9d366bf2453969c23
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16, 16], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4f959dbf8cc3947e119aa446b9c985c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3b8d065c46a4f5a758a019b0eb3fa819(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c2014aae90300e7112d6ffd7d4b0c1eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c48c4d4c478f232ea830620e2e1ed2ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ebcfb29386b00c9e3bc20ebac00f3649(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_8d6f525c8708485b63f885bba94ec0e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NHWC', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7c3e3f9161e98142073c7f80dccbac68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d6f525c8708485b63f885bba94ec0e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 7, 7, 2048], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1a055385574937c6c393df3713c12fb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0d6f0f8dac317581da58c9b0c911ff9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_714e15271cf5b1af7af09fe5d5fed2c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_22bcffeed424d00fc27c7daf8c1a9cd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0be0e863d158a90d5b749d74eb1011a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_65b680c9248548445e868d2e39436e7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3c0be5ad7682dabb4959c7341a8d58d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0795bee0d929926ca0f329341f15aa18(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ebfd8e10c449afa5b2517fcd0fd85df5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b296ab338d17262ce2b24c08caa8b946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7a4840af8a22bf0b0283c430ed265cee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_133923ba7fb46f96c0e000dad2e5619a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3da612aea61b02839bae96a473d1075c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2d27ee300639844d922dcfae6cd06bd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_10732908874b5b98b04cb0974cd706e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a22d985500431a0aef3bebfef01d26f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4515ba9f58fdcc3b149c31fd7a10c888(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e3692800e4841aee0476d81fc06a8aee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_91322ac5dc5f0671f92d0d960a4e077a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0cb5e1c5e89ef245040b4d59c9de1480(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b30dd4c67cde875d5e07238a4808c22
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 109, 109], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8f55a1c9ed97ee4c3ee2b6c22075d8be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_790e5dcad4762f3e44964e64f6a99378
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 256, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6572a4702178d4bf4d09d3fb735ac615(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1f103235fb30e77085091349d6c594d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 512, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4ae0b6abb749fe474a01bde54d301309(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b83d789827294342d0e039a0869dbf2a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9925f926b1864fa10bc546f66232ac1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_86687d44ac2b9151018464d760cd33fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b99fc409f9a6d753f5f34608ac8baca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_06aee6185c3b5058cfea79b2af8013dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7345f596776b18924c675cc6acfa0f38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2d01598f14ed25595958cf876faf85a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_fec1f6ce74847e69a938da2b5417ca06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 400, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ffe3616a30d83e9d234cccb89bb9438b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fec1f6ce74847e69a938da2b5417ca06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8cacfffa2cd531503200e18f63049e94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_95fac856a5fa6d759c0eb1d5d2a860ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [2, 2], [0, 0], False, True, 'NCHW', 'max', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9dbfc5acda8761db6f95d2267968ea0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95fac856a5fa6d759c0eb1d5d2a860ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4ab728ed7c2a9dcf487794cd47992a33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4624e2527e756013511662256b667f30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_51787aeb25c6f9eb34c06d937e0a3230(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_50e32f8eaab60b4d0d087e4e9c137670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_380905a63f1acd169b1c5a6fa0270eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8cea6939704c3fea47c3307c0b0d07c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_49cff2c9f958d47d833a17d134e62f36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25cdfca4e50b2c28704b0e6c91751dcd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_418e783782e1c41a41353da90b6802a4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [9, 9]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [4, 4], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dceec7a9d56cca65623017c40128cee8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_418e783782e1c41a41353da90b6802a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_05c53a6680b4cce2c41e0611a6d5a3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0f45aa697c04682be04ea48c66c5addd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14b95a974229cfcb29103e5274e5348
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7fc15fe1e1f399e6d7eb7b009d309ecc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e0ddc0b6ccf3b1bb2b2de4161a6bbef1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d53f73cd54bf1882b99e622d0b4d1fd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6f99d7a7c46269c7da33edafc80a1aef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cac427a543c8e9ac2b33537f767e97a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 320, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_d30fd261e80392e624793dfe1693de79(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 336, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d304ea415294f5804cce54863744bcb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d30fd261e80392e624793dfe1693de79
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6337e777c0fe5b946802eba1c56bd32f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e145f000c7ef880f5664e18e3b87dfb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3f8d3e8f5058d01aa92738011327fde4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_39760aba6cf05b924639413a3053eccc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6f86835be53447c4cab1b393e4961b08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39760aba6cf05b924639413a3053eccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_93f4866f93f76325c814a30036cf3130(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b971414f4fe6c21c8a55f72b4aa1fc67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a29d30c618b8d80eb5100912bf8493fa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ab66f3d6843c7991fedff7b1ca3e60d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d3f272a99f4264c05fef5ca1341e0590(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2115e8367fecdc65144c83d33a96a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1024, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5f7222480938d626d5b8e92211f9cda6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fec1f6ce74847e69a938da2b5417ca06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_819ecb95b8fd5ffd1c6f50d17ea1a3a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_df969b7dcc3360781504aef8654a117c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_819ecb95b8fd5ffd1c6f50d17ea1a3a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8cacfffa2cd531503200e18f63049e94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3bedb1709abab6c78faab51c1fb374f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_418e783782e1c41a41353da90b6802a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 152, 272], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_b7ab328bb9be65c9e08a7c09549bca0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_964ab6d5702f71afd722fe0e473dc85e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7ab328bb9be65c9e08a7c09549bca0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8284e101d75d4fbe67802ed4e21d2c3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7c76aad88dfc403a7a8b7f65ad90c41b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9356bd72b8ab1eaa7398181879284726(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_059f0e258396320ad77b5c0ed7549e73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_41304db1c201d9ca1625a4c422e29811(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_943b6c7a690b45cc38586f4a8fe16a59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cc37d30a783423dd01c5e9e4c54bb5d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_11be3504b5f7d4741847d2320391dab4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7a630ffd1e8034dd9bb26c5254ecb05c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2da315d082955722b6f779fe992d3f6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6b8cdb7c5647e9bd0a5c82f67390610a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_905792279d6b28e11d27fede7f2e5c83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6f3f8fc8e2613ac8db9b22467afaa6ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6f9cb20a9e8ecaa13768003bd171dd3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2d27ee300639844d922dcfae6cd06bd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a9e49d1ee864c4444d5cf4b4834843e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f14b95a974229cfcb29103e5274e5348
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_95686d870a3abc744725dff901900ac4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_73b4600e34da61958ee68a52adbf3a2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2df2cdb73d435d2d7304e150c63a4dbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4c40ccc84523eb06f4166bfbd2a0e4bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78f126f70f76858bb9a3fa4d2a3d86c1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1, 49], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f00aea3d9cab1aef765860735cd12f85(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 200, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d63c2ab3f63ebea78d9861230c5e9e5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f00aea3d9cab1aef765860735cd12f85
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c06613a189c550c2c412d27fc29bea24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e74de5a472a74a5f42c1c345d96e41c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cbb7f457bb3bafd955d8662842396bbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5da572748811f0977ed940ca89da0bf1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39760aba6cf05b924639413a3053eccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b22324841475144223ad066abf497aa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39760aba6cf05b924639413a3053eccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_08df5ee906c4c2e96cdc44b87c847ff8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a83622919e4705c4cb4b166c05462a3c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [7, 7]
-        return paddle._C_ops.pool2d(input_0, input_1, [7, 7], [0, 0], False, True, 'NCHW', 'avg', False, False, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15c299532a5bae32cb714df5c1ea43ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a83622919e4705c4cb4b166c05462a3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 704, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cffb3266cc6ea8aadc1a06ada1dac54b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2412e06e7e2b4b37c22ee9f472f0a8d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a69954c11c20092d7b5094aaa600be5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_176736d4a0e4b778a46130ac5ba6b987(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dbac22eb6c70870bfbac1854e64b58a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_176736d4a0e4b778a46130ac5ba6b987
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_90ea9af26b28e7c7fabe6de0cf0391f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ea84b63b8c912fcf037eb53cd35a3c16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3556788cf8008edff64d8b567041b04d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_28031ecce14c9491ab9c06219c27ce7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_28031ecce14c9491ab9c06219c27ce7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c3f8c64b7b6a6c68fc95d57f2e9379dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c3f8c64b7b6a6c68fc95d57f2e9379dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_64934700e0e8b3e458bd3f65566412c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_64934700e0e8b3e458bd3f65566412c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b6a22929b007761253bb7da420ea19c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b6a22929b007761253bb7da420ea19c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2728a7dfcb3a63162fe713a3575aebb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([28, 28], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_217e008cd44625692bcf7a98b3836e51(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_251ef0df88ba19eadc230252dc34e34f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_04b99c0dc386dfca509ad86ddc41b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_168b97cbd66adb438bd2dcc87ac6eca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_30bc91e693fa652a2da0b14c453d73e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_863cfdc937ab6442a7b4e7035b814aa7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_dfa38cfbc90453ec420e8b6517000d48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_812cdb236d6dfaa7145d1ec205480901(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e5d03aa8675578d891fea3ec895e9f1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d0dbac99a152786331e9b56ba11a7688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4915a9c9442bb98f8ce22e8c51b31a29
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16, 16], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_124f90c2adfea74f500baf9fc7d4a635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d9c7aec903b3c34dcbb006818c3c244
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8, 8], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3232c5a15cacbc710209229920b558ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5aa604531f92c133c21ac9d612094009
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([4, 4], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_26eda6dfd4e32a5a480680cfb4eeb817(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25cdfca4e50b2c28704b0e6c91751dcd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_1e00d9ce7be9a7656b1995821092dcba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 128, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4ab75ce8012eff1355073b44f9afaff1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1e00d9ce7be9a7656b1995821092dcba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_08d36f8df75c2b95030246ca3e8a10e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 64, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6f5a29742de9f8cd8bdd834d51943e3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08d36f8df75c2b95030246ca3e8a10e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_68fe900e3049440a332c30f0d4cef50a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 80, 32, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bb39d6a98704125c1be2ea2a7c7bb413(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68fe900e3049440a332c30f0d4cef50a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_972ee31cefcf7c821d4ab784c5194df1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 1]
-        return paddle._C_ops.pool2d(input_0, input_1, [1, 1], [0, 0], False, True, 'NCHW', 'avg', False, True, 'EXPLICIT')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, 16, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_af5b214591d3434aa6196390faf4efcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_972ee31cefcf7c821d4ab784c5194df1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bee0b96033c1c4b0626f5b5827085115(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f00aea3d9cab1aef765860735cd12f85
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6b2b1c9062d75fc9732cb1b95f930417(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_406072de1b268a47e0e041f46b99cc34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0d1e760944f2c9b6d20ebbee82b08abb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_81cbc572fae54fa35cf071a103e091f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fe0cea8c7bc33a7a5a75830841ef28b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_972886dbdda19c709604863a2089c608(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_89a651875183db2dc02799d82450dfc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e949bb4260ef506c870e0277a90dfb02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98e8f7eb53df4a2c806819c643796318
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8cacfffa2cd531503200e18f63049e94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0a4a2a728575a7cbfba0ea90d308c022(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_090d915ce41c9fab7e6a4b59012ef2bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0c162c27220f3beebe7feaccefe37fcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f83ea0863becad741a6050e19cb9217b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_37cbf795eb7d67daf65c178f6c7ee04d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_86dbc7aae9088addec97d1634a7c6488(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_37cd8106f9f3a11fb9e4672533db0194(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4cd8dfb5efaf36837239b46f1910aa9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8c9edff7298abab24842c0eb23112568(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fc3bbd96ff7ab9845fe9e04072d67796(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e1f6636026c1a08a9e3f5de20fc1fa5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_57727325dda7320cc2a37beae7dcb014(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_16e917bbfc1ffc82e9339e8acffe6941(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6503bc5a5ec070eba585db3dcf35743d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f153fdf3436100777330276b53fdbe70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_48bdd52c3aa34280ab05cc3fcab81ea1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9857d4b73bb0253a360d70c3b990aef4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98e8f7eb53df4a2c806819c643796318
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_91c524ca9fed5f386e234a4c43ef2523(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_406072de1b268a47e0e041f46b99cc34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_14614e97a3192cf68b8f8f983f64d092(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_81cbc572fae54fa35cf071a103e091f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3f8d3e8f5058d01aa92738011327fde4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_39bb3271c9daf96c9ad380222f073be8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_65b680c9248548445e868d2e39436e7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d3fc64aeba4f6dad091bfbe6b61655a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aab05d437720fd12f17fd220be092515
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_06220f8c8202d81efb5cee5984e1686a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8ac9090fe364b9af650a18ac16cad92f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d30fd261e80392e624793dfe1693de79
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9d8acfdfcd6ac8e6e60bdd9f1ff1e228(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7ab328bb9be65c9e08a7c09549bca0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_01b1e0c2e2a12d3a07783d45c3854fc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_819ecb95b8fd5ffd1c6f50d17ea1a3a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f8c0fdae4e92eb1b92b4ca1d8e30b7bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ce09906282ee23bbb0d5686a048ecefd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_dcbc27f34eb692353f6ba830718f33ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8b4335f5b05201355e59ddf84d136051(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_021b633310bf19f32ad67d638a4e049b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a0df60114281ae943fc36a388860ea78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0e3752d224453039a182306c2f5023c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e8961fbc7ac62daa3cbe7ef9a8ae2699(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9b609b30d8702d17a374c7dd2c19a298(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_24da285aaeb015b243f04882fdb5f2a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1603f3b8d5941bb953d1326a23c11ba7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4289f7bbf1e727e16327ecd2add742b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5e2f7c6c6e19bff2cbb9132cadfd90dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1455e10dfaf533d801e6b7456c2f27a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_371837ddbc85f0c71062a1423aa3cbe8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_98fcc972520cb08f5afe6af98f5ab799(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_685fbd0551d54cc887323e3e7990a4e5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7c3a414aaad1f6ac5baeba7713068cc0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_561cf2e963f130f0831a79167a7f4ec5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_29d62fe40ac1b6172c8e617a71347e75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1d1acada71a1d746548d8d0c717db45e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b30dd4c67cde875d5e07238a4808c22
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 96, 109, 109], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fa8ef4360a2671dab74468f2b5f65f9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_790e5dcad4762f3e44964e64f6a99378
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_72e09b352e80d31c4738e5f7b63bfba4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1f103235fb30e77085091349d6c594d
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_93ec4dad2b7ae771b92d3bc4b970f0f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b83d789827294342d0e039a0869dbf2a
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_962130157d3cbe435902f8a7d241ef59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b264a111a141f22fe773acc9418da37d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_487dd2feb9de805d42da880624f5b369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6cd0d04d3c191272e403c41e70902c0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f00aea3d9cab1aef765860735cd12f85
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b470a906aeeebd9b7d0a0cf9ca7f0f04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fec1f6ce74847e69a938da2b5417ca06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6337e777c0fe5b946802eba1c56bd32f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e145f000c7ef880f5664e18e3b87dfb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9b925096b285b49663c1d51a6054fb13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e622e26294406582bf4313bdc3324171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a69954c11c20092d7b5094aaa600be5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_65e772df08dca4ea274fb745c7c6fd5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2a09116f47a62af8118732044aa9c3ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39760aba6cf05b924639413a3053eccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1f1b3e1b483426d8a6150f0981d22a55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e145f000c7ef880f5664e18e3b87dfb0
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_20c486de4ec5eb07c40ddb6beb8ddabb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5f4815b80d4b02b22fc95c5126eb96fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cc64d8e082c639de3c3a05141c03c2d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_663f8f39d94faf5ec700fbc6cd57142d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_f27ecb2cfe1e1a9bd482038c22581700(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aab05d437720fd12f17fd220be092515
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4624e2527e756013511662256b667f30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4058f2734db8a15b05a31e1ffdf21e73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_89df97b4455ab829301d927c82963040
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3d47d405f1123ab6b0f68abcf4b0f4e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7016502b84566fd8d8c1fb3f9bedfb35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_251ef0df88ba19eadc230252dc34e34f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b343b29ec0bcdb59989f9f249606feb
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ea5c92bc23b4fbe4d87d4b7060bc1e05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_cfcc52815f713ad79daf541403e57b76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9e31752517e1439a7cdce84e8cea6600(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_803a94d442a01d70b7d0d09d3dd43a2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_635cdbb6ebd57d162837e9eed9f217fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7be27b08c77e485632b0bc9dc77d737f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6153db877f9cab451534bacf7217b792(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4a0b92182b1bbe6b691032e7de11d26e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6b9141679cf76e366d37e7bfe724ae8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d76d6497e1c55ac605a512a7e678d4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2e93dab1e5220f56c6b7a8944d43d841(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6adaaa988b74bb0f88a3c94e54db2b57
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_01ae2ae9c9e4316fb65a0f0a5d730cc8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_176736d4a0e4b778a46130ac5ba6b987
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ef51487305bb4be0f67824b9ae5fe452(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7dd6c7e81cf2d2d1e7e60316e8e2ad2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d38837e4d2a251899d4efe66ef249073(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02c23608587dd3e9d9434c3d30f5b354
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_73396e27c49193feeab39a36688f9614(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a83622919e4705c4cb4b166c05462a3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 704, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([7, 7], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ecf1d7cfd5be2c8c602deecb7dbad4ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4b8561911354dbfa038a86fcbbb61861(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_27281edb2edea4c59ece0544c008b79b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_77a8982e4477636f490b0883a1c8dfde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2d12e40c994ad5eaca8bd2988a71d153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 5], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2d549dc07503a9e475ab9af3aacde5f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f5739470eacddaf63045687ef819728
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9, 9], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5e7e7d3c954934ba6bf3ae2bbb9f30f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0de5ae9f09217925f0d8cd44bd534669
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([13, 13], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_77efa9505b74e0659c26caed93701f7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755ff01e8efbe9e58dd299788351fb09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5da34d05ad4b77543c44a4f760da42e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6f3f8fc8e2613ac8db9b22467afaa6ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d173a2fb3bab05938c236f8e3bb57751(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31f454e4d406fcde3a03cab7c0b98237
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1], dtype='int64').reshape([2]),
-        ]
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+import cinn_case_runtime
 
+cinn_case_runtime.load_cases(globals(), __file__)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()